@@ -0,0 +1,211 @@
+"""Backfill as-of-week SPI snapshots for past seasons.
+
+Each season is pulled once (games in bulk, team stats one call per week) and
+scanned forward week by week: team records and stat totals are running
+prefix sums, so every ``spi_rankings_{year}_w{N}.csv`` and
+``spi_rankings_{year}_post_w{N}.csv`` snapshot the backtest reads comes out of
+a single pass instead of one ``rankings.py`` run per week. Seasons are spread
+over a process pool.
+
+Snapshot conventions match ``rankings.py --start_week 1 --end_week N``:
+
+- ``w{N}``: regular-season games and stats through week N, with last
+  season's conference tallies through the same week.
+- ``post_w{N}``: the full regular season plus postseason weeks through N.
+  Stats stay regular-season only so bowl results don't leak into them.
+- Finished seasons also get ``spi_rankings_final_{year}.csv`` and
+  ``spi_rankings_preseason_{year + 1}.csv`` from the full regular season.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+import pandas as pd
+
+import rankings
+import spi_engine
+from cfbd_fetch import DEFAULT_MAX_WORKERS, DEFAULT_REQUESTS_PER_SECOND, ApiThrottle, fetch_all
+from cfbd_store import ResponseStore, season_is_finished
+from season_games import aggregate_team_records, fold_games_by_week, game_has_score
+from season_stats import TeamStatMatrix, cumulative_stat_matrices
+
+SNAPSHOT_COLUMNS = ["rank", "team", "conference", "wins", "losses", "SPI", "N_adj", "SOR_adj"]
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Backfill weekly as-of SPI ranking snapshots.")
+    parser.add_argument("--start-year", type=int, required=True)
+    parser.add_argument("--end-year", type=int, required=True)
+    parser.add_argument("--data-exports-dir", default="data_exports")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Seasons processed in parallel (one process each).",
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        help="CFBD request budget shared by all workers.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Concurrent CFBD requests within a season.",
+    )
+    return parser.parse_args()
+
+
+def init_worker(data_exports_dir: str, requests_per_second: float) -> None:
+    """Point this process's ranking pipeline at the shared response store and its share of the rate limit."""
+    rankings.response_store = ResponseStore(os.path.join(data_exports_dir, "cache", "cfbd"))
+    rankings.api_throttle = ApiThrottle(requests_per_second=requests_per_second)
+
+
+def scored_weeks(index, season_type: str) -> List[int]:
+    """Weeks 1..N, where N is the last week with a scored game."""
+    weeks = [
+        week
+        for week in index.weeks(season_type)
+        if any(game_has_score(g) for g in index.games(week, week, season_type))
+    ]
+    return list(range(1, max(weeks) + 1)) if weeks else []
+
+
+def weekly_stat_matrices(year: int, weeks: List[int], max_workers: int) -> List[TeamStatMatrix]:
+    """Cumulative team stats through each of ``weeks``, from one stats call per week."""
+    pulls = fetch_all(
+        rankings.stored_team_stats,
+        [{"year": year, "start_week": week, "end_week": week} for week in weeks],
+        max_workers=max_workers,
+    )
+    return cumulative_stat_matrices([TeamStatMatrix.from_records(records) for records in pulls])
+
+
+def team_conferences(teams) -> Dict[str, str]:
+    return {team.school: team.conference.lower() for team in teams}
+
+
+def snapshot_rankings(year, teams, records, stat_matrix, last_year_tallies, conf_champions) -> pd.DataFrame:
+    """SPI rankings for one as-of cutoff, as ``rankings.py`` would rank the same week range."""
+    this_year_tallies = rankings.conference_tallies_from_records(year, teams, records)
+    sorted_confs = rankings.combine_conference_tallies(last_year_tallies, this_year_tallies)
+    conference_index = {
+        conf.name: 1.0 - (float(i) / float(len(sorted_confs)))
+        for i, conf in enumerate(sorted_confs)
+    }
+
+    champions = set(conf_champions.values()) if conf_champions else set()
+    team_rows = []
+    for team in teams:
+        record = records[team.school]
+        TD, TM = rankings.touchdowns_and_turnover_margin(stat_matrix.team_stats(team.school))
+        team_rows.append(rankings.team_table_row(record, team.school in champions, TD, TM))
+
+    team_table = pd.DataFrame(team_rows, columns=spi_engine.TEAM_TABLE_COLUMNS)
+    game_table = spi_engine.build_game_table({team.school: records[team.school] for team in teams})
+    ranked = spi_engine.compute_spi_rankings(team_table, game_table, conference_index)
+    return ranked[SNAPSHOT_COLUMNS]
+
+
+def backfill_season(year: int, data_exports_dir: str, max_workers: int, weekly: bool = True) -> List[str]:
+    """Write every as-of snapshot for one season and return the files written.
+
+    With ``weekly`` off only the final/preseason aliases are written, which is
+    how the season before ``--start-year`` seeds its successor's preseason file.
+    """
+    year = int(year)
+    written = []
+
+    def save(ranked: pd.DataFrame, name: str) -> None:
+        path = os.path.join(data_exports_dir, name)
+        ranked.to_csv(path, index=False)
+        written.append(path)
+
+    teams = [t for t in rankings.fbs_teams(year) if hasattr(t, "school") and hasattr(t, "conference")]
+    prior_teams = [
+        t for t in rankings.fbs_teams(year - 1) if hasattr(t, "school") and hasattr(t, "conference")
+    ]
+    conf_champions = rankings.get_conference_champions(year - 1)
+    index = rankings.season_game_index(year)
+    prior_index = rankings.season_game_index(year - 1)
+
+    regular_weeks = scored_weeks(index, "regular")
+    post_weeks = scored_weeks(index, "postseason")
+    if not regular_weeks:
+        print(f"No scored {year} games yet; nothing to backfill.")
+        return written
+    stat_matrices = weekly_stat_matrices(year, regular_weeks, max_workers)
+
+    # Last season's tallies through each cutoff week, then through its full regular season.
+    prior_records = aggregate_team_records([], team_conferences(prior_teams))
+    prior_tallies = {}
+    prior_weeks = sorted(set(regular_weeks) | set(prior_index.weeks("regular")))
+    for week, _ in fold_games_by_week(prior_records, prior_index.games(), prior_weeks):
+        prior_tallies[week] = rankings.conference_tallies_from_records(
+            year - 1, prior_teams, prior_records
+        )
+    prior_full = prior_tallies[prior_weeks[-1]] if prior_weeks else [{}, 0]
+
+    records = aggregate_team_records([], team_conferences(teams))
+    full_regular = None
+    for week, _ in fold_games_by_week(records, index.games(), regular_weeks):
+        if not weekly and week != regular_weeks[-1]:
+            continue
+        ranked = snapshot_rankings(
+            year, teams, records, stat_matrices[week - 1], prior_tallies[week], conf_champions
+        )
+        if weekly:
+            save(ranked, f"spi_rankings_{year}_w{week}.csv")
+        full_regular = ranked
+    print(f"{year}: regular season through week {regular_weeks[-1]}")
+
+    if season_is_finished(year):
+        save(full_regular, f"spi_rankings_final_{year}.csv")
+        save(full_regular, f"spi_rankings_preseason_{year + 1}.csv")
+
+    if weekly:
+        regular_stats = stat_matrices[-1]
+        postseason = index.games(season_type="postseason")
+        for week, _ in fold_games_by_week(records, postseason, post_weeks):
+            ranked = snapshot_rankings(year, teams, records, regular_stats, prior_full, conf_champions)
+            save(ranked, f"spi_rankings_{year}_post_w{week}.csv")
+        if post_weeks:
+            print(f"{year}: postseason through week {post_weeks[-1]}")
+
+    return written
+
+
+def main() -> None:
+    args = parse_arguments()
+    os.makedirs(args.data_exports_dir, exist_ok=True)
+    years = list(range(args.start_year, args.end_year + 1))
+    jobs = [(year, True) for year in years]
+    preseason_file = os.path.join(
+        args.data_exports_dir, f"spi_rankings_preseason_{args.start_year}.csv"
+    )
+    if not os.path.exists(preseason_file):
+        jobs.insert(0, (args.start_year - 1, False))
+
+    workers = max(1, min(args.workers, len(jobs)))
+    requests_per_second = args.requests_per_second / workers
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(args.data_exports_dir, requests_per_second),
+    ) as pool:
+        futures = [
+            pool.submit(backfill_season, year, args.data_exports_dir, args.max_workers, weekly)
+            for year, weekly in jobs
+        ]
+        for (year, _), future in zip(jobs, futures):
+            written = future.result()
+            print(f"Wrote {len(written)} {year} snapshots to {args.data_exports_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Rate-limited, retrying and concurrent calls into the CFBD client.
+
+``ApiThrottle`` wraps any cfbd API method: every call first takes a token
+from a shared token bucket, and 429/5xx responses are retried with jittered
+exponential backoff. ``fetch_all`` fans a list of calls out over a bounded
+thread pool and returns results in input order.
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+DEFAULT_CFBD_HOST = "https://api.collegefootballdata.com"
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+DEFAULT_BURST = 5
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BASE_DELAY_SECONDS = 1.0
+DEFAULT_MAX_DELAY_SECONDS = 30.0
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def cfbd_host() -> str:
+    """CFBD base URL. ``CFBD_API_HOST`` points every script at another server, e.g. the local stand-in."""
+    return os.environ.get("CFBD_API_HOST", "").strip().rstrip("/") or DEFAULT_CFBD_HOST
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``capacity`` banked."""
+
+    def __init__(self, rate: float, capacity: int = DEFAULT_BURST):
+        self.rate = float(rate)
+        self.capacity = max(1, int(capacity))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def error_status(exc: Exception) -> Optional[int]:
+    status = getattr(exc, "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable_error(exc: Exception) -> bool:
+    status = error_status(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    text = str(exc).lower()
+    return "429" in text or "too many requests" in text
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    headers = getattr(exc, "headers", None) or {}
+    try:
+        value = headers.get("Retry-After")
+    except AttributeError:
+        return None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class ApiThrottle:
+    """Shared rate limit and retry policy for CFBD calls."""
+
+    def __init__(
+        self,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay_seconds: float = DEFAULT_BASE_DELAY_SECONDS,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+    ):
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+
+    def backoff_seconds(self, attempt: int, exc: Exception) -> float:
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(self.max_delay_seconds, retry_after)
+        # Full jitter keeps concurrent workers from retrying in lockstep.
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** attempt))
+        return random.uniform(0.0, ceiling)
+
+    def call(self, api_function: Callable, **kwargs):
+        for attempt in range(self.max_attempts):
+            self.bucket.acquire()
+            try:
+                return api_function(**kwargs)
+            except Exception as exc:
+                if attempt + 1 >= self.max_attempts or not is_retryable_error(exc):
+                    raise
+                delay = self.backoff_seconds(attempt, exc)
+                print(f"CFBD returned {error_status(exc) or 'an error'}; retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def wrap(self, api_function: Callable) -> Callable:
+        def throttled(**kwargs):
+            return self.call(api_function, **kwargs)
+
+        return throttled
+
+
+def fetch_all(
+    fetch: Callable,
+    params_list: Iterable[Dict],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    return_exceptions: bool = False,
+) -> List:
+    """Call ``fetch(**params)`` for every entry on a bounded thread pool.
+
+    Results come back in ``params_list`` order. With ``return_exceptions`` a
+    failed call leaves its exception in the result list instead of raising.
+    """
+    params_list = list(params_list)
+
+    def run(params):
+        try:
+            return fetch(**params)
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+            return exc
+
+    if max_workers <= 1 or len(params_list) <= 1:
+        return [run(params) for params in params_list]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run, params_list))
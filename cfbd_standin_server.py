@@ -0,0 +1,203 @@
+"""Local stand-in for the CFBD endpoints this repo uses.
+
+Serves ``/games``, ``/teams/fbs``, ``/stats/season`` and ``/conferences``
+from a fixture archive recorded with ``rankings.py --record DIR`` (or the
+shared response store under ``data_exports/cache/cfbd``), with optional
+latency, 5xx and 429 injection. Point any script at it with
+``CFBD_API_HOST=http://127.0.0.1:<port>``.
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+from flask import Flask, jsonify, request
+
+from cfbd_store import STORE_DIR, ResponseStore
+
+ENDPOINTS = ("games", "teams/fbs", "stats/season", "conferences")
+INT_PARAMS = {"year", "week", "start_week", "end_week", "id"}
+# Filters applied to a broader recorded response when the exact request was not recorded.
+GAME_FILTERS = ("week", "team")
+
+
+class FaultInjector:
+    """Shared, seeded latency and error injection for every request."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after_seconds: int = 1,
+        seed: Optional[int] = None,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after_seconds = retry_after_seconds
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self):
+        with self._lock:
+            delay_ms = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            roll = self._random.random()
+        return max(0.0, delay_ms) / 1000.0, roll
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+
+
+def request_params(args) -> Dict:
+    """Turn CFBD query parameters back into the keyword arguments the store is keyed by."""
+    params = {}
+    for key, value in args.items():
+        name = _snake_case(key)
+        if name in INT_PARAMS:
+            try:
+                value = int(value)
+            except ValueError:
+                pass
+        params[name] = value
+    return params
+
+
+def _matches_game(record: Dict, name: str, value) -> bool:
+    if name == "week":
+        return record.get("week") == value
+    return value in (record.get("homeTeam"), record.get("awayTeam"))
+
+
+def lookup_records(store: ResponseStore, endpoint: str, params: Dict):
+    cached = store.read(endpoint, params)
+    if cached is not None:
+        return cached["records"]
+    if endpoint != "games":
+        return None
+
+    # Fall back to a recorded season-level pull and filter it down.
+    filters = {name: params[name] for name in GAME_FILTERS if name in params}
+    if not filters:
+        return None
+    broader = {k: v for k, v in params.items() if k not in filters}
+    broader.setdefault("season_type", "regular")
+    cached = store.read(endpoint, broader)
+    if cached is None:
+        return None
+    return [
+        record
+        for record in cached["records"]
+        if all(_matches_game(record, name, value) for name, value in filters.items())
+    ]
+
+
+def create_app(store: ResponseStore, faults: FaultInjector) -> Flask:
+    app = Flask(__name__)
+    counts: Counter = Counter()
+    counts_lock = threading.Lock()
+
+    def count(key: str) -> None:
+        with counts_lock:
+            counts[key] += 1
+
+    def serve(endpoint: str):
+        count("requests")
+        delay, roll = faults.draw()
+        if delay:
+            time.sleep(delay)
+
+        if roll < faults.throttle_rate:
+            count("throttled")
+            response = jsonify({"message": "Too Many Requests"})
+            response.status_code = 429
+            response.headers["Retry-After"] = str(faults.retry_after_seconds)
+            return response
+        if roll < faults.throttle_rate + faults.error_rate:
+            count("errors")
+            response = jsonify({"message": "Service Unavailable"})
+            response.status_code = 503
+            return response
+
+        params = request_params(request.args)
+        records = lookup_records(store, endpoint, params)
+        if records is None:
+            count("missing")
+            response = jsonify({"message": f"No recorded response for {endpoint} {params}"})
+            response.status_code = 404
+            return response
+        count("served")
+        return jsonify(records)
+
+    for endpoint in ENDPOINTS:
+        app.add_url_rule(
+            f"/{endpoint}",
+            endpoint=endpoint.replace("/", "_"),
+            view_func=lambda endpoint=endpoint: serve(endpoint),
+        )
+
+    @app.get("/__stats")
+    def stats():
+        with counts_lock:
+            return jsonify(dict(counts))
+
+    return app
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Serve recorded CFBD responses locally.")
+    parser.add_argument(
+        "--fixtures",
+        default=STORE_DIR,
+        help="Fixture archive or response store to serve (default: data_exports/cache/cfbd).",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5056)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added delay per request.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter on the delay.")
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with 503.",
+    )
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with 429 and a Retry-After header.",
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=int,
+        default=1,
+        help="Whole seconds sent in the Retry-After header of 429s.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for repeatable fault injection.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    faults = FaultInjector(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after_seconds=args.retry_after,
+        seed=args.seed,
+    )
+    app = create_app(ResponseStore(args.fixtures), faults)
+    print(f"Serving CFBD fixtures from {args.fixtures} on http://{args.host}:{args.port}")
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Shared on-disk store for CFBD API responses.
+
+Responses are saved as plain JSON records under ``data_exports/cache/cfbd``,
+one file per (endpoint, parameters) key. Each read passes a TTL: finished
+seasons never expire, the in-progress season refreshes every few minutes.
+When a refresh fails the last stored response is returned instead.
+"""
+
+import datetime as dt
+import enum
+import hashlib
+import json
+import os
+import re
+import tempfile
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+BASE_DIR = os.path.dirname(__file__)
+STORE_DIR = os.path.join(BASE_DIR, "data_exports", "cache", "cfbd")
+
+CURRENT_SEASON_TTL_SECONDS = 20 * 60
+REFERENCE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def to_plain_data(obj):
+    """Convert cfbd models (and anything nested in them) to JSON-ready values."""
+    if isinstance(obj, enum.Enum):
+        return to_plain_data(obj.value)
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    if isinstance(obj, (dt.datetime, dt.date)):
+        return obj.isoformat()
+    if isinstance(obj, (list, tuple)):
+        return [to_plain_data(item) for item in obj]
+    if isinstance(obj, dict):
+        return {k: to_plain_data(v) for k, v in obj.items()}
+    if hasattr(obj, "to_dict"):
+        return to_plain_data(obj.to_dict())
+    if hasattr(obj, "__dict__"):
+        return {
+            k: to_plain_data(v)
+            for k, v in obj.__dict__.items()
+            if not str(k).startswith("_")
+        }
+    return str(obj)
+
+
+def record_to_object(record: dict) -> SimpleNamespace:
+    """Expose a stored camelCase record with the snake_case attributes cfbd models use."""
+    normalized = {}
+    for key, value in record.items():
+        normalized[key] = value
+        snake_key = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", str(key)).lower()
+        normalized[snake_key] = value
+    return SimpleNamespace(**normalized)
+
+
+def season_is_finished(year: int, today: Optional[dt.date] = None) -> bool:
+    # Bowls and the title game run into January, so a season is final from February on.
+    today = today or dt.date.today()
+    return today >= dt.date(int(year) + 1, 2, 1)
+
+
+def season_ttl_seconds(year: int, current_ttl_seconds: int = CURRENT_SEASON_TTL_SECONDS) -> Optional[int]:
+    """TTL for season-scoped data: ``None`` (never expires) once the season is over."""
+    if season_is_finished(year):
+        return None
+    return current_ttl_seconds
+
+
+def _parse_timestamp(raw) -> Optional[dt.datetime]:
+    if not isinstance(raw, str) or not raw:
+        return None
+    try:
+        parsed = dt.datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+    return parsed
+
+
+class ResponseStore:
+    def __init__(self, root: str = STORE_DIR):
+        self.root = root
+
+    def path_for(self, endpoint: str, params: Dict) -> str:
+        key_text = json.dumps(
+            {"endpoint": endpoint, "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha1(key_text.encode("utf-8")).hexdigest()[:20]
+        folder = re.sub(r"[^a-z0-9]+", "_", endpoint.lower()).strip("_")
+        return os.path.join(self.root, folder, f"{digest}.json")
+
+    def read(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        path = self.path_for(endpoint, params)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or not isinstance(payload.get("records"), list):
+            return None
+        payload["fetched_at"] = _parse_timestamp(payload.get("fetched_at"))
+        return payload
+
+    def write(self, endpoint: str, params: Dict, records: List) -> None:
+        path = self.path_for(endpoint, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = {
+            "endpoint": endpoint,
+            "params": to_plain_data(params),
+            "fetched_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "records": records,
+        }
+        # Write then rename so readers never see a half-written file.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def is_fresh(payload: Dict, ttl_seconds: Optional[int]) -> bool:
+        if ttl_seconds is None:
+            return True
+        fetched_at = payload.get("fetched_at")
+        if fetched_at is None:
+            return False
+        age = (dt.datetime.now(dt.timezone.utc) - fetched_at).total_seconds()
+        return age <= ttl_seconds
+
+    def fetch(
+        self,
+        endpoint: str,
+        params: Dict,
+        fetch: Optional[Callable],
+        ttl_seconds: Optional[int],
+    ) -> Optional[List]:
+        """Return stored records for ``endpoint``/``params``, refreshing them when stale.
+
+        ``fetch`` is called with ``params`` as keyword arguments. Pass
+        ``fetch=None`` to read the store without touching the API; stale
+        records are returned in that case. If the refresh raises and a stored
+        response exists, the stored records are returned; otherwise the error
+        propagates. Returns ``None`` only when nothing is stored and no fetch
+        was requested.
+        """
+        cached = self.read(endpoint, params)
+        if cached is not None and self.is_fresh(cached, ttl_seconds):
+            return cached["records"]
+        if fetch is None:
+            return cached["records"] if cached is not None else None
+
+        try:
+            records = to_plain_data(list(fetch(**params)))
+        except Exception as exc:
+            if cached is None:
+                raise
+            print(f"Warning: CFBD refresh of {endpoint} {params} failed ({exc}); using stored response.")
+            return cached["records"]
+
+        try:
+            self.write(endpoint, params, records)
+        except OSError as exc:
+            print(f"Warning: could not store CFBD response for {endpoint}: {exc}")
+        return records
+
+
+class RecordingStore:
+    """Serve responses from ``store`` and copy every one into a fixture archive.
+
+    The archive uses the ``ResponseStore`` layout, so a ``ReplayStore`` on the
+    same directory replays the run without the API.
+    """
+
+    def __init__(self, store: ResponseStore, archive_root: str):
+        self.store = store
+        self.archive = ResponseStore(archive_root)
+
+    def fetch(
+        self,
+        endpoint: str,
+        params: Dict,
+        fetch: Optional[Callable],
+        ttl_seconds: Optional[int],
+    ) -> Optional[List]:
+        records = self.store.fetch(endpoint, params, fetch, ttl_seconds)
+        if records is not None:
+            self.archive.write(endpoint, params, records)
+        return records
+
+
+class ReplayStore(ResponseStore):
+    """Read-only fixture archive: never calls the API, and a missing response is an error."""
+
+    def fetch(
+        self,
+        endpoint: str,
+        params: Dict,
+        fetch: Optional[Callable],
+        ttl_seconds: Optional[int],
+    ) -> List:
+        cached = self.read(endpoint, params)
+        if cached is None:
+            raise RuntimeError(
+                f"No recorded CFBD response for {endpoint} {params} in {self.root}. "
+                "Record one with --record first."
+            )
+        return cached["records"]
+
+
+_DEFAULT_STORE: Optional[ResponseStore] = None
+
+
+def default_store() -> ResponseStore:
+    global _DEFAULT_STORE
+    if _DEFAULT_STORE is None:
+        _DEFAULT_STORE = ResponseStore()
+    return _DEFAULT_STORE
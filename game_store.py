@@ -0,0 +1,252 @@
+"""Columnar on-disk store of season games.
+
+Each season is two files under ``data_exports/cache/games``:
+
+- ``games_<year>.npy``: a NumPy structured array, one row per game, holding
+  only the fields the pipelines read. Rows are sorted by season type and
+  week, keeping API order within a week. Strings are stored as ids into the
+  sidecar vocabulary.
+- ``games_<year>.json``: that string vocabulary, the row range of every
+  (season type, week), and when the file was written.
+
+A season loads as one memory-mapped read. A week lookup is a slice of that
+mapping, so no JSON game records are parsed.
+"""
+
+import datetime as dt
+import json
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from cfbd_store import BASE_DIR, season_is_finished
+
+GAME_STORE_DIR = os.path.join(BASE_DIR, "data_exports", "cache", "games")
+GAME_STORE_VERSION = 1
+
+SEASON_TYPE_CODES = {"regular": 0, "postseason": 1}
+SEASON_TYPE_NAMES = {code: name for name, code in SEASON_TYPE_CODES.items()}
+
+# (snake_case field, camelCase CFBD key)
+STRING_FIELDS = [
+    ("start_date", "startDate"),
+    ("home_team", "homeTeam"),
+    ("away_team", "awayTeam"),
+    ("home_conference", "homeConference"),
+    ("away_conference", "awayConference"),
+    ("home_classification", "homeClassification"),
+    ("away_classification", "awayClassification"),
+    ("notes", "notes"),
+]
+INT_FIELDS = [
+    ("id", "id"),
+    ("home_points", "homePoints"),
+    ("away_points", "awayPoints"),
+]
+FLAG_FIELDS = [
+    ("neutral_site", "neutralSite"),
+    ("conference_game", "conferenceGame"),
+    ("completed", "completed"),
+]
+
+MISSING_INT = np.iinfo(np.int64).min
+MISSING_STRING = -1
+MISSING_FLAG = -1
+
+GAME_DTYPE = np.dtype(
+    [("season_type", "i1"), ("week", "i2")]
+    + [(name, "i8") for name, _ in INT_FIELDS]
+    + [(name, "i4") for name, _ in STRING_FIELDS]
+    + [(name, "i1") for name, _ in FLAG_FIELDS]
+)
+
+
+def _game_value(game, snake_key: str, camel_key: str):
+    if isinstance(game, dict):
+        return game.get(snake_key) if snake_key in game else game.get(camel_key)
+    value = getattr(game, snake_key, None)
+    return value if value is not None else getattr(game, camel_key, None)
+
+
+def _int_or_missing(value) -> int:
+    try:
+        return int(value) if value is not None else MISSING_INT
+    except (TypeError, ValueError):
+        return MISSING_INT
+
+
+def _flag_or_missing(value) -> int:
+    if value is None:
+        return MISSING_FLAG
+    return 1 if bool(value) else 0
+
+
+class SeasonGameTable:
+    """One season's games: a (memory-mapped) structured array plus its string vocabulary."""
+
+    def __init__(
+        self,
+        year: int,
+        rows: np.ndarray,
+        strings: List[str],
+        ranges: Dict[Tuple[str, int], Tuple[int, int]],
+        written_at: Optional[dt.datetime] = None,
+        complete: bool = False,
+    ):
+        self.year = int(year)
+        self.rows = rows
+        self.strings = strings
+        self.ranges = ranges
+        self.written_at = written_at
+        self.complete = complete
+
+    def season_types(self) -> List[str]:
+        return sorted({season_type for season_type, _ in self.ranges}, key=SEASON_TYPE_CODES.get)
+
+    def weeks(self, season_type: str = "regular") -> List[int]:
+        return sorted(week for st, week in self.ranges if st == season_type)
+
+    def has_week(self, week: int, season_type: str = "regular") -> bool:
+        return (season_type, int(week)) in self.ranges
+
+    def select(self, week: Optional[int] = None, season_type: Optional[str] = None) -> np.ndarray:
+        """Rows for a week and/or season type, sliced straight out of the mapping."""
+        if week is not None and season_type is not None:
+            start, stop = self.ranges.get((season_type, int(week)), (0, 0))
+            return self.rows[start:stop]
+        mask = np.ones(len(self.rows), dtype=bool)
+        if season_type is not None:
+            mask &= self.rows["season_type"] == SEASON_TYPE_CODES[season_type]
+        if week is not None:
+            mask &= self.rows["week"] == int(week)
+        return self.rows[mask]
+
+    def records(self, week: Optional[int] = None, season_type: Optional[str] = None) -> List[dict]:
+        """Selected rows as snake_case game dicts, with ``None`` for missing values."""
+        rows = self.select(week, season_type)
+        columns: Dict[str, list] = {
+            "season_type": [SEASON_TYPE_NAMES[code] for code in rows["season_type"].tolist()],
+            "week": rows["week"].tolist(),
+        }
+        for name, _ in INT_FIELDS:
+            columns[name] = [None if v == MISSING_INT else v for v in rows[name].tolist()]
+        for name, _ in STRING_FIELDS:
+            columns[name] = [
+                None if v == MISSING_STRING else self.strings[v] for v in rows[name].tolist()
+            ]
+        for name, _ in FLAG_FIELDS:
+            columns[name] = [None if v == MISSING_FLAG else bool(v) for v in rows[name].tolist()]
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+def build_season_table(year: int, games_by_season_type: Dict[str, Iterable]) -> SeasonGameTable:
+    """Encode CFBD game records (dicts or models, either key style) into a season table."""
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def string_id(value) -> int:
+        if value is None:
+            return MISSING_STRING
+        value = str(value)
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    entries = []
+    for season_type, games in games_by_season_type.items():
+        code = SEASON_TYPE_CODES[season_type]
+        for order, game in enumerate(games):
+            week = _int_or_missing(_game_value(game, "week", "week"))
+            if week == MISSING_INT:
+                continue
+            row = (code, week)
+            row += tuple(_int_or_missing(_game_value(game, s, c)) for s, c in INT_FIELDS)
+            row += tuple(string_id(_game_value(game, s, c)) for s, c in STRING_FIELDS)
+            row += tuple(_flag_or_missing(_game_value(game, s, c)) for s, c in FLAG_FIELDS)
+            entries.append(((code, week, order), row))
+
+    entries.sort(key=lambda entry: entry[0])
+    rows = np.array([row for _, row in entries], dtype=GAME_DTYPE)
+
+    ranges: Dict[Tuple[str, int], Tuple[int, int]] = {}
+    for i, ((code, week, _), _) in enumerate(entries):
+        key = (SEASON_TYPE_NAMES[code], week)
+        start, _ = ranges.get(key, (i, i))
+        ranges[key] = (start, i + 1)
+    return SeasonGameTable(year, rows, strings, ranges)
+
+
+class GameStore:
+    """Season game tables on disk, written atomically and read memory-mapped."""
+
+    def __init__(self, root: str = GAME_STORE_DIR):
+        self.root = root
+
+    def paths(self, year: int) -> Tuple[str, str]:
+        base = os.path.join(self.root, f"games_{int(year)}")
+        return f"{base}.npy", f"{base}.json"
+
+    def write(self, table: SeasonGameTable) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        rows_path, meta_path = self.paths(table.year)
+        meta = {
+            "version": GAME_STORE_VERSION,
+            "year": table.year,
+            "written_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "complete": season_is_finished(table.year),
+            "strings": table.strings,
+            "ranges": [[st, week, start, stop] for (st, week), (start, stop) in table.ranges.items()],
+        }
+        # Rows first, then the sidecar: a reader only trusts rows its sidecar describes.
+        for path, dump in (
+            (rows_path, lambda f: np.save(f, table.rows)),
+            (meta_path, lambda f: f.write(json.dumps(meta).encode("utf-8"))),
+        ):
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    dump(f)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    def load(self, year: int) -> Optional[SeasonGameTable]:
+        rows_path, meta_path = self.paths(year)
+        if not (os.path.exists(rows_path) and os.path.exists(meta_path)):
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("version") != GAME_STORE_VERSION:
+                return None
+            rows = np.load(rows_path, mmap_mode="r")
+            ranges = {(st, int(week)): (int(start), int(stop)) for st, week, start, stop in meta["ranges"]}
+            if rows.dtype != GAME_DTYPE or any(stop > len(rows) for _, stop in ranges.values()):
+                return None
+            written_at = dt.datetime.fromisoformat(meta["written_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return SeasonGameTable(
+            year,
+            rows,
+            list(meta["strings"]),
+            ranges,
+            written_at=written_at,
+            complete=bool(meta.get("complete")),
+        )
+
+    @staticmethod
+    def is_fresh(table: SeasonGameTable, ttl_seconds: Optional[int]) -> bool:
+        """A table written after its season ended never expires; others age out after ``ttl_seconds``."""
+        if table.complete:
+            return True
+        if table.written_at is None or ttl_seconds is None:
+            return False
+        age = (dt.datetime.now(dt.timezone.utc) - table.written_at).total_seconds()
+        return age <= ttl_seconds
@@ -1,14 +1,16 @@
 import argparse
 import datetime as dt
 import glob
-import json
 import math
 import os
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from cfbd_fetch import cfbd_host
+from cfbd_store import default_store
 from model_config import HOME_FIELD_X_DEFAULT
+from team_identity import default_team_index
 
 try:
     import cfbd
@@ -17,7 +19,6 @@ except Exception:
 
 BASE_DIR = os.path.dirname(__file__)
 DATA_EXPORTS_DIR = os.path.join(BASE_DIR, "data_exports")
-CACHE_DIR = os.path.join(DATA_EXPORTS_DIR, "dashboard_cache")
 CONFERENCE_REALIGNMENT_OVERRIDES = [
     ("oklahoma", 2024, "SEC"),
     ("texas", 2024, "SEC"),
@@ -44,11 +45,6 @@ def normalize_text(value) -> str:
     return str(value).strip()
 
 
-def _team_key(name: str) -> str:
-    txt = normalize_text(name).lower()
-    return "".join(ch for ch in txt if ch.isalnum())
-
-
 def _cfbd_games_api():
     if cfbd is None:
         return None
@@ -59,7 +55,7 @@ def _cfbd_games_api():
     if api_key.lower().startswith("bearer "):
         api_key = api_key[7:].strip()
     conf = cfbd.Configuration(
-        host="https://api.collegefootballdata.com",
+        host=cfbd_host(),
         access_token=api_key,
     )
     return cfbd.GamesApi(cfbd.ApiClient(conf))
@@ -122,12 +118,13 @@ def apply_conference_overrides(frame: pd.DataFrame, season_year: Optional[int])
         return frame
 
     out = frame.copy()
-    team_keys = out["team"].map(_team_key)
+    index = default_team_index()
+    team_ids = index.team_ids(out["team"])
     conf = out["conference"].map(normalize_text)
     for team_key, effective_year, target_conf in CONFERENCE_REALIGNMENT_OVERRIDES:
         if int(season_year) < int(effective_year):
             continue
-        mask = team_keys == team_key
+        mask = team_ids == index.team_id(team_key)
         if mask.any():
             conf.loc[mask] = target_conf
     out["conference"] = conf
@@ -157,108 +154,39 @@ def load_spi_table(file_path: str, season_year: Optional[int] = None) -> pd.Data
     out = out[out["team"] != ""].copy()
     out = out.sort_values("spi", ascending=False, na_position="last").reset_index(drop=True)
     out["rank"] = out.index + 1
-    out["team_key"] = out["team"].map(_team_key)
+    out["team_id"] = default_team_index().team_ids(out["team"])
     return out
 
 
-def _cache_file(year: int) -> str:
-    return os.path.join(CACHE_DIR, f"upcoming_games_{int(year)}.json")
-
-
-def load_upcoming_cache(year: int, max_age_minutes: int) -> Optional[List[dict]]:
-    path = _cache_file(year)
-    if not os.path.exists(path):
-        return None
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-    except Exception:
-        return None
-
-    cached_at_raw = payload.get("cached_at") if isinstance(payload, dict) else None
-    rows = payload.get("rows") if isinstance(payload, dict) else None
-    if not isinstance(rows, list):
-        return None
-
-    if not isinstance(cached_at_raw, str) or not cached_at_raw:
-        return None
-
-    try:
-        cached_at = dt.datetime.fromisoformat(cached_at_raw.replace("Z", "+00:00"))
-        if cached_at.tzinfo is None:
-            cached_at = cached_at.replace(tzinfo=dt.timezone.utc)
-    except Exception:
-        return None
-
-    age = (dt.datetime.now(dt.timezone.utc) - cached_at).total_seconds() / 60.0
-    if age > max_age_minutes:
-        return None
-    return rows
-
-
-def load_upcoming_cache_any_age(year: int) -> Optional[List[dict]]:
-    path = _cache_file(year)
-    if not os.path.exists(path):
-        return None
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-    except Exception:
-        return None
-
-    rows = payload.get("rows") if isinstance(payload, dict) else None
-    if not isinstance(rows, list):
-        return None
-    return rows
-
-
-def save_upcoming_cache(year: int, rows: List[dict]) -> None:
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    payload = {
-        "year": int(year),
-        "cached_at": dt.datetime.now(dt.timezone.utc).isoformat(),
-        "rows": rows,
-    }
-    def _json_default(value):
-        if isinstance(value, (dt.datetime, dt.date)):
-            return value.isoformat()
-        raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
-
-    with open(_cache_file(year), "w", encoding="utf-8") as f:
-        json.dump(payload, f, default=_json_default)
-
-
 def fetch_upcoming_games(year: int, cache_minutes: int, cache_only: bool = False) -> List[dict]:
-    cached = load_upcoming_cache(year, cache_minutes)
-    if cached is not None:
-        return cached
-
-    stale_cached = load_upcoming_cache_any_age(year)
-
-    if cache_only:
-        if stale_cached is not None:
-            return stale_cached
-        raise RuntimeError(
-            f"No cached upcoming games found for {year}. Expected cache file: {_cache_file(year)}"
-        )
-
-    api = _cfbd_games_api()
+    store = default_store()
+    ttl_seconds = max(0, int(cache_minutes)) * 60
+    params_list = [
+        {"year": int(year), "season_type": "regular"},
+        {"year": int(year), "season_type": "postseason"},
+    ]
+
+    api = None if cache_only else _cfbd_games_api()
     if api is None:
-        if stale_cached is not None:
-            return stale_cached
+        # Read whatever the store holds, however old.
+        stored = [store.fetch("games", params, None, ttl_seconds) for params in params_list]
+        if stored[0] is not None:
+            return stored[0] + (stored[1] or [])
+        if cache_only:
+            raise RuntimeError(
+                f"No cached upcoming games found for {year}. Expected store entry: "
+                f"{store.path_for('games', params_list[0])}"
+            )
         raise RuntimeError(
             "CFBD API unavailable. Set CFBD_API_KEY and ensure cfbd is installed, "
             "or run once with valid API access to warm the cache."
         )
 
+    rows: List[dict] = []
     try:
-        reg_games = api.get_games(year=year, season_type="regular")
-        post_games = api.get_games(year=year, season_type="postseason")
+        for params in params_list:
+            rows.extend(store.fetch("games", params, api.get_games, ttl_seconds))
     except Exception as exc:
-        if stale_cached is not None:
-            print("Warning: CFBD request failed; using stale cached upcoming games.")
-            return stale_cached
-
         err_text = str(exc)
         if "401" in err_text or "Unauthorized" in err_text:
             raise RuntimeError(
@@ -268,15 +196,6 @@ def fetch_upcoming_games(year: int, cache_minutes: int, cache_only: bool = False
 
         raise RuntimeError(f"Failed to fetch games from CFBD: {exc}") from exc
 
-    rows: List[dict] = []
-
-    for g in list(reg_games) + list(post_games):
-        game_dict = g.to_dict() if hasattr(g, "to_dict") else {
-            k: v for k, v in getattr(g, "__dict__", {}).items() if not str(k).startswith("_")
-        }
-        rows.append(game_dict)
-
-    save_upcoming_cache(year, rows)
     return rows
 
 
@@ -360,12 +279,13 @@ def predict_games(
 ) -> pd.DataFrame:
     now_utc = dt.datetime.now(dt.timezone.utc)
 
-    spi_map: Dict[str, float] = {
-        _team_key(r.team): float(r.spi)
+    index = default_team_index()
+    spi_map: Dict[int, float] = {
+        int(r.team_id): float(r.spi)
         for r in rank_df.itertuples()
         if pd.notna(r.spi)
     }
-    rank_map: Dict[str, int] = {_team_key(r.team): int(r.rank) for r in rank_df.itertuples()}
+    rank_map: Dict[int, int] = {int(r.team_id): int(r.rank) for r in rank_df.itertuples()}
 
     pending = []
     for g in games:
@@ -403,8 +323,8 @@ def predict_games(
 
     rows = []
     for g, start, week, home_team, away_team in pending:
-        home_key = _team_key(home_team)
-        away_key = _team_key(away_team)
+        home_key = index.team_id(home_team)
+        away_key = index.team_id(away_team)
 
         home_spi = spi_map.get(home_key)
         away_spi = spi_map.get(away_key)
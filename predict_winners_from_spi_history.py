@@ -4,12 +4,19 @@ import json
 import math
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from cfbd_fetch import DEFAULT_REQUESTS_PER_SECOND, ApiThrottle, cfbd_host
+from cfbd_store import ResponseStore, season_ttl_seconds
+from game_store import SEASON_TYPE_CODES, GameStore, SeasonGameTable, build_season_table
 from model_config import HOME_FIELD_X_DEFAULT
+from team_identity import UNKNOWN_TEAM_ID, TeamIndex, default_team_index, set_default_team_index
 
 HOME_FIELD_X_ALL_GAMES = HOME_FIELD_X_DEFAULT
 SPI_LOGIT_BETA = 0.0425
@@ -23,16 +30,6 @@ except Exception:
     ApiException = Exception
 
 
-def normalize_team_name(name: Optional[str]) -> str:
-    if not name:
-        return ""
-    text = str(name).strip().lower()
-    text = text.replace("&", " and ")
-    text = re.sub(r"[^a-z0-9]+", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
-
-
 def find_first_column(columns: List[str], candidates: List[str]) -> Optional[str]:
     lower_map = {str(c).strip().lower(): c for c in columns}
     for candidate in candidates:
@@ -141,13 +138,6 @@ def load_games_from_cache(cache_dir: str, year: int, week: int, season_type: str
     return None
 
 
-def save_games_to_cache(cache_dir: str, year: int, week: int, season_type: str, games: List[dict]) -> None:
-    os.makedirs(cache_dir, exist_ok=True)
-    out_path = os.path.join(cache_dir, f"games_{year}_{season_type}_w{week}.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(games, f)
-
-
 def init_games_api():
     if cfbd is None:
         return None
@@ -163,7 +153,7 @@ def init_games_api():
     if not api_key:
         return None
 
-    configuration = cfbd.Configuration()
+    configuration = cfbd.Configuration(host=cfbd_host())
     configuration.api_key["Authorization"] = api_key
     configuration.api_key_prefix["Authorization"] = "Bearer"
     client = cfbd.ApiClient(configuration)
@@ -179,24 +169,29 @@ def should_disable_api_after_error(exc: Exception) -> bool:
     return False
 
 
-def fetch_games_from_api(games_api, year: int, week: int, season_type: str) -> List[dict]:
-    games = games_api.get_games(year=year, week=week, season_type=season_type)
-    result: List[dict] = []
-    for game in games:
-        if hasattr(game, "to_dict"):
-            result.append(game.to_dict())
-        elif hasattr(game, "__dict__"):
-            result.append({k: v for k, v in game.__dict__.items() if not str(k).startswith("_")})
-    return result
+def fetch_games_from_store(
+    store: ResponseStore,
+    get_games: Optional[Callable],
+    year: int,
+    week: int,
+    season_type: str,
+) -> Optional[List[dict]]:
+    # With no API function this only reads what the store already holds.
+    return store.fetch(
+        "games",
+        {"year": year, "week": week, "season_type": season_type},
+        get_games,
+        season_ttl_seconds(year),
+    )
 
 
-def is_fbs_game_side(game: dict, side: str, ranking_map: Dict[str, float]) -> bool:
+def is_fbs_game_side(game: dict, side: str, ranking_map: Dict[int, float]) -> bool:
     cls = get_game_field(game, f"{side}_classification", f"{side}Classification")
     if cls and str(cls).strip().lower() == "fbs":
         return True
 
     team_name = get_game_field(game, f"{side}_team", f"{side}Team")
-    return normalize_team_name(team_name) in ranking_map
+    return default_team_index().team_id(team_name) in ranking_map
 
 
 def classify_postseason_game(notes: Optional[str]) -> Tuple[bool, bool]:
@@ -212,21 +207,52 @@ class RankingSource:
     descriptor: str
 
 
-def count_ranked_teams(file_path: str) -> int:
-    if not os.path.exists(file_path):
-        return 0
+@dataclass
+class RankingSnapshot:
+    """One SPI file parsed once: team ids, their SPI, and the file's team count."""
+
+    file_path: str
+    team_count: int
+    team_ids: np.ndarray
+    spi: np.ndarray
+    error: Optional[str] = None
+
+    def ranking_map(self) -> Dict[int, float]:
+        if self.error:
+            raise ValueError(self.error)
+        return dict(zip(self.team_ids.tolist(), self.spi.tolist()))
+
 
+def parse_ranking_file(file_path: str) -> RankingSnapshot:
+    index = default_team_index()
+    no_teams = np.empty(0, dtype=np.int64)
     df = pd.read_csv(file_path)
     if df.empty:
-        return 0
+        return RankingSnapshot(file_path, 0, no_teams, np.empty(0))
 
-    team_col = find_first_column(list(df.columns), ["Team Name", "team"])
-    if team_col is None:
-        return 0
+    count_col = find_first_column(list(df.columns), ["Team Name", "team"])
+    team_count = 0
+    if count_col is not None:
+        counted = set(index.team_ids(df[count_col]).tolist())
+        counted.discard(UNKNOWN_TEAM_ID)
+        team_count = len(counted)
+
+    team_col = find_first_column(list(df.columns), ["Team Name", "team", "school"])
+    spi_col = find_first_column(list(df.columns), ["SPI", "spi", "rating", "score"])
+    if team_col is None or spi_col is None:
+        error = f"Missing required columns in {file_path}. Need team and SPI columns."
+        return RankingSnapshot(file_path, team_count, no_teams, np.empty(0), error)
+
+    spi = pd.to_numeric(df[spi_col], errors="coerce").to_numpy(dtype=float)
+    team_ids = index.team_ids(df[team_col])
+    keep = (team_ids != UNKNOWN_TEAM_ID) & ~np.isnan(spi)
+    return RankingSnapshot(file_path, team_count, team_ids[keep], spi[keep])
 
-    teams = {normalize_team_name(t) for t in df[team_col].tolist()}
-    teams.discard("")
-    return len(teams)
+
+def count_ranked_teams(file_path: str) -> int:
+    if not os.path.exists(file_path):
+        return 0
+    return parse_ranking_file(file_path).team_count
 
 
 def ranking_file_candidates(file_path: str) -> List[str]:
@@ -256,107 +282,131 @@ def ranking_file_candidates(file_path: str) -> List[str]:
     return deduped
 
 
-def choose_full_rankings_file(file_path: str, min_ranking_teams: int) -> Tuple[str, int]:
-    best_path = ""
-    best_count = -1
+class RankingCatalog:
+    """Every SPI snapshot in a data exports directory, listed once and parsed at most once.
 
-    for candidate in ranking_file_candidates(file_path):
-        if not os.path.exists(candidate):
-            continue
-        team_count = count_ranked_teams(candidate)
-        if team_count >= min_ranking_teams:
-            return candidate, team_count
-        if team_count > best_count:
-            best_path = candidate
-            best_count = team_count
-
-    if best_count >= 0:
-        raise ValueError(
-            f"Ranking file coverage too small for {file_path}: best candidate "
-            f"{best_path} has {best_count} teams, expected at least {min_ranking_teams}."
-        )
+    Week lookups, ranking-source resolution, team counts and ranking maps are
+    all answered from memory after the first touch of each file.
+    """
 
-    raise FileNotFoundError(
-        f"No ranking file found for {file_path}. Checked: {ranking_file_candidates(file_path)}"
-    )
+    def __init__(self, data_exports_dir: str):
+        self.data_exports_dir = data_exports_dir
+        try:
+            names = os.listdir(data_exports_dir)
+        except OSError:
+            names = []
+        self._files = {
+            os.path.join(data_exports_dir, name)
+            for name in names
+            if name.startswith("spi_rankings_") and name.endswith(".csv")
+        }
+        self._weeks: Dict[Tuple[int, str], List[int]] = {}
+        for name in names:
+            m = re.match(r"spi_rankings_(\d+)_(post_)?w", name)
+            week = re.search(r"w(\d+)\.csv$", name)
+            if not m or not week:
+                continue
+            season_type = "postseason" if m.group(2) else "regular"
+            self._weeks.setdefault((int(m.group(1)), season_type), []).append(int(week.group(1)))
+        for key, weeks in self._weeks.items():
+            self._weeks[key] = sorted(set(weeks))
+        self._snapshots: Dict[str, RankingSnapshot] = {}
+
+    def exists(self, file_path: str) -> bool:
+        if os.path.dirname(file_path) == self.data_exports_dir:
+            return file_path in self._files
+        return os.path.exists(file_path)
+
+    def snapshot(self, file_path: str) -> RankingSnapshot:
+        if file_path not in self._snapshots:
+            self._snapshots[file_path] = parse_ranking_file(file_path)
+        return self._snapshots[file_path]
+
+    def available_weeks(self, year: int, season_type: str) -> List[int]:
+        season_type = "regular" if season_type == "regular" else "postseason"
+        return list(self._weeks.get((int(year), season_type), []))
+
+    def previous_week_source(self, year: int, season_type: str, week: int) -> RankingSource:
+        data_exports_dir = self.data_exports_dir
+        if season_type == "regular":
+            if week == 1:
+                file_path = os.path.join(data_exports_dir, f"spi_rankings_preseason_{year}.csv")
+                return RankingSource(file_path=file_path, descriptor=f"preseason_{year}")
+
+            file_path = os.path.join(data_exports_dir, f"spi_rankings_{year}_w{week - 1}.csv")
+            return RankingSource(file_path=file_path, descriptor=f"regular_w{week - 1}")
 
+        if week == 1:
+            regular_weeks = self.available_weeks(year, "regular")
+            if not regular_weeks:
+                file_path = os.path.join(data_exports_dir, f"spi_rankings_{year}.csv")
+                return RankingSource(file_path=file_path, descriptor=f"final_{year}")
+            file_path = os.path.join(data_exports_dir, f"spi_rankings_{year}_w{max(regular_weeks)}.csv")
+            return RankingSource(file_path=file_path, descriptor=f"regular_w{max(regular_weeks)}")
+
+        file_path = os.path.join(data_exports_dir, f"spi_rankings_{year}_post_w{week - 1}.csv")
+        return RankingSource(file_path=file_path, descriptor=f"post_w{week - 1}")
+
+    def choose_full_rankings_file(self, file_path: str, min_ranking_teams: int) -> Tuple[str, int]:
+        best_path = ""
+        best_count = -1
+
+        for candidate in ranking_file_candidates(file_path):
+            if not self.exists(candidate):
+                continue
+            team_count = self.snapshot(candidate).team_count
+            if team_count >= min_ranking_teams:
+                return candidate, team_count
+            if team_count > best_count:
+                best_path = candidate
+                best_count = team_count
+
+        if best_count >= 0:
+            raise ValueError(
+                f"Ranking file coverage too small for {file_path}: best candidate "
+                f"{best_path} has {best_count} teams, expected at least {min_ranking_teams}."
+            )
+
+        raise FileNotFoundError(
+            f"No ranking file found for {file_path}. Checked: {ranking_file_candidates(file_path)}"
+        )
 
-def list_available_weeks(data_exports_dir: str, year: int, season_type: str) -> List[int]:
-    if season_type == "regular":
-        pattern = os.path.join(data_exports_dir, f"spi_rankings_{year}_w*.csv")
-        regex = re.compile(rf"spi_rankings_{year}_w(\d+)\.csv$")
-    else:
-        pattern = os.path.join(data_exports_dir, f"spi_rankings_{year}_post_w*.csv")
-        regex = re.compile(rf"spi_rankings_{year}_post_w(\d+)\.csv$")
+    def ranking_map(self, file_path: str) -> Dict[int, float]:
+        if not self.exists(file_path):
+            raise FileNotFoundError(f"Ranking file not found: {file_path}")
+        return self.snapshot(file_path).ranking_map()
 
-    weeks: List[int] = []
-    for path in glob.glob(pattern):
-        m = regex.search(os.path.basename(path))
-        if not m:
-            continue
-        weeks.append(int(m.group(1)))
-    return sorted(set(weeks))
 
+def choose_full_rankings_file(file_path: str, min_ranking_teams: int) -> Tuple[str, int]:
+    return RankingCatalog(os.path.dirname(file_path)).choose_full_rankings_file(
+        file_path, min_ranking_teams
+    )
 
-def previous_week_ranking_source(data_exports_dir: str, year: int, season_type: str, week: int) -> RankingSource:
-    if season_type == "regular":
-        if week == 1:
-            file_path = os.path.join(data_exports_dir, f"spi_rankings_preseason_{year}.csv")
-            return RankingSource(file_path=file_path, descriptor=f"preseason_{year}")
 
-        file_path = os.path.join(data_exports_dir, f"spi_rankings_{year}_w{week - 1}.csv")
-        return RankingSource(file_path=file_path, descriptor=f"regular_w{week - 1}")
+def list_available_weeks(data_exports_dir: str, year: int, season_type: str) -> List[int]:
+    return RankingCatalog(data_exports_dir).available_weeks(year, season_type)
 
-    if week == 1:
-        regular_weeks = list_available_weeks(data_exports_dir, year, "regular")
-        if not regular_weeks:
-            file_path = os.path.join(data_exports_dir, f"spi_rankings_{year}.csv")
-            return RankingSource(file_path=file_path, descriptor=f"final_{year}")
-        file_path = os.path.join(data_exports_dir, f"spi_rankings_{year}_w{max(regular_weeks)}.csv")
-        return RankingSource(file_path=file_path, descriptor=f"regular_w{max(regular_weeks)}")
 
-    file_path = os.path.join(data_exports_dir, f"spi_rankings_{year}_post_w{week - 1}.csv")
-    return RankingSource(file_path=file_path, descriptor=f"post_w{week - 1}")
+def previous_week_ranking_source(data_exports_dir: str, year: int, season_type: str, week: int) -> RankingSource:
+    return RankingCatalog(data_exports_dir).previous_week_source(year, season_type, week)
 
 
-def load_rankings_map(file_path: str) -> Dict[str, float]:
+def load_rankings_map(file_path: str) -> Dict[int, float]:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Ranking file not found: {file_path}")
-
-    df = pd.read_csv(file_path)
-    if df.empty:
-        return {}
-
-    team_col = find_first_column(list(df.columns), ["Team Name", "team", "school"])
-    spi_col = find_first_column(list(df.columns), ["SPI", "spi", "rating", "score"])
-
-    if team_col is None or spi_col is None:
-        raise ValueError(f"Missing required columns in {file_path}. Need team and SPI columns.")
-
-    work = df[[team_col, spi_col]].copy()
-    work[spi_col] = pd.to_numeric(work[spi_col], errors="coerce")
-    work = work.dropna(subset=[spi_col])
-
-    ranking_map: Dict[str, float] = {}
-    for row in work.itertuples(index=False):
-        team = normalize_team_name(getattr(row, team_col))
-        if not team:
-            continue
-        ranking_map[team] = float(getattr(row, spi_col))
-    return ranking_map
+    return parse_ranking_file(file_path).ranking_map()
 
 
 def predict_winner(
     game: dict,
-    ranking_map: Dict[str, float],
+    ranking_map: Dict[int, float],
 ) -> Tuple[Optional[str], Optional[float], Optional[float], str]:
+    index = default_team_index()
     home_team = get_game_field(game, "home_team", "homeTeam")
     away_team = get_game_field(game, "away_team", "awayTeam")
-    home_norm = normalize_team_name(home_team)
-    away_norm = normalize_team_name(away_team)
 
-    home_spi = ranking_map.get(home_norm)
-    away_spi = ranking_map.get(away_norm)
+    home_spi = ranking_map.get(index.team_id(home_team))
+    away_spi = ranking_map.get(index.team_id(away_team))
 
     home_fbs = is_fbs_game_side(game, "home", ranking_map)
     away_fbs = is_fbs_game_side(game, "away", ranking_map)
@@ -381,7 +431,7 @@ def predict_winner(
 
 def predict_winner_variants(
     game: dict,
-    ranking_map: Dict[str, float],
+    ranking_map: Dict[int, float],
     home_field_x: float = HOME_FIELD_X_ALL_GAMES,
 ) -> Dict[str, Optional[object]]:
     predicted_pure, home_spi, away_spi, reason_pure = predict_winner(
@@ -391,8 +441,6 @@ def predict_winner_variants(
 
     home_team = get_game_field(game, "home_team", "homeTeam")
     away_team = get_game_field(game, "away_team", "awayTeam")
-    home_norm = normalize_team_name(home_team)
-    away_norm = normalize_team_name(away_team)
     neutral_site = get_game_field(game, "neutral_site", "neutralSite")
     is_neutral_site = is_true_flag(neutral_site)
 
@@ -455,6 +503,544 @@ def actual_winner(game: dict) -> Optional[str]:
     return None
 
 
+PREDICTION_COLUMNS = [
+    "year",
+    "season_type",
+    "week",
+    "game_id",
+    "start_date",
+    "home_team",
+    "away_team",
+    "home_conference",
+    "away_conference",
+    "conference_game",
+    "home_points",
+    "away_points",
+    "home_classification",
+    "away_classification",
+    "predicted_winner",
+    "predicted_winner_pure",
+    "predicted_winner_home_adj",
+    "actual_winner",
+    "correct",
+    "correct_pure",
+    "correct_home_adj",
+    "prediction_reason",
+    "prediction_reason_pure",
+    "prediction_reason_home_adj",
+    "home_spi_used",
+    "away_spi_used",
+    "home_win_prob_pure_pct",
+    "away_win_prob_pure_pct",
+    "home_win_prob_home_adj_pct",
+    "away_win_prob_home_adj_pct",
+    "home_field_x",
+    "ranking_source",
+    "ranking_source_file",
+    "ranking_source_team_count",
+    "notes",
+    "is_playoff",
+    "is_national_championship",
+    "conference_matchup",
+]
+
+GAME_FIELDS = [
+    ("id", "id"),
+    ("start_date", "startDate"),
+    ("home_team", "homeTeam"),
+    ("away_team", "awayTeam"),
+    ("home_conference", "homeConference"),
+    ("away_conference", "awayConference"),
+    ("conference_game", "conferenceGame"),
+    ("home_points", "homePoints"),
+    ("away_points", "awayPoints"),
+    ("home_classification", "homeClassification"),
+    ("away_classification", "awayClassification"),
+    ("neutral_site", "neutralSite"),
+    ("notes", "notes"),
+]
+
+
+def games_frame(games: List[dict]) -> pd.DataFrame:
+    """One object-dtype row per game, with snake/camel keys resolved like ``get_game_field``."""
+    return pd.DataFrame(
+        {snake: [get_game_field(g, snake, camel) for g in games] for snake, camel in GAME_FIELDS},
+        dtype=object,
+    )
+
+
+def _map_unique(values: pd.Series, fn: Callable) -> np.ndarray:
+    # Team names, flags and classifications repeat heavily; evaluate each distinct value once.
+    lookup = {value: fn(value) for value in pd.unique(values)}
+    return np.array([lookup[value] for value in values], dtype=object)
+
+
+def _sigmoid_array(z: np.ndarray) -> np.ndarray:
+    # Same two-branch form as ``sigmoid`` so both sides stay overflow-free.
+    out = np.full(z.shape, np.nan)
+    positive = z >= 0
+    out[positive] = 1.0 / (1.0 + np.exp(-z[positive]))
+    negative = z < 0
+    e = np.exp(z[negative])
+    out[negative] = e / (1.0 + e)
+    return out
+
+
+def _logit_array(p: np.ndarray) -> np.ndarray:
+    p = np.clip(np.clip(p, 0.0, 1.0), 1e-9, 1.0 - 1e-9)
+    return np.log(p / (1.0 - p))
+
+
+def _optional_list(values: np.ndarray, missing: np.ndarray) -> List:
+    return [None if m else v for v, m in zip(values.tolist(), missing.tolist())]
+
+
+def _pct_list(probabilities: np.ndarray) -> List[Optional[float]]:
+    # Python's round() keeps the exact half-way behaviour of the per-game path.
+    return [None if math.isnan(p) else round(100.0 * p, 3) for p in probabilities.tolist()]
+
+
+def predict_week_frame(
+    games: pd.DataFrame,
+    ranking_map: Dict[int, float],
+    home_field_x: float = HOME_FIELD_X_ALL_GAMES,
+) -> pd.DataFrame:
+    """``predict_winner_variants`` for a whole frame of games at once.
+
+    Returns ``home_fbs``/``away_fbs`` flags and the variant fields as columns,
+    with NaN for missing SPI and probabilities.
+    """
+    home_team = games["home_team"].to_numpy(dtype=object)
+    away_team = games["away_team"].to_numpy(dtype=object)
+    index = default_team_index()
+    home_ids = index.team_ids(games["home_team"]).tolist()
+    away_ids = index.team_ids(games["away_team"]).tolist()
+
+    def is_fbs_class(cls) -> bool:
+        return bool(cls) and str(cls).strip().lower() == "fbs"
+
+    home_fbs = _map_unique(games["home_classification"], is_fbs_class).astype(bool) | np.array(
+        [team_id in ranking_map for team_id in home_ids], dtype=bool
+    )
+    away_fbs = _map_unique(games["away_classification"], is_fbs_class).astype(bool) | np.array(
+        [team_id in ranking_map for team_id in away_ids], dtype=bool
+    )
+    neutral = _map_unique(games["neutral_site"], is_true_flag).astype(bool)
+
+    home_spi = np.array([ranking_map.get(team_id, np.nan) for team_id in home_ids], dtype=float)
+    away_spi = np.array([ranking_map.get(team_id, np.nan) for team_id in away_ids], dtype=float)
+    has_home = ~np.isnan(home_spi)
+    has_away = ~np.isnan(away_spi)
+    has_both = has_home & has_away
+    home_rule = home_fbs & ~away_fbs
+    away_rule = away_fbs & ~home_fbs
+
+    pure_conditions = [
+        home_rule,
+        away_rule,
+        has_both & (home_spi >= away_spi),
+        has_both,
+        has_home,
+        has_away,
+    ]
+    predicted_pure = np.select(
+        pure_conditions,
+        [home_team, away_team, home_team, away_team, home_team, away_team],
+        default=None,
+    )
+    reason_pure = np.select(
+        pure_conditions,
+        [
+            "fbs_vs_fcs_rule",
+            "fbs_vs_fcs_rule",
+            "higher_spi",
+            "higher_spi",
+            "only_home_spi",
+            "only_away_spi",
+        ],
+        default="no_spi_available",
+    ).astype(object)
+
+    z = SPI_LOGIT_INTERCEPT + SPI_LOGIT_BETA * (home_spi - away_spi)
+    p_raw = np.where(has_both, _sigmoid_array(np.where(has_both, z, 0.0)), np.nan)
+    p_raw = np.where(has_home & ~has_away, 1.0, p_raw)
+    p_raw = np.where(has_away & ~has_home, 0.0, p_raw)
+
+    shifted = _sigmoid_array(_logit_array(p_raw) + home_field_logit_shift_from_x(home_field_x))
+    p_adj = np.clip(np.where(neutral, p_raw, shifted), 0.0, 1.0)
+
+    adjusted = ~np.isnan(p_adj) & ~home_rule & ~away_rule
+    predicted_hfa = predicted_pure.copy()
+    predicted_hfa[adjusted] = np.where(p_adj[adjusted] >= 0.5, home_team[adjusted], away_team[adjusted])
+    predicted_hfa[home_rule] = home_team[home_rule]
+    predicted_hfa[away_rule] = away_team[away_rule]
+    reason_hfa = reason_pure.copy()
+    reason_hfa[adjusted & (reason_pure == "higher_spi")] = "higher_spi_home_field_adjusted"
+
+    p_raw = np.where(home_rule, 1.0, np.where(away_rule, 0.0, p_raw))
+    p_adj = np.where(home_rule, 1.0, np.where(away_rule, 0.0, p_adj))
+
+    return pd.DataFrame(
+        {
+            "home_fbs": home_fbs,
+            "away_fbs": away_fbs,
+            # Object dtype keeps "no pick" as None; a string column would turn it into NaN.
+            "predicted_winner_pure": pd.Series(predicted_pure, index=games.index, dtype=object),
+            "predicted_winner_home_adj": pd.Series(predicted_hfa, index=games.index, dtype=object),
+            "home_spi": home_spi,
+            "away_spi": away_spi,
+            "prediction_reason_pure": reason_pure,
+            "prediction_reason_home_adj": reason_hfa,
+            "home_win_prob_pure": p_raw,
+            "away_win_prob_pure": np.clip(1.0 - p_raw, 0.0, 1.0),
+            "home_win_prob_home_adj": p_adj,
+            "away_win_prob_home_adj": np.clip(1.0 - p_adj, 0.0, 1.0),
+            "home_field_x": float(home_field_x),
+            "neutral_site": neutral,
+        },
+        index=games.index,
+    )
+
+
+def actual_winners(games: pd.DataFrame) -> np.ndarray:
+    """``actual_winner`` for every row of a games frame."""
+    home_points = pd.to_numeric(games["home_points"], errors="coerce").to_numpy(dtype=float)
+    away_points = pd.to_numeric(games["away_points"], errors="coerce").to_numpy(dtype=float)
+    return np.select(
+        [home_points > away_points, away_points > home_points],
+        [games["home_team"].to_numpy(dtype=object), games["away_team"].to_numpy(dtype=object)],
+        default=None,
+    )
+
+
+def _correct_list(predicted: np.ndarray, actual: np.ndarray) -> List[Optional[int]]:
+    return [
+        None if p is None or a is None else int(p == a)
+        for p, a in zip(predicted.tolist(), actual.tolist())
+    ]
+
+
+def legacy_weekly_games(cache_dir: str, year: int) -> Dict[str, List[dict]]:
+    """Every per-week ``games_<year>[_<season_type>]_w<week>.json`` cache for a season, by season type.
+
+    A week's games get their ``week`` from the file name, and a season-typed
+    file wins over a bare ``games_<year>_w<week>.json`` for the same week.
+    """
+    found: Dict[Tuple[str, int], Tuple[int, str]] = {}
+    pattern = re.compile(rf"games_{year}_(regular_|postseason_)?w(\d+)\.json$")
+    for path in sorted(glob.glob(os.path.join(cache_dir, f"games_{year}_*.json"))):
+        m = pattern.match(os.path.basename(path))
+        if not m:
+            continue
+        season_type = "postseason" if m.group(1) == "postseason_" else "regular"
+        priority = 0 if m.group(1) else 1
+        key = (season_type, int(m.group(2)))
+        if key not in found or priority < found[key][0]:
+            found[key] = (priority, path)
+
+    games: Dict[str, List[dict]] = {}
+    for (season_type, week), (_, path) in sorted(found.items()):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if isinstance(payload, list):
+            games.setdefault(season_type, []).extend({**game, "week": week} for game in payload)
+    return games
+
+
+class GameSource:
+    """Week-level game lookups for the backtest.
+
+    Weeks are sliced out of the season's columnar game table. The table is
+    built once from season-level pulls (the response store, then the API),
+    or from legacy per-week JSON caches. Weeks the table lacks fall back to
+    per-week JSON, then the store, then the API. The API is dropped for the
+    rest of the run after an auth or rate-limit error.
+    """
+
+    def __init__(
+        self,
+        data_exports_dir: str,
+        cache_only: bool,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    ):
+        self.cache_dir = os.path.join(data_exports_dir, "cache")
+        self.store = ResponseStore(os.path.join(self.cache_dir, "cfbd"))
+        self.game_store = GameStore(os.path.join(self.cache_dir, "games"))
+        self._tables: Dict[int, Optional[SeasonGameTable]] = {}
+        games_api = None if cache_only else init_games_api()
+        # Rate limited, and 429/5xx responses are retried before the API is disabled.
+        self.get_games = (
+            ApiThrottle(requests_per_second=requests_per_second).wrap(games_api.get_games)
+            if games_api is not None
+            else None
+        )
+        self.api_disabled = cache_only
+
+    def _api_failed(self, exc: Exception, what: str) -> None:
+        print(f"Failed to fetch games for {what}: {exc}")
+        if should_disable_api_after_error(exc):
+            self.api_disabled = True
+            print(
+                "Disabling further API requests for this run due to auth/rate-limit error. "
+                "Use --cache-only to force local cache mode."
+            )
+
+    def _season_games(self, year: int) -> Dict[str, List[dict]]:
+        games: Dict[str, List[dict]] = {}
+        for season_type in SEASON_TYPE_CODES:
+            try:
+                records = self.store.fetch(
+                    "games",
+                    {"year": year, "season_type": season_type},
+                    None if self.api_disabled else self.get_games,
+                    season_ttl_seconds(year),
+                )
+            except ApiException as exc:
+                self._api_failed(exc, f"{year} {season_type}")
+                records = None
+            if records is not None:
+                games[season_type] = records
+        return games or legacy_weekly_games(self.cache_dir, year)
+
+    def season_table(self, year: int) -> Optional[SeasonGameTable]:
+        """The season's columnar table, rebuilt when missing or stale; a stale one beats none."""
+        if year not in self._tables:
+            table = self.game_store.load(year)
+            if table is None or not GameStore.is_fresh(table, season_ttl_seconds(year)):
+                games = self._season_games(year)
+                if games:
+                    self.game_store.write(build_season_table(year, games))
+                    table = self.game_store.load(year)
+            self._tables[year] = table
+        return self._tables[year]
+
+    def week_games(self, year: int, week: int, season_type: str) -> Optional[List[dict]]:
+        table = self.season_table(year)
+        if table is not None and table.has_week(week, season_type):
+            return table.records(week, season_type)
+
+        games = load_games_from_cache(self.cache_dir, year, week, season_type)
+        if games is not None:
+            return games
+        try:
+            return fetch_games_from_store(
+                self.store,
+                None if self.api_disabled else self.get_games,
+                year,
+                week,
+                season_type,
+            )
+        except ApiException as exc:
+            self._api_failed(exc, f"{year} {season_type} week {week}")
+            return None
+
+
+def backtest_weeks(start_year: int, end_year: int, catalog: RankingCatalog) -> List[Tuple[int, str, int]]:
+    """Every (year, season_type, week) with a ranking snapshot, in output order."""
+    units = []
+    for year in range(start_year, end_year + 1):
+        for season_type in ("regular", "postseason"):
+            for week in catalog.available_weeks(year, season_type):
+                units.append((year, season_type, week))
+    return units
+
+
+@dataclass
+class WeekRanking:
+    """The previous-week rankings a backtest week is scored against."""
+
+    source: RankingSource
+    file_path: str
+    team_count: int
+    ranking_map: Dict[int, float]
+
+
+def resolve_week_ranking(
+    catalog: RankingCatalog,
+    year: int,
+    season_type: str,
+    week: int,
+    min_ranking_teams: int,
+) -> Optional[WeekRanking]:
+    ranking_source = catalog.previous_week_source(year, season_type, week)
+
+    try:
+        selected_ranking_file, ranked_team_count = catalog.choose_full_rankings_file(
+            ranking_source.file_path,
+            min_ranking_teams=min_ranking_teams,
+        )
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"Skipping {year} {season_type} week {week}: {exc}")
+        return None
+
+    if selected_ranking_file != ranking_source.file_path:
+        print(
+            f"Using fallback ranking file for {year} {season_type} week {week}: "
+            f"{selected_ranking_file} ({ranked_team_count} teams)"
+        )
+
+    return WeekRanking(
+        source=ranking_source,
+        file_path=selected_ranking_file,
+        team_count=ranked_team_count,
+        ranking_map=catalog.ranking_map(selected_ranking_file),
+    )
+
+
+def evaluate_week(
+    game_source: GameSource,
+    ranking: WeekRanking,
+    year: int,
+    season_type: str,
+    week: int,
+    home_field_x: float,
+) -> Dict[str, List]:
+    """Prediction columns for one week's games from the previous week's rankings."""
+    games = game_source.week_games(year, week, season_type)
+    if games is None:
+        print(f"Skipping {year} {season_type} week {week}: no cache and no API access")
+        return {column: [] for column in PREDICTION_COLUMNS}
+
+    if not games:
+        return {column: [] for column in PREDICTION_COLUMNS}
+
+    frame = games_frame(games)
+    frame = frame[frame["home_team"].astype(bool) & frame["away_team"].astype(bool)]
+    if frame.empty:
+        return {column: [] for column in PREDICTION_COLUMNS}
+    variant = predict_week_frame(frame, ranking.ranking_map, home_field_x=home_field_x)
+    keep = (variant["home_fbs"] | variant["away_fbs"]).to_numpy()
+    frame = frame[keep]
+    variant = variant[keep]
+
+    rows = len(frame)
+    notes = frame["notes"].tolist()
+    postseason_flags = [classify_postseason_game(note) for note in notes]
+    actual = actual_winners(frame)
+    predicted_pure = variant["predicted_winner_pure"].to_numpy(dtype=object)
+    predicted_hfa = variant["predicted_winner_home_adj"].to_numpy(dtype=object)
+    reason_hfa = variant["prediction_reason_home_adj"].tolist()
+    correct_home_adj = _correct_list(predicted_hfa, actual)
+    home_spi = variant["home_spi"].to_numpy()
+    away_spi = variant["away_spi"].to_numpy()
+
+    return {
+        "year": [year] * rows,
+        "season_type": [season_type] * rows,
+        "week": [int(week)] * rows,
+        "game_id": frame["id"].tolist(),
+        "start_date": frame["start_date"].tolist(),
+        "home_team": frame["home_team"].tolist(),
+        "away_team": frame["away_team"].tolist(),
+        "home_conference": frame["home_conference"].tolist(),
+        "away_conference": frame["away_conference"].tolist(),
+        "conference_game": [
+            bool(value) if value is not None else False for value in frame["conference_game"]
+        ],
+        "home_points": frame["home_points"].tolist(),
+        "away_points": frame["away_points"].tolist(),
+        "home_classification": frame["home_classification"].tolist(),
+        "away_classification": frame["away_classification"].tolist(),
+        "predicted_winner": predicted_hfa.tolist(),
+        "predicted_winner_pure": predicted_pure.tolist(),
+        "predicted_winner_home_adj": predicted_hfa.tolist(),
+        "actual_winner": actual.tolist(),
+        "correct": correct_home_adj,
+        "correct_pure": _correct_list(predicted_pure, actual),
+        "correct_home_adj": correct_home_adj,
+        "prediction_reason": reason_hfa,
+        "prediction_reason_pure": variant["prediction_reason_pure"].tolist(),
+        "prediction_reason_home_adj": reason_hfa,
+        "home_spi_used": _optional_list(home_spi, np.isnan(home_spi)),
+        "away_spi_used": _optional_list(away_spi, np.isnan(away_spi)),
+        "home_win_prob_pure_pct": _pct_list(variant["home_win_prob_pure"].to_numpy()),
+        "away_win_prob_pure_pct": _pct_list(variant["away_win_prob_pure"].to_numpy()),
+        "home_win_prob_home_adj_pct": _pct_list(variant["home_win_prob_home_adj"].to_numpy()),
+        "away_win_prob_home_adj_pct": _pct_list(variant["away_win_prob_home_adj"].to_numpy()),
+        "home_field_x": variant["home_field_x"].tolist(),
+        "ranking_source": [ranking.source.descriptor] * rows,
+        "ranking_source_file": [os.path.basename(ranking.file_path)] * rows,
+        "ranking_source_team_count": [ranking.team_count] * rows,
+        "notes": notes,
+        "is_playoff": [bool(flags[0]) for flags in postseason_flags],
+        "is_national_championship": [bool(flags[1]) for flags in postseason_flags],
+        "conference_matchup": [
+            " vs ".join(sorted([str(home or "Unknown"), str(away or "Unknown")]))
+            for home, away in zip(frame["home_conference"], frame["away_conference"])
+        ],
+    }
+
+
+BACKTEST_STATE_VERSION = 1
+
+
+def backtest_state_file(output_dir: str, start_year: int, end_year: int) -> str:
+    return os.path.join(output_dir, f"backtest_state_{start_year}_{end_year}.json")
+
+
+def week_key(
+    year: int,
+    season_type: str,
+    week: int,
+    ranking_source_file: str,
+    home_field_x: float,
+) -> Tuple[int, str, int, str, float]:
+    return (int(year), season_type, int(week), os.path.basename(ranking_source_file), float(home_field_x))
+
+
+def week_is_complete(columns: Dict[str, List]) -> bool:
+    """Every game in the week has a final score, so its rows can no longer change."""
+    if not columns["year"]:
+        return False
+    return all(
+        home is not None and away is not None
+        for home, away in zip(columns["home_points"], columns["away_points"])
+    )
+
+
+def load_backtest_state(state_file: str) -> Dict[tuple, dict]:
+    """Scored weeks from a previous incremental run, keyed by ``week_key``."""
+    if not os.path.exists(state_file):
+        return {}
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != BACKTEST_STATE_VERSION:
+            return {}
+        return {tuple(entry["key"]): entry for entry in state["weeks"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def save_backtest_state(state_file: str, entries: List[dict]) -> None:
+    os.makedirs(os.path.dirname(state_file) or ".", exist_ok=True)
+    tmp_file = f"{state_file}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump({"version": BACKTEST_STATE_VERSION, "weeks": entries}, f)
+    os.replace(tmp_file, state_file)
+
+
+# Each backtest worker process keeps its own game source (and API budget share).
+_worker_game_source: Optional[GameSource] = None
+
+
+def init_backtest_worker(
+    data_exports_dir: str, cache_only: bool, requests_per_second: float, team_index: TeamIndex
+) -> None:
+    # Ranking maps arrive keyed by the parent's team ids, so games must resolve through the same index.
+    global _worker_game_source
+    set_default_team_index(team_index)
+    _worker_game_source = GameSource(data_exports_dir, cache_only, requests_per_second)
+
+
+def evaluate_week_in_worker(task: Tuple[WeekRanking, int, str, int], home_field_x: float) -> Dict[str, List]:
+    ranking, year, season_type, week = task
+    return evaluate_week(_worker_game_source, ranking, year, season_type, week, home_field_x)
+
+
 def evaluate_years(
     start_year: int,
     end_year: int,
@@ -462,165 +1048,78 @@ def evaluate_years(
     min_ranking_teams: int,
     home_field_x: float,
     cache_only: bool,
+    workers: int = 1,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    state_file: Optional[str] = None,
 ) -> pd.DataFrame:
-    cache_dir = os.path.join(data_exports_dir, "cache")
-    games_api = None if cache_only else init_games_api()
-    api_disabled = cache_only
-    records: List[dict] = []
-
-    for year in range(start_year, end_year + 1):
-        for season_type in ("regular", "postseason"):
-            weeks = list_available_weeks(data_exports_dir, year, season_type)
-            if not weeks:
-                continue
-
-            for week in weeks:
-                ranking_source = previous_week_ranking_source(
-                    data_exports_dir=data_exports_dir,
-                    year=year,
-                    season_type=season_type,
-                    week=week,
+    """Backtest every available week, optionally fanning weeks out to a process pool.
+
+    Rows always come back in year, season type, week order, whatever the worker count.
+    With ``state_file`` set, completed weeks scored by an earlier run against the
+    same (unchanged) ranking file and home-field X are reused instead of re-scored,
+    and the state is rewritten for the next run.
+    """
+    catalog = RankingCatalog(data_exports_dir)
+    previous = load_backtest_state(state_file) if state_file else {}
+
+    tasks = []
+    for year, season_type, week in backtest_weeks(start_year, end_year, catalog):
+        ranking = resolve_week_ranking(catalog, year, season_type, week, min_ranking_teams)
+        if ranking is not None:
+            tasks.append((ranking, year, season_type, week))
+
+    keys = [week_key(year, st, week, ranking.file_path, home_field_x) for ranking, year, st, week in tasks]
+    mtimes = [os.path.getmtime(ranking.file_path) for ranking, _, _, _ in tasks]
+    week_columns: List[Optional[Dict[str, List]]] = []
+    for key, mtime in zip(keys, mtimes):
+        entry = previous.get(key)
+        reusable = entry is not None and entry.get("ranking_mtime") == mtime
+        week_columns.append(entry["columns"] if reusable else None)
+    pending = [i for i, columns in enumerate(week_columns) if columns is None]
+    if state_file:
+        print(f"Reusing {len(tasks) - len(pending)} of {len(tasks)} scored weeks from {state_file}")
+
+    workers = max(1, min(int(workers), len(pending) or 1))
+    game_source = GameSource(data_exports_dir, cache_only, requests_per_second)
+    if workers == 1:
+        scored = [evaluate_week(game_source, *tasks[i], home_field_x) for i in pending]
+    else:
+        # Build each season's game table once here; workers then only memory-map it.
+        for year in sorted({tasks[i][1] for i in pending}):
+            game_source.season_table(year)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_backtest_worker,
+            initargs=(data_exports_dir, cache_only, requests_per_second / workers, default_team_index()),
+        ) as pool:
+            scored = list(
+                pool.map(
+                    partial(evaluate_week_in_worker, home_field_x=home_field_x),
+                    [tasks[i] for i in pending],
                 )
+            )
+    for i, columns in zip(pending, scored):
+        week_columns[i] = columns
+
+    if state_file:
+        save_backtest_state(
+            state_file,
+            [
+                {"key": list(key), "ranking_mtime": mtime, "columns": columns}
+                for key, mtime, columns in zip(keys, mtimes, week_columns)
+                if week_is_complete(columns)
+            ],
+        )
 
-                try:
-                    selected_ranking_file, ranked_team_count = choose_full_rankings_file(
-                        ranking_source.file_path,
-                        min_ranking_teams=min_ranking_teams,
-                    )
-                except (FileNotFoundError, ValueError) as exc:
-                    print(f"Skipping {year} {season_type} week {week}: {exc}")
-                    continue
-
-                if selected_ranking_file != ranking_source.file_path:
-                    print(
-                        f"Using fallback ranking file for {year} {season_type} week {week}: "
-                        f"{selected_ranking_file} ({ranked_team_count} teams)"
-                    )
-
-                ranking_map = load_rankings_map(selected_ranking_file)
-
-                games = load_games_from_cache(cache_dir, year, week, season_type)
-                if games is None and games_api is not None and not api_disabled:
-                    try:
-                        games = fetch_games_from_api(games_api, year, week, season_type)
-                        save_games_to_cache(cache_dir, year, week, season_type, games)
-                    except ApiException as exc:
-                        print(f"Failed to fetch games for {year} {season_type} week {week}: {exc}")
-                        if should_disable_api_after_error(exc):
-                            api_disabled = True
-                            print(
-                                "Disabling further API requests for this run due to auth/rate-limit error. "
-                                "Use --cache-only to force local cache mode."
-                            )
-                        games = None
-
-                if games is None:
-                    print(f"Skipping {year} {season_type} week {week}: no cache and no API access")
-                    continue
-
-                for game in games:
-                    home_team = get_game_field(game, "home_team", "homeTeam")
-                    away_team = get_game_field(game, "away_team", "awayTeam")
-                    if not home_team or not away_team:
-                        continue
-
-                    home_conf = get_game_field(game, "home_conference", "homeConference")
-                    away_conf = get_game_field(game, "away_conference", "awayConference")
-                    conference_game = get_game_field(game, "conference_game", "conferenceGame")
-
-                    home_fbs = is_fbs_game_side(game, "home", ranking_map)
-                    away_fbs = is_fbs_game_side(game, "away", ranking_map)
-                    if not (home_fbs or away_fbs):
-                        continue
-
-                    notes = get_game_field(game, "notes", "notes")
-                    is_playoff, is_nat_champ = classify_postseason_game(notes)
-                    variant = predict_winner_variants(
-                        game,
-                        ranking_map,
-                        home_field_x=home_field_x,
-                    )
-
-                    actual = actual_winner(game)
-
-                    predicted_pure = variant["predicted_winner_pure"]
-                    predicted_hfa = variant["predicted_winner_home_adj"]
-                    correct_pure = None
-                    if predicted_pure is not None and actual is not None:
-                        correct_pure = int(predicted_pure == actual)
-
-                    correct_home_adj = None
-                    if predicted_hfa is not None and actual is not None:
-                        correct_home_adj = int(predicted_hfa == actual)
-
-                    records.append(
-                        {
-                            "year": year,
-                            "season_type": season_type,
-                            "week": int(week),
-                            "game_id": get_game_field(game, "id", "id"),
-                            "start_date": get_game_field(game, "start_date", "startDate"),
-                            "home_team": home_team,
-                            "away_team": away_team,
-                            "home_conference": home_conf,
-                            "away_conference": away_conf,
-                            "conference_game": bool(conference_game)
-                            if conference_game is not None
-                            else False,
-                            "home_points": get_game_field(game, "home_points", "homePoints"),
-                            "away_points": get_game_field(game, "away_points", "awayPoints"),
-                            "home_classification": get_game_field(
-                                game, "home_classification", "homeClassification"
-                            ),
-                            "away_classification": get_game_field(
-                                game, "away_classification", "awayClassification"
-                            ),
-                            "predicted_winner": predicted_hfa,
-                            "predicted_winner_pure": predicted_pure,
-                            "predicted_winner_home_adj": predicted_hfa,
-                            "actual_winner": actual,
-                            "correct": correct_home_adj,
-                            "correct_pure": correct_pure,
-                            "correct_home_adj": correct_home_adj,
-                            "prediction_reason": variant["prediction_reason_home_adj"],
-                            "prediction_reason_pure": variant["prediction_reason_pure"],
-                            "prediction_reason_home_adj": variant["prediction_reason_home_adj"],
-                            "home_spi_used": variant["home_spi"],
-                            "away_spi_used": variant["away_spi"],
-                            "home_win_prob_pure_pct": None
-                            if variant["home_win_prob_pure"] is None
-                            else round(100.0 * float(variant["home_win_prob_pure"]), 3),
-                            "away_win_prob_pure_pct": None
-                            if variant["away_win_prob_pure"] is None
-                            else round(100.0 * float(variant["away_win_prob_pure"]), 3),
-                            "home_win_prob_home_adj_pct": None
-                            if variant["home_win_prob_home_adj"] is None
-                            else round(100.0 * float(variant["home_win_prob_home_adj"]), 3),
-                            "away_win_prob_home_adj_pct": None
-                            if variant["away_win_prob_home_adj"] is None
-                            else round(100.0 * float(variant["away_win_prob_home_adj"]), 3),
-                            "home_field_x": variant["home_field_x"],
-                            "ranking_source": ranking_source.descriptor,
-                            "ranking_source_file": os.path.basename(selected_ranking_file),
-                            "ranking_source_team_count": ranked_team_count,
-                            "notes": notes,
-                            "is_playoff": bool(is_playoff),
-                            "is_national_championship": bool(is_nat_champ),
-                            "conference_matchup": " vs ".join(
-                                sorted(
-                                    [
-                                        str(home_conf or "Unknown"),
-                                        str(away_conf or "Unknown"),
-                                    ]
-                                )
-                            ),
-                        }
-                    )
-
-    if not records:
+    # One constructor call over whole columns gives the same dtype inference as the old row dicts.
+    columns = {
+        column: [value for week in week_columns for value in week[column]]
+        for column in PREDICTION_COLUMNS
+    }
+    if not columns["year"]:
         return pd.DataFrame()
 
-    return pd.DataFrame(records)
+    return pd.DataFrame(columns, columns=PREDICTION_COLUMNS)
 
 
 def summarize_accuracy(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
@@ -727,6 +1226,23 @@ def main() -> None:
         action="store_true",
         help="Use cached games only; do not call CFBD API.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Backtest weeks in parallel on this many processes (1 runs in-process).",
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        help="CFBD request budget shared by all workers.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse completed weeks scored by the previous --incremental run; only new weeks are scored.",
+    )
     args = parser.parse_args()
 
     os.makedirs(args.output_dir, exist_ok=True)
@@ -738,6 +1254,11 @@ def main() -> None:
         min_ranking_teams=args.min_ranking_teams,
         home_field_x=args.home_field_x,
         cache_only=args.cache_only,
+        workers=args.workers,
+        requests_per_second=args.requests_per_second,
+        state_file=backtest_state_file(args.output_dir, args.start_year, args.end_year)
+        if args.incremental
+        else None,
     )
 
     if df.empty:
@@ -1,15 +1,47 @@
 import os
 import sys
+import json
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from scipy import stats as statz
 from operator import itemgetter, attrgetter
 from datetime import datetime
-import cfbd
-from cfbd.rest import ApiException
+from dataclasses import asdict
+from types import SimpleNamespace
 import argparse
 
+try:
+    import cfbd
+except Exception:
+    cfbd = None
+
+import spi_engine
+from cfbd_fetch import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_REQUESTS_PER_SECOND,
+    ApiThrottle,
+    cfbd_host,
+    fetch_all,
+)
+from cfbd_store import (
+    REFERENCE_TTL_SECONDS,
+    RecordingStore,
+    ReplayStore,
+    default_store,
+    record_to_object,
+    season_is_finished,
+    season_ttl_seconds,
+)
+from season_games import (
+    TeamRecord,
+    add_games_to_records,
+    aggregate_team_records,
+    game_has_score,
+    load_season_games,
+)
+from season_stats import load_team_stat_matrix
+
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
@@ -33,21 +65,63 @@ def parse_arguments():
     parser.add_argument(
         "--date", type=str, help="Specific date to analyze (format: YYYY-MM-DD)"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the last saved snapshot for this start week and only ingest newly completed games",
+    )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Concurrent CFBD requests for per-week pulls (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--requests_per_second",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        help=f"CFBD request rate limit, 0 to disable (default: {DEFAULT_REQUESTS_PER_SECOND})",
+    )
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Copy every CFBD response this run uses into a fixture archive",
+    )
+    fixtures.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Serve every CFBD response from a recorded fixture archive, with no network access",
+    )
     return parser.parse_args()
 
 
 os.makedirs("data_exports", exist_ok=True)
 
-configuration = cfbd.Configuration(
-    host="https://api.collegefootballdata.com",
-    access_token=os.getenv("CFBD_API_KEY"),
-)
+API_CLIENT_CLASSES = {
+    "teams": "TeamsApi",
+    "games": "GamesApi",
+    "stats": "StatsApi",
+    "rankings": "RankingsApi",
+    "conferences": "ConferencesApi",
+}
+API_CLIENTS = {}
+
+response_store = default_store()
+api_throttle = ApiThrottle()
+
+SEASON_GAME_INDEXES = {}
+SEASON_TEAMS = {}
+SEASON_TEAM_RECORDS = {}
+SEASON_GAME_IDS = {}
+SEASON_STAT_MATRICES = {}
+CONFERENCE_TALLIES = {}
+CONFERENCE_CHAMPIONS = {}
+
+# Off for --record/--replay: saved tallies and incremental state would skip CFBD pulls the archive needs
+use_local_caches = True
 
-teams_api = cfbd.TeamsApi(cfbd.ApiClient(configuration))
-games_api = cfbd.GamesApi(cfbd.ApiClient(configuration))
-stats_api = cfbd.StatsApi(cfbd.ApiClient(configuration))
-rankings_api = cfbd.RankingsApi(cfbd.ApiClient(configuration))
-conferences_api = cfbd.ConferencesApi(cfbd.ApiClient(configuration))
+RANKING_STATE_VERSION = 1
 
 conf_conversion = {
     "american": ["american"],
@@ -115,6 +189,44 @@ def team_stat(stat):
     return float(stat)
 
 
+def touchdowns_and_turnover_margin(stats):
+    """Offensive touchdowns (TD) and turnover margin (TM) from a team's season stats"""
+    # Offensive touchdowns
+    passTD = team_stat(stats.get("passingTDs", 0))
+    rushTD = team_stat(stats.get("rushingTDs", 0))
+    TD = passTD + rushTD
+
+    # Turnovers
+    INTf = team_stat(stats.get("interceptions", 0))  # Interceptions by defense
+    Ff = team_stat(stats.get("fumblesRecovered", 0))  # Fumbles recovered
+    TO_forced = INTf + Ff
+
+    INT = team_stat(stats.get("passesIntercepted", 0))  # Interceptions thrown
+    Fumbles = team_stat(stats.get("fumblesLost", 0))  # Fumbles lost
+    TO_allowed = INT + Fumbles
+
+    TM = TO_forced - TO_allowed  # Turnover margin
+    return TD, TM
+
+
+def team_table_row(record, conf_champ, TD, TM):
+    """One team's row of the SPI engine's team table"""
+    return {
+        "team": record.team,
+        "conference": record.conference,
+        "conf_champ": conf_champ,
+        "games": float(record.games),
+        "wins": record.wins,
+        "losses": record.losses,
+        "conf_wins": record.conf_wins,
+        "conf_losses": record.conf_losses,
+        "points": record.points,
+        "points_allowed": record.points_allowed,
+        "TD": TD,
+        "TM": TM,
+    }
+
+
 def ave_margin(G, P, PA):
     return (P - PA) / G if G > 0 else 0.0
 
@@ -208,112 +320,127 @@ class My_Team:
         self.SPI = SPI
 
 
-def api_call_with_week_range(api_function, start_week=1, end_week=56, **kwargs):
-    """Make API calls with week range support"""
-    if start_week == 1 and end_week == 56:
-        return api_function(**kwargs)
+def api_client(name):
+    """Build a CFBD API client on first use, so cached and replayed runs never need one"""
+    if name not in API_CLIENTS:
+        if cfbd is None:
+            raise RuntimeError(
+                "cfbd is not installed. Install it or run with --replay and a fixture archive."
+            )
+        configuration = cfbd.Configuration(
+            host=cfbd_host(),
+            access_token=os.getenv("CFBD_API_KEY"),
+        )
+        client_class = getattr(cfbd, API_CLIENT_CLASSES[name])
+        API_CLIENTS[name] = client_class(cfbd.ApiClient(configuration))
+    return API_CLIENTS[name]
+
 
-    all_results = []
-    for week in range(start_week, end_week + 1):
-        week_kwargs = kwargs.copy()
-        week_kwargs["week"] = week
-        try:
-            results = api_function(**week_kwargs)
-            all_results.extend(results)
-        except:
-            try:
-                results = api_function(**kwargs)
-            except ApiException as e:
-                print(f"API Exception for week {week}: {e}")
+def set_api_clients(**clients):
+    """Use the given objects as CFBD API clients, keyed like API_CLIENT_CLASSES"""
+    API_CLIENTS.update(clients)
 
-    return all_results
 
+def api_method(client_name, method_name):
+    def call(**params):
+        return getattr(api_client(client_name), method_name)(**params)
 
-def get_team_record(team_name, year, start_week=1, end_week=56):
-    """Get a team's overall record for a given year and week range"""
-    games = api_call_with_week_range(
-        games_api.get_games, start_week, end_week, year=year, team=team_name
+    return call
+
+
+def stored_api_call(endpoint, api_function, ttl_seconds, **params):
+    """Call the CFBD API through the shared response store"""
+    records = response_store.fetch(
+        endpoint, params, api_throttle.wrap(api_function), ttl_seconds
     )
-    wins = 0
-    losses = 0
+    return [record_to_object(record) for record in records]
 
-    for game in games:
-        if (
-            hasattr(game, "home_points")
-            and hasattr(game, "away_points")
-            and game.home_points is not None
-            and game.away_points is not None
-        ):
-            if game.home_team == team_name:
-                if game.home_points > game.away_points:
-                    wins += 1
-                else:
-                    losses += 1
-            else:
-                if game.away_points > game.home_points:
-                    wins += 1
-                else:
-                    losses += 1
 
-    return wins, losses
+def stored_games(**params):
+    return stored_api_call(
+        "games",
+        api_method("games", "get_games"),
+        season_ttl_seconds(params["year"]),
+        **params,
+    )
 
 
-def get_team_conference_record(team_name, conference, year, start_week=1, end_week=56):
-    """Get a team's conference record for a given year and week range"""
-    games = api_call_with_week_range(
-        games_api.get_games, start_week, end_week, year=year, team=team_name
+def stored_team_stats(**params):
+    return stored_api_call(
+        "stats/season",
+        api_method("stats", "get_team_stats"),
+        season_ttl_seconds(params["year"]),
+        **params,
     )
-    conf_wins = 0
-    conf_losses = 0
 
-    for game in games:
-        if (
-            hasattr(game, "home_points")
-            and hasattr(game, "away_points")
-            and game.home_points is not None
-            and game.away_points is not None
-        ):
-            # Check if this is a conference game
-            is_conf_game = False
-
-            if game.home_team == team_name:
-                if (
-                    hasattr(game, "away_conference")
-                    and game.away_conference
-                    and game.away_conference.lower() == conference
-                ):
-                    is_conf_game = True
-                    if game.home_points > game.away_points:
-                        conf_wins += 1
-                    else:
-                        conf_losses += 1
-            else:
-                if (
-                    hasattr(game, "home_conference")
-                    and game.home_conference
-                    and game.home_conference.lower() == conference
-                ):
-                    is_conf_game = True
-                    if game.away_points > game.home_points:
-                        conf_wins += 1
-                    else:
-                        conf_losses += 1
 
-    return conf_wins, conf_losses
+def season_game_index(year):
+    """Pull a season's games in bulk once per run and index them by team and week"""
+    year = int(year)
+    if year not in SEASON_GAME_INDEXES:
+        print(f"Pulling all {year} games...")
+        SEASON_GAME_INDEXES[year] = load_season_games(stored_games, year)
+    return SEASON_GAME_INDEXES[year]
+
+
+def season_stat_matrix(year, start_week=1, end_week=56):
+    """Pull every team's stats for the week range in one call, as a team x stat matrix"""
+    key = (int(year), start_week, end_week)
+    if key not in SEASON_STAT_MATRICES:
+        print(f"Pulling {year} team stats...")
+        SEASON_STAT_MATRICES[key] = load_team_stat_matrix(
+            stored_team_stats, year, start_week, end_week
+        )
+    return SEASON_STAT_MATRICES[key]
+
+
+def fbs_teams(year):
+    """Get the FBS teams for a given year, once per run"""
+    year = int(year)
+    if year not in SEASON_TEAMS:
+        SEASON_TEAMS[year] = stored_api_call(
+            "teams/fbs",
+            api_method("teams", "get_fbs_teams"),
+            season_ttl_seconds(year),
+            year=year,
+        )
+    return SEASON_TEAMS[year]
+
+
+def season_team_records(year, start_week=1, end_week=56):
+    """Aggregate every FBS team's record for a given year and week range in one pass over the games"""
+    key = (int(year), start_week, end_week)
+    if key not in SEASON_TEAM_RECORDS:
+        team_conferences = {
+            team.school: team.conference.lower()
+            for team in fbs_teams(year)
+            if hasattr(team, "school") and hasattr(team, "conference")
+        }
+        games = season_game_index(year).games(start_week, end_week)
+        SEASON_TEAM_RECORDS[key] = aggregate_team_records(games, team_conferences)
+        SEASON_GAME_IDS[key] = {g.id for g in games if game_has_score(g)}
+    return SEASON_TEAM_RECORDS[key]
 
 
 def get_conference_champions(year, start_week=1, end_week=56):
     """Get conference champions for a given year and week range"""
+    if int(year) in CONFERENCE_CHAMPIONS:
+        return CONFERENCE_CHAMPIONS[int(year)]
+
     champions = {}
     conferences = [
         conf.name.lower()
-        for conf in conferences_api.get_conferences()
+        for conf in stored_api_call(
+            "conferences",
+            api_method("conferences", "get_conferences"),
+            REFERENCE_TTL_SECONDS,
+        )
         if hasattr(conf, "classification") and conf.classification == "fbs"
     ]
 
     # First try to get conference championship games
     print("Making API call...")
-    postseason_games = games_api.get_games(year=year, classification="fbs")
+    postseason_games = stored_games(year=year, classification="fbs")
     print("Processing API response")
 
     # Filter for conference championship games
@@ -345,22 +472,105 @@ def get_conference_champions(year, start_week=1, end_week=56):
                     champions[conf_name] = game.away_team
                 print(f"Found {conf_name} champ {champions[conf_name]}")
 
+    CONFERENCE_CHAMPIONS[int(year)] = champions
     return champions
 
 
+def conference_tally_file(year, start_week, end_week):
+    """Path of the persisted conference tallies for a season and week range"""
+    return os.path.join(
+        "data_exports",
+        "cache",
+        f"conference_tallies_{year}_w{start_week}-{end_week}.json",
+    )
+
+
+def conference_tally_rows(conf_objects):
+    return [
+        {
+            "name": conf.name,
+            "p5": conf.p5,
+            "cvc_wins": conf.cvc_wins,
+            "cvc_losses": conf.cvc_losses,
+            "cvc_perc": conf.cvc_perc,
+        }
+        for conf in conf_objects.values()
+    ]
+
+
+def save_conference_tallies(year, start_week, end_week):
+    conf_objects, mean_games_played = CONFERENCE_TALLIES[(year, start_week, end_week)]
+    tally_file = conference_tally_file(year, start_week, end_week)
+    os.makedirs(os.path.dirname(tally_file), exist_ok=True)
+    with open(tally_file, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "year": year,
+                "start_week": start_week,
+                "end_week": end_week,
+                "mean_games_played": float(mean_games_played),
+                "conference_tallies": conference_tally_rows(conf_objects),
+            },
+            f,
+        )
+    print(f"Saved {year} conference tallies to {tally_file}")
+
+
+def load_conference_tallies(year, start_week, end_week):
+    tally_file = conference_tally_file(year, start_week, end_week)
+    if not os.path.exists(tally_file):
+        return None
+    try:
+        with open(tally_file, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        conf_objects = {
+            c["name"]: My_Conf(**c) for c in saved["conference_tallies"]
+        }
+        mean_games_played = saved["mean_games_played"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    print(f"Loaded {year} conference tallies from {tally_file}")
+    return [conf_objects, mean_games_played]
+
+
 def conference_rankings(year, start_week=1, end_week=56):
-    """Compute conference rankings for a given year and week range"""
+    """Compute conference rankings for a given year and week range
+
+    Finished seasons are computed once and then read back from disk.
+    """
+    key = (int(year), start_week, end_week)
+    if key in CONFERENCE_TALLIES:
+        return CONFERENCE_TALLIES[key]
+
+    finished = season_is_finished(year)
+    if finished and use_local_caches:
+        saved = load_conference_tallies(*key)
+        if saved is not None:
+            CONFERENCE_TALLIES[key] = saved
+            return saved
+
+    teams = fbs_teams(year)
+    team_records = season_team_records(year, start_week, end_week)
+
+    print(f"\n-->considering conferences in {year} (weeks {start_week}-{end_week})")
+
+    CONFERENCE_TALLIES[key] = conference_tallies_from_records(
+        year, teams, team_records, show_progress=True
+    )
+    if finished:
+        save_conference_tallies(*key)
+    return CONFERENCE_TALLIES[key]
+
+
+def conference_tallies_from_records(year, teams, team_records, show_progress=False):
+    """Sum each conference's out-of-conference wins and losses from team records"""
     conf_objects = {}
     games_played = []
 
-    teams = teams_api.get_fbs_teams(year=year)
-
     power5 = ["acc", "big ten", "big 12", "pac 12", "sec"]
     if int(year) < 2005:
         power5 = ["acc", "big ten", "big 12", "pac 10", "sec", "big east"]
 
-    print(f"\n-->considering conferences in {year} (weeks {start_week}-{end_week})")
-
     for i_it, team in enumerate(teams):
         if hasattr(team, "conference"):
             conference = team.conference.lower()
@@ -373,11 +583,10 @@ def conference_rankings(year, start_week=1, end_week=56):
                 this_conf = My_Conf(name=conference, p5=is_p5)
                 conf_objects.update({conference: this_conf})
 
-            # Get team records directly from games
-            wins, losses = get_team_record(team.school, year, start_week, end_week)
-            conf_wins, conf_losses = get_team_conference_record(
-                team.school, conference, year, start_week, end_week
-            )
+            # Get team records from the single-pass aggregation
+            record = team_records[team.school]
+            wins, losses = record.wins, record.losses
+            conf_wins, conf_losses = record.conf_wins, record.conf_losses
 
             games_played.append(float(wins + losses))
 
@@ -395,23 +604,162 @@ def conference_rankings(year, start_week=1, end_week=56):
             conf_objects[conference].cvc_perc = OOC_perc
 
             # Update progress bar
-            progress = (i_it + 1) / len(teams)
-            update_progress(progress)
+            if show_progress:
+                progress = (i_it + 1) / len(teams)
+                update_progress(progress)
 
     mean_games_played = np.mean(games_played) if games_played else 0
 
     return [conf_objects, mean_games_played]
 
 
+def ranking_state_file(year, start_week):
+    """Path of the incremental ranking state for a season and start week"""
+    return os.path.join(
+        "data_exports", "cache", f"ranking_state_{year}_from_w{start_week}.json"
+    )
+
+
+def save_ranking_state(year, start_week, end_week, conf_champions):
+    """Persist team accumulators and conference tallies behind this run's snapshot
+
+    A finished season whose tallies came from disk has no records to save;
+    it is left out and read back from its tally file instead.
+    """
+    seasons = {}
+    for season in (year - 1, year):
+        key = (season, start_week, end_week)
+        if key not in SEASON_TEAM_RECORDS or key not in CONFERENCE_TALLIES:
+            if season_is_finished(season) and key in CONFERENCE_TALLIES:
+                continue
+            return None
+        seasons[str(season)] = {
+            "teams": [
+                {"id": t.id, "school": t.school, "conference": t.conference}
+                for t in fbs_teams(season)
+                if hasattr(t, "id") and hasattr(t, "school") and hasattr(t, "conference")
+            ],
+            "records": [asdict(r) for r in SEASON_TEAM_RECORDS[key].values()],
+            "conference_tallies": conference_tally_rows(CONFERENCE_TALLIES[key][0]),
+            "game_ids": sorted(SEASON_GAME_IDS.get(key, set())),
+        }
+
+    state = {
+        "version": RANKING_STATE_VERSION,
+        "year": year,
+        "start_week": start_week,
+        "through_week": end_week,
+        "conference_champions": conf_champions,
+        "seasons": seasons,
+    }
+    state_file = ranking_state_file(year, start_week)
+    os.makedirs(os.path.dirname(state_file), exist_ok=True)
+    with open(state_file, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    print(f"Saved incremental ranking state to {state_file}")
+    return state_file
+
+
+def apply_delta_games(records, conf_objects, game_ids, games):
+    """Fold newly completed games into team records and conference OOC tallies"""
+    new_games = [g for g in games if game_has_score(g) and g.id not in game_ids]
+    before = {
+        team: (r.wins - r.conf_wins, r.losses - r.conf_losses)
+        for team, r in records.items()
+    }
+    add_games_to_records(records, new_games)
+
+    for team, record in records.items():
+        OOC_W = (record.wins - record.conf_wins) - before[team][0]
+        OOC_L = (record.losses - record.conf_losses) - before[team][1]
+        if OOC_W or OOC_L:
+            conf_objects[record.conference].cvc_wins += OOC_W
+            conf_objects[record.conference].cvc_losses += OOC_L
+
+    game_ids.update(g.id for g in new_games)
+    return len(new_games)
+
+
+def prime_from_ranking_state(
+    year, start_week, end_week, max_workers=DEFAULT_MAX_WORKERS
+):
+    """Load the last snapshot's accumulators and apply only the games since then
+
+    Weeks from the snapshot's last week onward are re-pulled so games that
+    finished after the snapshot was taken are still picked up.
+    """
+    state_file = ranking_state_file(year, start_week)
+    if not os.path.exists(state_file):
+        print(f"No incremental state at {state_file}; running a full refresh.")
+        return False
+
+    with open(state_file, "r", encoding="utf-8") as f:
+        state = json.load(f)
+
+    through_week = state.get("through_week")
+    if (
+        state.get("version") != RANKING_STATE_VERSION
+        or state.get("year") != year
+        or state.get("start_week") != start_week
+        or through_week is None
+        or through_week > end_week
+    ):
+        print(f"Incremental state at {state_file} does not cover this run; running a full refresh.")
+        return False
+
+    delta_weeks = range(max(start_week, through_week), end_week + 1)
+    for season in (year - 1, year):
+        season_state = state["seasons"].get(str(season))
+        if season_state is None:
+            # Finished seasons are read from their conference tally file
+            continue
+        key = (season, start_week, end_week)
+
+        teams = [SimpleNamespace(**t) for t in season_state["teams"]]
+        records = {r["team"]: TeamRecord(**r) for r in season_state["records"]}
+        conf_objects = {c["name"]: My_Conf(**c) for c in season_state["conference_tallies"]}
+        game_ids = set(season_state["game_ids"])
+
+        # Weekly pulls run concurrently; games are applied in week order
+        weekly_games = fetch_all(
+            stored_games,
+            [
+                {"year": season, "week": week, "season_type": "regular"}
+                for week in delta_weeks
+            ],
+            max_workers=max_workers,
+        )
+        applied = 0
+        for games in weekly_games:
+            applied += apply_delta_games(records, conf_objects, game_ids, games)
+        print(f"Applied {applied} new {season} games from weeks {delta_weeks.start}-{end_week}")
+
+        games_played = [float(r.wins + r.losses) for r in records.values()]
+        SEASON_TEAMS[season] = teams
+        SEASON_TEAM_RECORDS[key] = records
+        SEASON_GAME_IDS[key] = game_ids
+        CONFERENCE_TALLIES[key] = [
+            conf_objects,
+            np.mean(games_played) if games_played else 0,
+        ]
+
+    CONFERENCE_CHAMPIONS[year - 1] = state.get("conference_champions") or {}
+    return True
+
+
 def total_conference_rankings(today_year, start_week=1, end_week=56):
     """Calculate total conference rankings combining previous and current year data"""
-    combined_conf_objects = {}
-
     # First, establish conference stats for previous season
     last_year = conference_rankings(today_year - 1, start_week, end_week)
-    LY_confs = last_year[0]
-
     this_year = conference_rankings(today_year, start_week, end_week)
+    return combine_conference_tallies(last_year, this_year, verbose=True)
+
+
+def combine_conference_tallies(last_year, this_year, verbose=False):
+    """Weight last season's conference tallies against this season's and rank the conferences"""
+    combined_conf_objects = {}
+
+    LY_confs = last_year[0]
     TY_confs = this_year[0]
     TY_games = this_year[1]
 
@@ -432,10 +780,11 @@ def total_conference_rankings(today_year, start_week=1, end_week=56):
         combined_conf_objects.update({conference: this_conf})
 
     # Add data for this year's wins and losses with proper This Year weights
-    print(
-        f"\nTeams have played an average of {round(TY_games,2)} this year, so last year is weighted by {round(LYW,2)}"
-    )
-    print("\n-->computing W/L stats between conferences...")
+    if verbose:
+        print(
+            f"\nTeams have played an average of {round(TY_games,2)} this year, so last year is weighted by {round(LYW,2)}"
+        )
+        print("\n-->computing W/L stats between conferences...")
 
     for i_it, conference in enumerate(TY_confs):
         that_conf = TY_confs[conference]
@@ -463,8 +812,9 @@ def total_conference_rankings(today_year, start_week=1, end_week=56):
             this_conf.p5 = False
 
         # Update progress bar
-        progress = (i_it + 1) / len(TY_confs)
-        update_progress(progress)
+        if verbose:
+            progress = (i_it + 1) / len(TY_confs)
+            update_progress(progress)
 
     # Now, rank them
     myconfs = []
@@ -478,6 +828,15 @@ def total_conference_rankings(today_year, start_week=1, end_week=56):
     return sorted_confs
 
 
+def apply_team_table(team_object_list, team_table, columns):
+    """Copy columns computed by the SPI engine back onto the matching team objects"""
+    for tm_obj, values in zip(
+        team_object_list, team_table[columns].itertuples(index=False)
+    ):
+        for column, value in zip(columns, values):
+            setattr(tm_obj, column, value)
+
+
 def display_and_save(SPI_final_rankings, conf_rankings, week_suffix=""):
     """Display rankings and save to CSV"""
     rankings_database = {}
@@ -582,7 +941,7 @@ def display_and_save(SPI_final_rankings, conf_rankings, week_suffix=""):
 def main():
     args = parse_arguments()
 
-    global todays_datetime, today_year
+    global todays_datetime, today_year, api_throttle, response_store, use_local_caches
 
     if args.date:
         todays_datetime = datetime.fromisoformat(args.date)
@@ -600,6 +959,12 @@ def main():
 
     start_week = args.start_week
     end_week = args.end_week
+    api_throttle = ApiThrottle(requests_per_second=args.requests_per_second)
+    if args.replay:
+        response_store = ReplayStore(args.replay)
+    elif args.record:
+        response_store = RecordingStore(response_store, args.record)
+    use_local_caches = not (args.record or args.replay)
 
     week_suffix = (
         f"_w{start_week}-{end_week}" if start_week != 1 or end_week != 56 else ""
@@ -625,6 +990,16 @@ def main():
 
     os.makedirs("data_exports", exist_ok=True)
 
+    if args.incremental and not use_local_caches:
+        print("Incremental mode is off with --record/--replay; running a full refresh.")
+    elif args.incremental:
+        if week_suffix:
+            prime_from_ranking_state(
+                today_year, start_week, end_week, max_workers=args.max_workers
+            )
+        else:
+            print("Incremental mode needs an explicit --end_week; running a full refresh.")
+
     print("Getting last year's conference champs...")
     conf_champions_file = os.path.join(
         "data_exports", f"conference_champions_{today_year-1}{week_suffix}.csv"
@@ -646,7 +1021,7 @@ def main():
     for conf, champ in conf_champions.items():
         print(f"  {conf}: {champ}")
 
-    N_raw_list = []
+    team_rows = []
     team_objects = {}
     team_objects_by_name = {}
     team_object_list = []
@@ -655,7 +1030,8 @@ def main():
     dashes()
     spaced('COMPUTING "NATURE" STATISTIC...')
 
-    teams = teams_api.get_fbs_teams(year=today_year)
+    teams = fbs_teams(today_year)
+    team_records = season_team_records(today_year, start_week, end_week)
 
     # Save teams data
     teams_file = os.path.join("data_exports", f"teams_{today_year}{week_suffix}.csv")
@@ -667,6 +1043,8 @@ def main():
     pd.DataFrame(teams_data).to_csv(teams_file, index=False)
     print(f"Saved {len(teams_data)} teams to {teams_file}")
 
+    stat_matrix = season_stat_matrix(today_year, start_week, end_week)
+
     for i_it, team in enumerate(teams):
         if hasattr(team, "school") and hasattr(team, "conference"):
             # Set up name, abbreviation, conference
@@ -676,142 +1054,17 @@ def main():
             if conference not in team_objects:
                 team_objects.update({conference: []})
 
-            # Get team stats with week range
-            team_stats = api_call_with_week_range(
-                stats_api.get_team_stats,
-                start_week,
-                end_week,
-                year=today_year,
-                team=team.school,
-            )
-            stats = {}
-            if team_stats:
-                for stat in team_stats:
-                    if hasattr(stat, "stat_name") and hasattr(stat, "stat_value"):
-                        if hasattr(stat.stat_value, "actual_instance"):
-                            stats[stat.stat_name] = stat.stat_value.actual_instance
-                        else:
-                            stats[stat.stat_name] = stat.stat_value
-
-            # Get games and calculate points and record with week range
-            games = api_call_with_week_range(
-                games_api.get_games,
-                start_week,
-                end_week,
-                year=today_year,
-                team=team.school,
-            )
+            stats = stat_matrix.team_stats(team_fullname)
 
-            G = float(
-                len(
-                    [
-                        g
-                        for g in games
-                        if hasattr(g, "home_points")
-                        and hasattr(g, "away_points")
-                        and g.home_points is not None
-                        and g.away_points is not None
-                    ]
-                )
-            )
+            # Points and record come from the single-pass game aggregation
+            record = team_records[team.school]
+            P = record.points
+            wins = record.wins
+            losses = record.losses
+            conf_wins = record.conf_wins
+            conf_losses = record.conf_losses
 
-            # Calculate points scored and allowed directly from games
-            P = 0.0
-            PA = 0.0
-            wins = 0
-            losses = 0
-            conf_wins = 0
-            conf_losses = 0
-
-            for game in games:
-                if (
-                    hasattr(game, "home_points")
-                    and hasattr(game, "away_points")
-                    and game.home_points is not None
-                    and game.away_points is not None
-                ):
-                    if game.home_team == team.school:
-                        P += game.home_points
-                        PA += game.away_points
-                        if game.home_points > game.away_points:
-                            wins += 1
-                            if (
-                                hasattr(game, "away_conference")
-                                and game.away_conference
-                                and game.away_conference.lower() == conference
-                            ):
-                                conf_wins += 1
-                        else:
-                            losses += 1
-                            if (
-                                hasattr(game, "away_conference")
-                                and game.away_conference
-                                and game.away_conference.lower() == conference
-                            ):
-                                conf_losses += 1
-                    else:
-                        P += game.away_points
-                        PA += game.home_points
-                        if game.away_points > game.home_points:
-                            wins += 1
-                            if (
-                                hasattr(game, "home_conference")
-                                and game.home_conference
-                                and game.home_conference.lower() == conference
-                            ):
-                                conf_wins += 1
-                        else:
-                            losses += 1
-                            if (
-                                hasattr(game, "home_conference")
-                                and game.home_conference
-                                and game.home_conference.lower() == conference
-                            ):
-                                conf_losses += 1
-
-            # Calculate average margin
-            A = ave_margin(G, P, PA)
-
-            # Offensive touchdowns
-            passTD = team_stat(stats.get("passingTDs", 0))
-            rushTD = team_stat(stats.get("rushingTDs", 0))
-            TD = passTD + rushTD
-
-            # Defensive touchdowns - use only what's available
-            interceptionTDs = team_stat(stats.get("interceptionTDs", 0))
-            puntReturnTDs = team_stat(stats.get("puntReturnTDs", 0))
-            kickReturnTDs = team_stat(stats.get("kickReturnTDs", 0))
-
-            # Calculate defensive TDs as sum of INT TDs and return TDs
-            defensiveTDs = interceptionTDs + puntReturnTDs + kickReturnTDs
-            defensivePoints = defensiveTDs * 6  # 6 points per TD
-
-            # For TDs allowed, we'll use what we know: points allowed
-            # Each TD is worth 6 points (plus potential PAT)
-            # We'll use this as a proxy for TDs allowed
-            TDA = (
-                PA / 7.0
-            )  # Rough approximation of total TDs allowed (7 points per TD with PAT)
-
-            # Turnovers
-            INTf = team_stat(stats.get("interceptions", 0))  # Interceptions by defense
-            Ff = team_stat(stats.get("fumblesRecovered", 0))  # Fumbles recovered
-            TO_forced = INTf + Ff
-
-            INT = team_stat(stats.get("passesIntercepted", 0))  # Interceptions thrown
-            Fumbles = team_stat(stats.get("fumblesLost", 0))  # Fumbles lost
-            TO_allowed = INT + Fumbles
-
-            TM = TO_forced - TO_allowed  # Turnover margin
-
-            # First downs
-            FIRST_DOWNS = team_stat(stats.get("firstDowns", 0))
-
-            # We don't have opponent first downs directly, so we'll use 0
-            OPP_FIRST_DOWNS = 0.0
-
-            # Compute Nature statistic
-            N_raw = Nature(A, TD, P, TDA, PA, TM, G, FIRST_DOWNS, OPP_FIRST_DOWNS)
+            TD, TM = touchdowns_and_turnover_margin(stats)
 
             # Check if team was conference champion last year
             conf_champ = (
@@ -827,8 +1080,6 @@ def main():
                 conf_losses=conf_losses,
                 conf_name=conference,
                 conf_champ=conf_champ,
-                N_raw=N_raw,
-                ave_margin=A,
                 points=P,
             )
 
@@ -837,20 +1088,24 @@ def main():
             team_object_list.append(team_obj)
             team_objects_by_name.update({team_fullname: team_obj})
 
-            # Add raw Nature stat for rescaling
-            N_raw_list.append(team_obj.N_raw)
+            # Add the team's row to the columnar team table
+            team_rows.append(team_table_row(record, conf_champ, TD, TM))
 
             # Update progress bar
             progress = (i_it + 1) / len(teams)
             update_progress(progress)
 
-    # Compute N_adj for all teams
-    N_raw_max = np.amax(N_raw_list) if N_raw_list else 1.0
-
-    for team_object in team_object_list:
-        team_object.N_adj = team_object.N_raw / N_raw_max
+    # Compute N_raw and N_adj for all teams at once
+    team_table = pd.DataFrame(team_rows, columns=spi_engine.TEAM_TABLE_COLUMNS)
+    game_table = spi_engine.build_game_table(
+        {obj.name: team_records[obj.name] for obj in team_object_list}
+    )
+    team_table = spi_engine.nature_components(team_table)
+    apply_team_table(team_object_list, team_table, ["ave_margin", "N_raw", "N_adj"])
 
-    N_adj_rankings = sorted(team_object_list, key=attrgetter("N_adj"), reverse=True)
+    N_adj_rankings = [
+        team_object_list[i] for i in spi_engine.ranking_order(team_table["N_adj"])
+    ]
 
     # Save Nature statistics to CSV
     nature_file = os.path.join(
@@ -901,7 +1156,6 @@ def main():
     spaced("RANKING CONFERENCES...")
 
     sorted_confs = total_conference_rankings(today_year, start_week, end_week)
-    conference_database = {conf_obj.name: conf_obj for conf_obj in sorted_confs}
 
     # Save conference rankings
     conf_file = os.path.join(
@@ -953,30 +1207,17 @@ def main():
         conf_obj.conf_index = ranking_index
 
     # Compute Team in-Conference Index for each team
+    conference_index = {
+        conf_obj.name: conf_obj.conf_index for conf_obj in sorted_confs
+    }
+    team_table = spi_engine.standing_components(team_table, conference_index)
+    apply_team_table(
+        team_object_list,
+        team_table,
+        ["standing_index", "conf_position", "conf_index", "overall_index"],
+    )
     for conference in team_objects:
-        conf_team_list = team_objects[conference]
-        conf_sorted_teams = multisort(
-            conf_team_list,
-            (
-                ("conf_champ", True),
-                ("conf_wins", True),
-                ("conf_losses", False),
-                ("ave_margin", True),
-                ("points", True),
-            ),
-        )
-
-        for index, tm_obj in enumerate(conf_sorted_teams):
-            ranking_index = 1.0 - (float(index) / float(len(conf_sorted_teams)))
-            tm_obj.standing_index = ranking_index
-
-        for tm_obj in conf_sorted_teams:
-            if conference in conference_database:
-                tm_obj.conf_index = conference_database[conference].conf_index
-                tm_obj.overall_index = tm_obj.conf_index * tm_obj.standing_index
-            else:
-                tm_obj.conf_index = 0.0
-                tm_obj.overall_index = 0.0
+        team_objects[conference].sort(key=attrgetter("conf_position"))
 
     # Save team standings within conferences
     standings_file = os.path.join(
@@ -1027,75 +1268,12 @@ def main():
     skips()
     spaced("COMPUTING STRENGTH OF RECORD...")
 
-    SOR_raw_list = []
-    teams = teams_api.get_fbs_teams(year=today_year)
+    team_table = spi_engine.sor_components(team_table, game_table)
+    apply_team_table(team_object_list, team_table, ["SOR_raw", "SOR_adj"])
 
-    for i_it, team in enumerate(teams):
-        if hasattr(team, "school"):
-            team_fullname = team.school
-
-            if team_fullname in team_objects_by_name:
-                team_object = team_objects_by_name[team_fullname]
-
-                games = api_call_with_week_range(
-                    games_api.get_games,
-                    start_week,
-                    end_week,
-                    year=today_year,
-                    team=team.school,
-                )
-
-                WCC = []
-                LCC = []
-
-                for game in games:
-                    if (
-                        hasattr(game, "home_points")
-                        and hasattr(game, "away_points")
-                        and game.home_points is not None
-                        and game.away_points is not None
-                    ):
-                        if game.home_team == team.school:
-                            opp_id = game.away_team
-                            win = game.home_points > game.away_points
-                        else:
-                            opp_id = game.home_team
-                            win = game.away_points > game.home_points
-
-                        # Find opponent team
-                        if opp_id in team_objects_by_name:
-                            opp_object = team_objects_by_name[opp_id]
-                            oppCc = opp_object.overall_index
-                        else:
-                            oppCc = 0.0
-
-                        if win:
-                            WCC.append(oppCc)
-                        else:
-                            LCC.append(oppCc)
-
-                team_object.winsCC = WCC
-                team_object.lossesCC = LCC
-                SOR_raw = SOR_calc(WCC, LCC)
-
-                team_object.SOR_raw = SOR_raw
-                SOR_raw_list.append(team_object.SOR_raw)
-
-            # Update progress bar
-            progress = (i_it + 1) / len(teams)
-            update_progress(progress)
-
-    # Compute SOR_adj for all teams
-    SOR_raw_max = np.amax(SOR_raw_list) if SOR_raw_list else 1.0
-
-    for team_object in team_object_list:
-        if hasattr(team_object, "SOR_raw"):
-            team_object.SOR_adj = team_object.SOR_raw / SOR_raw_max
-        else:
-            team_object.SOR_raw = 0.0
-            team_object.SOR_adj = 0.0
-
-    SOR_adj_rankings = sorted(team_object_list, key=attrgetter("SOR_adj"), reverse=True)
+    SOR_adj_rankings = [
+        team_object_list[i] for i in spi_engine.ranking_order(team_table["SOR_adj"])
+    ]
 
     # Save SOR data
     sor_file = os.path.join("data_exports", f"sor_stats_{today_year}{week_suffix}.csv")
@@ -1141,10 +1319,12 @@ def main():
     dashes()
     spaced("SICILIAN POWER INDEX RANKINGS:")
 
-    for team_object in team_object_list:
-        team_object.SPI = SPI_calc(team_object.SOR_adj, team_object.N_adj)
+    team_table = spi_engine.spi_components(team_table)
+    apply_team_table(team_object_list, team_table, ["SPI"])
 
-    SPI_final_rankings = sorted(team_object_list, key=attrgetter("SPI"), reverse=True)
+    SPI_final_rankings = [
+        team_object_list[i] for i in spi_engine.ranking_order(team_table["SPI"])
+    ]
 
     # Save final SPI rankings
     spi_file = os.path.join(
@@ -1169,6 +1349,10 @@ def main():
     # Display and save results
     display_and_save(SPI_final_rankings, sorted_confs, week_suffix)
 
+    # Persist accumulators so the next week's run can be incremental
+    if week_suffix:
+        save_ranking_state(today_year, start_week, end_week, conf_champions)
+
     # Create a comparison of different ranking methods
     comparison_file = os.path.join(
         "data_exports", f"rankings_comparison_{today_year}{week_suffix}.csv"
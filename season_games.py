@@ -0,0 +1,195 @@
+"""Season-level CFBD game ingestion and in-memory game indexes."""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+SEASON_TYPES = ("regular", "postseason")
+FIRST_WEEK = 1
+LAST_WEEK = 56
+
+
+def game_has_score(game) -> bool:
+    return (
+        hasattr(game, "home_points")
+        and hasattr(game, "away_points")
+        and game.home_points is not None
+        and game.away_points is not None
+    )
+
+
+def _game_week(game) -> Optional[int]:
+    week = getattr(game, "week", None)
+    try:
+        return int(week) if week is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_full_week_range(start_week: int, end_week: int) -> bool:
+    return start_week == FIRST_WEEK and end_week == LAST_WEEK
+
+
+class SeasonGameIndex:
+    """All games of one season, indexed by season type, team and week.
+
+    Games are kept in API order so per-team lookups return them in the same
+    order a ``get_games(year=..., team=...)`` call would.
+    """
+
+    def __init__(self, year: int):
+        self.year = int(year)
+        self._games: Dict[str, List] = {}
+        self._by_team: Dict[Tuple[str, str], List[Tuple[Optional[int], object]]] = {}
+
+    def add_games(self, season_type: str, games: Iterable) -> None:
+        season_games = self._games.setdefault(season_type, [])
+        for game in games:
+            season_games.append(game)
+            week = _game_week(game)
+            for team in (getattr(game, "home_team", None), getattr(game, "away_team", None)):
+                if not team:
+                    continue
+                self._by_team.setdefault((season_type, team), []).append((week, game))
+
+    def season_types(self) -> List[str]:
+        return list(self._games)
+
+    def games(
+        self,
+        start_week: int = FIRST_WEEK,
+        end_week: int = LAST_WEEK,
+        season_type: str = "regular",
+    ) -> List:
+        games = self._games.get(season_type, [])
+        if is_full_week_range(start_week, end_week):
+            return list(games)
+        return [
+            g
+            for g in games
+            if _game_week(g) is not None and start_week <= _game_week(g) <= end_week
+        ]
+
+    def team_games(
+        self,
+        team: str,
+        start_week: int = FIRST_WEEK,
+        end_week: int = LAST_WEEK,
+        season_type: str = "regular",
+    ) -> List:
+        entries = self._by_team.get((season_type, team), [])
+        if is_full_week_range(start_week, end_week):
+            return [game for _, game in entries]
+        return [
+            game
+            for week, game in entries
+            if week is not None and start_week <= week <= end_week
+        ]
+
+    def weeks(self, season_type: str = "regular") -> List[int]:
+        weeks = {_game_week(g) for g in self._games.get(season_type, [])}
+        weeks.discard(None)
+        return sorted(weeks)
+
+
+def load_season_games(
+    get_games: Callable[..., Iterable],
+    year: int,
+    season_types: Iterable[str] = SEASON_TYPES,
+) -> SeasonGameIndex:
+    """Pull a whole season with one ``get_games(year=..., season_type=...)`` call per season type."""
+    index = SeasonGameIndex(year)
+    for season_type in season_types:
+        index.add_games(season_type, get_games(year=int(year), season_type=season_type))
+    return index
+
+
+@dataclass
+class TeamRecord:
+    """Everything the ranking stages need from one team's completed games."""
+
+    team: str
+    conference: str
+    games: int = 0
+    wins: int = 0
+    losses: int = 0
+    conf_wins: int = 0
+    conf_losses: int = 0
+    points: float = 0.0
+    points_allowed: float = 0.0
+    win_opponents: List[str] = field(default_factory=list)
+    loss_opponents: List[str] = field(default_factory=list)
+
+    def add_game(self, points: float, points_allowed: float, opponent: str, opponent_conference) -> None:
+        self.games += 1
+        self.points += points
+        self.points_allowed += points_allowed
+        is_conf_game = bool(opponent_conference) and opponent_conference.lower() == self.conference
+        # Ties count as losses, as they always have in the ranking pipeline.
+        if points > points_allowed:
+            self.wins += 1
+            self.win_opponents.append(opponent)
+            if is_conf_game:
+                self.conf_wins += 1
+        else:
+            self.losses += 1
+            self.loss_opponents.append(opponent)
+            if is_conf_game:
+                self.conf_losses += 1
+
+
+def aggregate_team_records(
+    games: Iterable,
+    team_conferences: Dict[str, str],
+) -> Dict[str, TeamRecord]:
+    """Walk each completed game once and build a ``TeamRecord`` per team.
+
+    ``team_conferences`` maps school name to lower-cased conference name and
+    decides which teams get a record; records come back in that order.
+    """
+    records = {
+        team: TeamRecord(team=team, conference=conference)
+        for team, conference in team_conferences.items()
+    }
+    add_games_to_records(records, games)
+    return records
+
+
+def add_games_to_records(records: Dict[str, TeamRecord], games: Iterable) -> None:
+    """Fold completed games into existing ``TeamRecord`` accumulators."""
+    for game in games:
+        if not game_has_score(game):
+            continue
+        home = records.get(game.home_team)
+        if home is not None:
+            home.add_game(
+                game.home_points,
+                game.away_points,
+                game.away_team,
+                getattr(game, "away_conference", None),
+            )
+        away = records.get(game.away_team)
+        if away is not None:
+            away.add_game(
+                game.away_points,
+                game.home_points,
+                game.home_team,
+                getattr(game, "home_conference", None),
+            )
+
+
+def fold_games_by_week(
+    records: Dict[str, TeamRecord],
+    games: Iterable,
+    weeks: Iterable[int],
+) -> Iterator[Tuple[int, Dict[str, TeamRecord]]]:
+    """Fold games into ``records`` one week at a time, yielding after each of ``weeks``.
+
+    ``weeks`` must be ascending. Each yield is a cumulative as-of-week view;
+    the same accumulators keep changing, so use it before advancing.
+    """
+    by_week: Dict[Optional[int], List] = {}
+    for game in games:
+        by_week.setdefault(_game_week(game), []).append(game)
+    for week in weeks:
+        add_games_to_records(records, by_week.get(week, []))
+        yield week, records
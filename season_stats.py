@@ -0,0 +1,119 @@
+"""Season-level CFBD team stats held as a team x stat matrix."""
+
+from typing import Callable, Dict, Iterable, List
+
+import numpy as np
+
+from season_games import FIRST_WEEK, LAST_WEEK, is_full_week_range
+
+
+def _field(record, snake_name: str, camel_name: str):
+    if isinstance(record, dict):
+        return record.get(snake_name, record.get(camel_name))
+    value = getattr(record, snake_name, None)
+    return value if value is not None else getattr(record, camel_name, None)
+
+
+def _stat_number(value) -> float:
+    value = getattr(value, "actual_instance", value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class TeamStatMatrix:
+    """Dense float matrix of one stat per column and one team per row.
+
+    Stats a team has no value for are NaN.
+    """
+
+    def __init__(self, teams: List[str], stat_names: List[str], values: np.ndarray):
+        self.teams = list(teams)
+        self.stat_names = list(stat_names)
+        self.values = np.asarray(values, dtype=float).reshape(len(self.teams), len(self.stat_names))
+        self._team_rows = {team: i for i, team in enumerate(self.teams)}
+        self._stat_columns = {name: j for j, name in enumerate(self.stat_names)}
+
+    @classmethod
+    def from_records(cls, records: Iterable) -> "TeamStatMatrix":
+        """Build the matrix from long-format ``team``/``stat_name``/``stat_value`` records."""
+        cells: Dict[tuple, float] = {}
+        teams: Dict[str, None] = {}
+        stat_names: Dict[str, None] = {}
+        for record in records:
+            team = _field(record, "team", "team")
+            stat_name = _field(record, "stat_name", "statName")
+            if not team or not stat_name:
+                continue
+            teams.setdefault(team)
+            stat_names.setdefault(stat_name)
+            cells[(team, stat_name)] = _stat_number(_field(record, "stat_value", "statValue"))
+
+        team_rows = {team: i for i, team in enumerate(teams)}
+        stat_columns = {name: j for j, name in enumerate(stat_names)}
+        values = np.full((len(team_rows), len(stat_columns)), np.nan)
+        for (team, stat_name), value in cells.items():
+            values[team_rows[team], stat_columns[stat_name]] = value
+        return cls(list(teams), list(stat_names), values)
+
+    def value(self, team: str, stat_name: str, default: float = np.nan) -> float:
+        row = self._team_rows.get(team)
+        column = self._stat_columns.get(stat_name)
+        if row is None or column is None:
+            return default
+        return self.values[row, column]
+
+    def team_stats(self, team: str) -> Dict[str, float]:
+        """One team's row as a ``{stat_name: value}`` dict, skipping missing stats."""
+        row = self._team_rows.get(team)
+        if row is None:
+            return {}
+        return {
+            name: self.values[row, j]
+            for j, name in enumerate(self.stat_names)
+            if not np.isnan(self.values[row, j])
+        }
+
+
+def cumulative_stat_matrices(matrices: List[TeamStatMatrix]) -> List[TeamStatMatrix]:
+    """Running totals of per-week matrices: entry ``i`` sums weeks ``0..i``.
+
+    Teams and stats are the union over all weeks; a stat no week has reported
+    yet for a team stays NaN.
+    """
+    teams: Dict[str, None] = {}
+    stat_names: Dict[str, None] = {}
+    for matrix in matrices:
+        teams.update(dict.fromkeys(matrix.teams))
+        stat_names.update(dict.fromkeys(matrix.stat_names))
+    team_rows = {team: i for i, team in enumerate(teams)}
+    stat_columns = {name: j for j, name in enumerate(stat_names)}
+
+    weekly = np.full((len(matrices), len(team_rows), len(stat_columns)), np.nan)
+    for k, matrix in enumerate(matrices):
+        rows = [team_rows[team] for team in matrix.teams]
+        columns = [stat_columns[name] for name in matrix.stat_names]
+        weekly[k][np.ix_(rows, columns)] = matrix.values
+
+    totals = np.cumsum(np.nan_to_num(weekly), axis=0)
+    totals[np.cumsum(~np.isnan(weekly), axis=0) == 0] = np.nan
+    return [TeamStatMatrix(list(teams), list(stat_names), totals[k]) for k in range(len(matrices))]
+
+
+def load_team_stat_matrix(
+    get_team_stats: Callable[..., Iterable],
+    year: int,
+    start_week: int = FIRST_WEEK,
+    end_week: int = LAST_WEEK,
+) -> TeamStatMatrix:
+    """Pull every team's season stats with one ``get_team_stats`` call.
+
+    Week-range runs pass ``start_week``/``end_week`` so the totals only cover
+    games inside the range.
+    """
+    params = {"year": int(year)}
+    if not is_full_week_range(start_week, end_week):
+        params["start_week"] = int(start_week)
+        params["end_week"] = int(end_week)
+    return TeamStatMatrix.from_records(get_team_stats(**params))
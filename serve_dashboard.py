@@ -0,0 +1,99 @@
+"""Production server for the SPI dashboard.
+
+Runs ``spi_dashboard_app`` under gunicorn with several worker processes.
+The app is imported and warmed up once in the parent process (prediction
+dataset, latest rankings and the current-snapshot resources a first page
+view needs) before the workers are forked, so they start ready and share
+that memory copy-on-write. Each worker then runs its own background CFBD
+refresher. ``/api/ready`` reports warm-up status for a proxy health check.
+
+    python serve_dashboard.py --workers 4 --port 5055
+"""
+
+import argparse
+import os
+
+try:
+    from gunicorn.app.base import BaseApplication
+except Exception:
+    BaseApplication = None
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _start_refresher(server, worker) -> None:
+    # Threads do not survive fork, so every worker starts its own refresher.
+    import spi_dashboard_app
+
+    spi_dashboard_app.refresher.autostart = True
+    spi_dashboard_app.refresher.start()
+
+
+class DashboardServer(BaseApplication or object):
+    """gunicorn application that preloads and warms the dashboard before forking workers."""
+
+    def __init__(self, options: dict):
+        self.options = options
+        self.application = None
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        if self.application is None:
+            import spi_dashboard_app
+
+            # Only the workers refresh CFBD data; the parent just warms up and forks.
+            spi_dashboard_app.refresher.autostart = False
+            status = spi_dashboard_app.warm_up()
+            print(f"Dashboard warm-up {status['state']} in {status['seconds']}s")
+            self.application = spi_dashboard_app.app
+        return self.application
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve the SPI dashboard with multiple gunicorn workers.")
+    parser.add_argument("--host", default=os.environ.get("SPI_DASHBOARD_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=_env_int("SPI_DASHBOARD_PORT", 5055))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=_env_int("SPI_DASHBOARD_WORKERS", min(8, os.cpu_count() or 1)),
+        help="Worker processes (default: CPU count, at most 8).",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=_env_int("SPI_DASHBOARD_THREADS", 2),
+        help="Request threads per worker.",
+    )
+    parser.add_argument("--timeout", type=int, default=60, help="Seconds before a silent worker is restarted.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    if BaseApplication is None:
+        raise SystemExit("serve_dashboard.py needs gunicorn: pip install gunicorn")
+
+    args = parse_args()
+    options = {
+        "bind": f"{args.host}:{args.port}",
+        "workers": max(1, args.workers),
+        "threads": max(1, args.threads),
+        "timeout": args.timeout,
+        "preload_app": True,
+        "post_fork": _start_refresher,
+    }
+    print(f"Starting SPI Dashboard on http://{args.host}:{args.port} with {options['workers']} workers")
+    DashboardServer(options).run()
+
+
+if __name__ == "__main__":
+    main()
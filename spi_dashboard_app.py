@@ -1,31 +1,77 @@
 import datetime as dt
 import glob
-import json
+import gzip
+import hashlib
 import math
 import os
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from flask import Flask, jsonify, render_template, request
 
+from cfbd_fetch import cfbd_host
+from cfbd_store import default_store, record_to_object, season_ttl_seconds
 from model_config import HOME_FIELD_X_DEFAULT
+from team_identity import UNKNOWN_TEAM_ID, default_team_index
 
 try:
     import cfbd
 except Exception:
     cfbd = None
 
+try:
+    import brotli
+except Exception:
+    brotli = None
+
 app = Flask(__name__)
 
 BASE_DIR = os.path.dirname(__file__)
 DATA_EXPORTS_DIR = os.path.join(BASE_DIR, "data_exports")
 PREDICTIONS_DIR = os.path.join(DATA_EXPORTS_DIR, "predictions")
-DASHBOARD_CACHE_DIR = os.path.join(DATA_EXPORTS_DIR, "dashboard_cache")
 
 DEFAULT_PAGE_SIZE = 250
 MAX_PAGE_SIZE = 2000
 
+# Snapshots published by the background refresher (or a first offline read of the store).
 _PLAYOFF_RESULTS_CACHE_MEM: Dict[int, Tuple[dt.datetime, List[Dict]]] = {}
+_SEASON_GAMES_CACHE_MEM: Dict[int, Tuple[dt.datetime, List]] = {}
+REFRESH_TICK_SECONDS = 60
+# Prepared prediction datasets by method, each tagged with the (path, mtime_ns, size) it was built from.
+_PREDICTIONS_CACHE_MEM: Dict[str, "PredictionDataset"] = {}
+_PREDICTIONS_CACHE_LOCK = threading.Lock()
+
+# /api/current payloads and its sub-resources (with their encoded responses) keyed by their inputs,
+# least recently used first.
+CURRENT_PAYLOAD_CACHE_SIZE = 32
+_CURRENT_PAYLOAD_CACHE_MEM: "OrderedDict[tuple, Tuple[Optional[float], Dict, EncodedJson]]" = OrderedDict()
+_CURRENT_PAYLOAD_CACHE_LOCK = threading.Lock()
+# Filtered /api/current/future pages (week x team x page), kept apart so paging cannot evict the above.
+FUTURE_PAGE_CACHE_SIZE = 16
+_FUTURE_PAGE_CACHE_MEM: "OrderedDict[tuple, Tuple[Optional[float], Dict, EncodedJson]]" = OrderedDict()
+_LATEST_RANKINGS_FILE_MEM: Dict[tuple, Optional[str]] = {}
+_CURRENT_RANK_TABLE_MEM: Dict[tuple, "CurrentRankTable"] = {}
+_FUTURE_MATCHUPS_MEM: Dict[tuple, "FutureMatchups"] = {}
+
+# Progress of warm_up() in this process, reported by /api/ready.
+_WARM_UP_STATE: Dict[str, Optional[object]] = {
+    "state": "pending",
+    "started_at": None,
+    "finished_at": None,
+    "seconds": None,
+    "error": None,
+}
+_WARM_UP_LOCK = threading.Lock()
+
+# Bodies smaller than this are sent uncompressed.
+MIN_COMPRESS_BYTES = 1024
+# Browsers may reuse a response briefly, then revalidate it with its ETag.
+API_CACHE_CONTROL = "public, max-age=60, must-revalidate"
 
 # Team conference overrides by first effective season.
 CONFERENCE_REALIGNMENT_OVERRIDES = [
@@ -76,15 +122,6 @@ def normalize_text(value) -> str:
     return str(value).strip()
 
 
-def normalize_team_key(name: str) -> str:
-    txt = normalize_text(name).lower()
-    chars = []
-    for ch in txt:
-        if ch.isalnum():
-            chars.append(ch)
-    return "".join(chars)
-
-
 def format_conference_name(value) -> str:
     txt = normalize_text(value)
     if not txt:
@@ -137,13 +174,14 @@ def apply_conference_overrides(
         return frame
 
     out = frame.copy()
-    team_keys = out[team_col].map(normalize_team_key)
+    index = default_team_index()
+    team_ids = index.team_ids(out[team_col])
     conf = out[conference_col].map(normalize_text)
 
     for team_key, effective_year, target_conf in CONFERENCE_REALIGNMENT_OVERRIDES:
         if int(season_year) < int(effective_year):
             continue
-        mask = team_keys == team_key
+        mask = team_ids == index.team_id(team_key)
         if mask.any():
             conf.loc[mask] = target_conf
 
@@ -151,6 +189,64 @@ def apply_conference_overrides(
     return out
 
 
+class EncodedJson:
+    """A JSON response body serialized once, with a strong ETag and compressed variants made on demand.
+
+    The ETag is a digest of the body, so every worker serving the same
+    source files hands out the same validator. Compressed variants carry it
+    with the coding appended, since a strong validator names one exact body.
+    """
+
+    def __init__(self, payload):
+        self.body = (app.json.dumps(payload) + "\n").encode("utf-8")
+        self.etag = hashlib.sha256(self.body).hexdigest()[:32]
+        self._compressed: Dict[str, bytes] = {}
+
+    def etag_for(self, coding: Optional[str]) -> str:
+        return f"{self.etag}-{coding}" if coding else self.etag
+
+    def encoded(self, coding: str) -> bytes:
+        if coding not in self._compressed:
+            if coding == "br":
+                self._compressed[coding] = brotli.compress(self.body, quality=5)
+            else:
+                self._compressed[coding] = gzip.compress(self.body, compresslevel=6)
+        return self._compressed[coding]
+
+
+def _response_coding(size: int) -> Optional[str]:
+    if size < MIN_COMPRESS_BYTES:
+        return None
+    if brotli is not None and request.accept_encodings["br"]:
+        return "br"
+    if request.accept_encodings["gzip"]:
+        return "gzip"
+    return None
+
+
+def json_response(encoded: EncodedJson, cache_control: str = API_CACHE_CONTROL, conditional: bool = True):
+    """Send ``encoded`` compressed when the client accepts it, or a 304 when its ETag still matches.
+
+    A client holding the body under any coding's ETag is current.
+    """
+    coding = _response_coding(len(encoded.body))
+    known_etags = (encoded.etag, encoded.etag_for("gzip"), encoded.etag_for("br"))
+    if conditional and any(request.if_none_match.contains(etag) for etag in known_etags):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(
+            encoded.encoded(coding) if coding else encoded.body,
+            mimetype="application/json",
+        )
+        if coding:
+            response.headers["Content-Encoding"] = coding
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = cache_control
+    if conditional:
+        response.set_etag(encoded.etag_for(coding))
+    return response
+
+
 def json_safe(value):
     if isinstance(value, dict):
         return {k: json_safe(v) for k, v in value.items()}
@@ -232,22 +328,59 @@ def _resolve_prediction_file(method: str = "current") -> Tuple[Optional[str], st
     return files[0], method_used
 
 
+@dataclass
+class PredictionDataset:
+    """Prepared prediction rows plus everything derived from them at load time.
+
+    Shared between requests; callers must not modify any of it.
+    """
+
+    source_key: Tuple[str, int, int]
+    rows: pd.DataFrame
+    cube: pd.DataFrame
+    row_filters: "FilterIndex"
+    cube_filters: "FilterIndex"
+    metadata_json: Optional["EncodedJson"] = None
+
+
 def load_predictions_df(method: str = "current") -> Tuple[pd.DataFrame, Dict[str, str]]:
+    dataset, dataset_info = load_predictions_dataset(method)
+    return (dataset.rows if dataset else pd.DataFrame()), dataset_info
+
+
+def load_predictions_dataset(method: str = "current") -> Tuple[Optional[PredictionDataset], Dict[str, str]]:
+    """The prepared predictions dataset, rebuilt only when the source file changes."""
     selected_file, method_used = _resolve_prediction_file(method)
+    dataset_info = {
+        "requested_method": normalize_text(method).lower() or "current",
+        "method_used": method_used,
+        "source_file": os.path.basename(selected_file) if selected_file else "",
+    }
     if selected_file is None:
-        return pd.DataFrame(), {
-            "requested_method": normalize_text(method).lower() or "current",
-            "method_used": method_used,
-            "source_file": "",
-        }
+        return None, dataset_info
 
+    try:
+        stat = os.stat(selected_file)
+    except OSError:
+        return None, dataset_info
+    key = (selected_file, stat.st_mtime_ns, stat.st_size)
+
+    with _PREDICTIONS_CACHE_LOCK:
+        dataset = _PREDICTIONS_CACHE_MEM.get(method_used)
+        if dataset is None or dataset.source_key != key:
+            df = _prepare_predictions_df(selected_file)
+            if df.empty:
+                return None, dataset_info
+            cube = accuracy_cube(df)
+            dataset = PredictionDataset(key, df, cube, FilterIndex(df), FilterIndex(cube))
+            _PREDICTIONS_CACHE_MEM[method_used] = dataset
+    return dataset, dataset_info
+
+
+def _prepare_predictions_df(selected_file: str) -> pd.DataFrame:
     df = pd.read_csv(selected_file)
     if df.empty:
-        return df, {
-            "requested_method": normalize_text(method).lower() or "current",
-            "method_used": method_used,
-            "source_file": os.path.basename(selected_file),
-        }
+        return df
 
     defaults = {
         "year": 0,
@@ -359,18 +492,53 @@ def load_predictions_df(method: str = "current") -> Tuple[pd.DataFrame, Dict[str
 
     df["predicted_side"] = df.apply(predicted_side, axis=1)
     df["game_site"] = df["neutral_site"].map(lambda n: "neutral" if bool(n) else "non_neutral")
+    return df
+
+
+# Every column apply_filters can filter on except the teams, which stay on the raw rows.
+CUBE_DIMENSIONS = [
+    "year",
+    "season_type",
+    "week",
+    "home_conference",
+    "away_conference",
+    "conference_matchup",
+    "conference_game",
+    "predicted_side",
+    "prediction_reason",
+    "is_playoff",
+    "is_national_championship",
+    "ranking_source_team_count",
+]
 
-    return df, {
-        "requested_method": normalize_text(method).lower() or "current",
-        "method_used": method_used,
-        "source_file": os.path.basename(selected_file),
-    }
 
+def accuracy_cube(frame: pd.DataFrame) -> pd.DataFrame:
+    """Scored games and correct picks per combination of ``CUBE_DIMENSIONS``.
 
-def accuracy_tuple(frame: pd.DataFrame) -> Dict[str, Optional[float]]:
+    Conference filters are symmetric in home/away, so each cell stores the
+    two conferences as a sorted pair; that keeps A-at-B and B-at-A games in
+    one cell. The cube has the dimension columns of the rows, so
+    ``apply_filters`` works on it unchanged.
+    """
     scored = frame[frame["correct"].notna()]
-    games = int(len(scored))
-    correct = int(scored["correct"].sum()) if games else 0
+    keys = scored[CUBE_DIMENSIONS].copy()
+    home = keys["home_conference"]
+    away = keys["away_conference"]
+    swap = home.str.lower() > away.str.lower()
+    keys["home_conference"] = home.where(~swap, away)
+    keys["away_conference"] = away.where(~swap, home)
+    keys["games"] = 1
+    keys["correct"] = scored["correct"]
+    return (
+        keys.groupby(CUBE_DIMENSIONS, dropna=False, sort=False)
+        .agg(games=("games", "sum"), correct=("correct", "sum"))
+        .reset_index()
+    )
+
+
+def accuracy_tuple(cube: pd.DataFrame) -> Dict[str, Optional[float]]:
+    games = int(cube["games"].sum()) if not cube.empty else 0
+    correct = int(cube["correct"].sum()) if games else 0
     acc = (correct / games) if games else None
     return {"games": games, "correct": correct, "accuracy": acc}
 
@@ -385,13 +553,12 @@ def metrics_bundle(frame: pd.DataFrame) -> Dict[str, Dict[str, Optional[float]]]
     }
 
 
-def grouped_accuracy(frame: pd.DataFrame, group_cols: List[str]) -> List[Dict]:
-    scored = frame[frame["correct"].notna()]
-    if scored.empty:
+def grouped_accuracy(cube: pd.DataFrame, group_cols: List[str]) -> List[Dict]:
+    if cube.empty:
         return []
     grouped = (
-        scored.groupby(group_cols, as_index=False)
-        .agg(games=("correct", "count"), correct=("correct", "sum"))
+        cube.groupby(group_cols, as_index=False)
+        .agg(games=("games", "sum"), correct=("correct", "sum"))
         .sort_values(group_cols)
     )
     grouped["accuracy"] = grouped["correct"] / grouped["games"]
@@ -432,95 +599,140 @@ def home_away_slice_pack(frame: pd.DataFrame) -> Dict[str, List[Dict]]:
     }
 
 
-def apply_filters(df: pd.DataFrame, payload: Dict) -> pd.DataFrame:
-    out = df.copy()
-
-    years = payload.get("years") or []
-    if years:
-        out = out[out["year"].isin([int(v) for v in years])]
+class FilterIndex:
+    """Inverted indexes over the filterable columns of a frame, built once.
 
-    season_types = payload.get("season_types") or []
-    if season_types:
-        season_set = {str(v).strip().lower() for v in season_types}
-        out = out[out["season_type"].str.lower().isin(season_set)]
+    Each value maps to a boolean row bitmap; text values are keyed in lower
+    case, matching the case-insensitive filters. A filter request becomes a
+    few ORs within a column and ANDs across columns. Columns the frame lacks
+    (the cube has no teams) are simply not indexed.
+    """
 
-    weeks = payload.get("weeks") or []
-    if weeks:
-        out = out[out["week"].isin([int(v) for v in weeks])]
+    TEXT_COLUMNS = [
+        "season_type",
+        "home_team",
+        "away_team",
+        "home_conference",
+        "away_conference",
+        "conference_matchup",
+        "prediction_reason",
+        "predicted_side",
+    ]
+    INT_COLUMNS = ["year", "week"]
+    FLAG_COLUMNS = ["conference_game", "is_playoff", "is_national_championship"]
+
+    def __init__(self, frame: pd.DataFrame):
+        self.size = int(len(frame))
+        self.bitmaps: Dict[str, Dict[object, np.ndarray]] = {}
+        for col in self.TEXT_COLUMNS:
+            if col in frame.columns:
+                self.bitmaps[col] = self._value_bitmaps(frame[col].astype(str).str.lower())
+        for col in self.INT_COLUMNS:
+            if col in frame.columns:
+                self.bitmaps[col] = self._value_bitmaps(frame[col])
+        self.flags = {col: frame[col].to_numpy(dtype=bool) for col in self.FLAG_COLUMNS if col in frame.columns}
+        self.same_conference = (
+            frame["home_conference"].str.lower() == frame["away_conference"].str.lower()
+        ).to_numpy(dtype=bool)
+        self.source_team_count = frame["ranking_source_team_count"].fillna(0.0).to_numpy(dtype=float)
+
+    @staticmethod
+    def _value_bitmaps(values: pd.Series) -> Dict[object, np.ndarray]:
+        codes, uniques = pd.factorize(values)
+        return {value: codes == i for i, value in enumerate(uniques.tolist())}
+
+    def all_rows(self) -> np.ndarray:
+        return np.ones(self.size, dtype=bool)
+
+    def any_of(self, column: str, values: Iterable) -> np.ndarray:
+        bitmaps = self.bitmaps[column]
+        mask = np.zeros(self.size, dtype=bool)
+        for value in values:
+            bitmap = bitmaps.get(value)
+            if bitmap is not None:
+                mask |= bitmap
+        return mask
+
+    def matches(self, payload: Dict) -> np.ndarray:
+        """Row mask for a filter payload; same semantics as the filter controls."""
+        mask = self.all_rows()
+
+        years = payload.get("years") or []
+        if years:
+            mask &= self.any_of("year", [int(v) for v in years])
+
+        season_types = payload.get("season_types") or []
+        if season_types:
+            mask &= self.any_of("season_type", {str(v).strip().lower() for v in season_types})
+
+        weeks = payload.get("weeks") or []
+        if weeks:
+            mask &= self.any_of("week", [int(v) for v in weeks])
+
+        teams = payload.get("teams") or []
+        if teams:
+            team_set = {str(v).strip().lower() for v in teams}
+            mask &= self.any_of("home_team", team_set) | self.any_of("away_team", team_set)
+
+        conference_involved = payload.get("conference_involved") or []
+        if conference_involved:
+            conf_set = {str(v).strip().lower() for v in conference_involved}
+            mask &= self.any_of("home_conference", conf_set) | self.any_of("away_conference", conf_set)
+
+        if bool(payload.get("conference_play_only", False)):
+            mask &= self.flags["conference_game"]
+
+        conference_play_conferences = payload.get("conference_play_conferences") or []
+        if conference_play_conferences:
+            conf_set = {str(v).strip().lower() for v in conference_play_conferences}
+            mask &= (
+                self.flags["conference_game"]
+                & self.same_conference
+                & self.any_of("home_conference", conf_set)
+            )
 
-    teams = payload.get("teams") or []
-    if teams:
-        team_set = {str(v).strip().lower() for v in teams}
-        out = out[
-            out["home_team"].str.lower().isin(team_set)
-            | out["away_team"].str.lower().isin(team_set)
-        ]
+        specific_matchups = payload.get("specific_matchups") or []
+        if specific_matchups:
+            mask &= self.any_of("conference_matchup", {str(v).strip().lower() for v in specific_matchups})
 
-    conference_involved = payload.get("conference_involved") or []
-    if conference_involved:
-        conf_set = {str(v).strip().lower() for v in conference_involved}
-        out = out[
-            out["home_conference"].str.lower().isin(conf_set)
-            | out["away_conference"].str.lower().isin(conf_set)
-        ]
+        pair = payload.get("conference_pair_any") or []
+        if len(pair) == 2:
+            a = str(pair[0]).strip().lower()
+            b = str(pair[1]).strip().lower()
+            mask &= (self.any_of("home_conference", [a]) & self.any_of("away_conference", [b])) | (
+                self.any_of("home_conference", [b]) & self.any_of("away_conference", [a])
+            )
 
-    if bool(payload.get("conference_play_only", False)):
-        out = out[out["conference_game"]]
+        if bool(payload.get("playoff_only", False)):
+            mask &= self.flags["is_playoff"]
 
-    conference_play_conferences = payload.get("conference_play_conferences") or []
-    if conference_play_conferences:
-        conf_set = {str(v).strip().lower() for v in conference_play_conferences}
-        out = out[
-            out["conference_game"]
-            & (out["home_conference"].str.lower() == out["away_conference"].str.lower())
-            & (out["home_conference"].str.lower().isin(conf_set))
-        ]
+        if bool(payload.get("title_only", False)):
+            mask &= self.flags["is_national_championship"]
 
-    specific_matchups = payload.get("specific_matchups") or []
-    if specific_matchups:
-        mm = {str(v).strip().lower() for v in specific_matchups}
-        out = out[out["conference_matchup"].str.lower().isin(mm)]
-
-    pair = payload.get("conference_pair_any") or []
-    if len(pair) == 2:
-        a = str(pair[0]).strip().lower()
-        b = str(pair[1]).strip().lower()
-        out = out[
-            (
-                (out["home_conference"].str.lower() == a)
-                & (out["away_conference"].str.lower() == b)
-            )
-            | (
-                (out["home_conference"].str.lower() == b)
-                & (out["away_conference"].str.lower() == a)
-            )
-        ]
+        pred_reasons = payload.get("prediction_reasons") or []
+        if pred_reasons:
+            mask &= self.any_of("prediction_reason", {str(v).strip().lower() for v in pred_reasons})
 
-    if bool(payload.get("playoff_only", False)):
-        out = out[out["is_playoff"]]
+        pred_sides = payload.get("predicted_sides") or []
+        if pred_sides:
+            mask &= self.any_of("predicted_side", {str(v).strip().lower() for v in pred_sides})
 
-    if bool(payload.get("title_only", False)):
-        out = out[out["is_national_championship"]]
+        min_source_teams = payload.get("min_source_teams")
+        if min_source_teams not in (None, ""):
+            try:
+                threshold = float(min_source_teams)
+                mask &= self.source_team_count >= threshold
+            except ValueError:
+                pass
 
-    pred_reasons = payload.get("prediction_reasons") or []
-    if pred_reasons:
-        rr = {str(v).strip().lower() for v in pred_reasons}
-        out = out[out["prediction_reason"].str.lower().isin(rr)]
+        return mask
 
-    pred_sides = payload.get("predicted_sides") or []
-    if pred_sides:
-        ss = {str(v).strip().lower() for v in pred_sides}
-        out = out[out["predicted_side"].str.lower().isin(ss)]
 
-    min_source_teams = payload.get("min_source_teams")
-    if min_source_teams not in (None, ""):
-        try:
-            threshold = float(min_source_teams)
-            out = out[out["ranking_source_team_count"].fillna(0.0) >= threshold]
-        except ValueError:
-            pass
-
-    return out
+def apply_filters(df: pd.DataFrame, payload: Dict, index: Optional[FilterIndex] = None) -> pd.DataFrame:
+    """Rows of ``df`` matching the filter payload, using ``index`` when it was built for ``df``."""
+    if index is None:
+        index = FilterIndex(df)
+    return df[index.matches(payload)]
 
 
 def predictions_metadata(df: pd.DataFrame) -> Dict:
@@ -701,10 +913,11 @@ def projected_twelve_team_field(rank_df: pd.DataFrame) -> pd.DataFrame:
     }
 
     ranking["conference_norm"] = ranking["conference"].map(conf_norm)
-    ranking["team_norm"] = ranking["team"].map(lambda t: normalize_text(t).lower())
+    index = default_team_index()
+    ranking["team_id"] = index.team_ids(ranking["team"])
 
     auto_rows = []
-    selected_team_norms = set()
+    selected_team_ids = set()
 
     # P4 champions: best-ranked team in each required conference.
     for conf_label, aliases in p4_conf_aliases.items():
@@ -715,37 +928,37 @@ def projected_twelve_team_field(rank_df: pd.DataFrame) -> pd.DataFrame:
         champ["bid_type"] = "auto_p4_champion"
         champ["auto_source"] = conf_label
         auto_rows.append(champ)
-        selected_team_norms.add(champ["team_norm"])
+        selected_team_ids.add(champ["team_id"])
 
     # Highest-ranked Group of 6 champion.
     g6_rows = ranking[
         ranking["conference_norm"].isin(g6_aliases)
-        & (~ranking["team_norm"].isin(selected_team_norms))
+        & (~ranking["team_id"].isin(selected_team_ids))
     ]
     if not g6_rows.empty:
         g6_champ = g6_rows.sort_values("rank", ascending=True).iloc[0].copy()
         g6_champ["bid_type"] = "auto_g6_champion"
         g6_champ["auto_source"] = "g6"
         auto_rows.append(g6_champ)
-        selected_team_norms.add(g6_champ["team_norm"])
+        selected_team_ids.add(g6_champ["team_id"])
 
     # Notre Dame rule: auto if top-12.
     nd_rows = ranking[
-        ranking["team_norm"].isin({"notredame", "notredamefightingirish"})
+        ranking["team_id"].isin({index.lookup("Notre Dame"), index.lookup("Notre Dame Fighting Irish")})
         & (ranking["rank"] <= 12)
-        & (~ranking["team_norm"].isin(selected_team_norms))
+        & (~ranking["team_id"].isin(selected_team_ids))
     ]
     if not nd_rows.empty:
         nd_team = nd_rows.sort_values("rank", ascending=True).iloc[0].copy()
         nd_team["bid_type"] = "auto_notre_dame"
         nd_team["auto_source"] = "notre_dame_top12"
         auto_rows.append(nd_team)
-        selected_team_norms.add(nd_team["team_norm"])
+        selected_team_ids.add(nd_team["team_id"])
 
     auto_df = pd.DataFrame(auto_rows)
 
     # Fill remaining spots with at-large bids to 12 total.
-    remaining = ranking[~ranking["team_norm"].isin(selected_team_norms)].copy()
+    remaining = ranking[~ranking["team_id"].isin(selected_team_ids)].copy()
     at_large_slots = max(0, 12 - len(auto_df))
     at_large_df = remaining.sort_values("rank", ascending=True).head(at_large_slots).copy()
     if not at_large_df.empty:
@@ -761,13 +974,13 @@ def projected_twelve_team_field(rank_df: pd.DataFrame) -> pd.DataFrame:
     # Top 4 seeds/byes: highest-ranked conference champions only.
     conference_champ_mask = field["bid_type"].isin({"auto_p4_champion", "auto_g6_champion"})
     champs_only = field[conference_champ_mask].sort_values("rank", ascending=True)
-    top_bye_team_norms = set(champs_only.head(4)["team_norm"].tolist())
+    top_bye_team_ids = set(champs_only.head(4)["team_id"].tolist())
 
     seed_records = []
-    used_team_norms = set()
+    used_team_ids = set()
 
     # Seeds 1-4 for bye champions by ranking order.
-    bye_order = champs_only[champs_only["team_norm"].isin(top_bye_team_norms)].sort_values(
+    bye_order = champs_only[champs_only["team_id"].isin(top_bye_team_ids)].sort_values(
         "rank", ascending=True
     )
     for seed, (_, row) in enumerate(bye_order.iterrows(), start=1):
@@ -775,10 +988,10 @@ def projected_twelve_team_field(rank_df: pd.DataFrame) -> pd.DataFrame:
         out["seed"] = seed
         out["has_bye"] = True
         seed_records.append(out)
-        used_team_norms.add(out["team_norm"])
+        used_team_ids.add(out["team_id"])
 
     # Seeds 5-12 by ranking among remaining qualifiers.
-    remaining_field = field[~field["team_norm"].isin(used_team_norms)].sort_values(
+    remaining_field = field[~field["team_id"].isin(used_team_ids)].sort_values(
         "rank", ascending=True
     )
     next_seed = 5
@@ -889,7 +1102,8 @@ def projected_twelve_team_field_with_mode(
     }
 
     ranking["conference_norm"] = ranking["conference"].map(conf_norm)
-    ranking["team_norm"] = ranking["team"].map(lambda t: normalize_text(t).lower())
+    index = default_team_index()
+    ranking["team_id"] = index.team_ids(ranking["team"])
 
     standings_ready = not standings_df.empty
     mode_used = champ_mode
@@ -899,9 +1113,7 @@ def projected_twelve_team_field_with_mode(
     standings_lookup = standings_df.copy() if standings_ready else pd.DataFrame()
     if standings_ready:
         standings_lookup["conference_norm"] = standings_lookup["conference"].map(conf_norm)
-        standings_lookup["team_norm"] = standings_lookup["team"].map(
-            lambda t: normalize_text(t).lower()
-        )
+        standings_lookup["team_id"] = index.team_ids(standings_lookup["team"])
 
     def champion_for_aliases(aliases: set) -> Optional[pd.Series]:
         conf_rows = ranking[ranking["conference_norm"].isin(aliases)]
@@ -915,14 +1127,14 @@ def projected_twelve_team_field_with_mode(
                     ["conf_win_pct", "conf_wins", "overall_index"],
                     ascending=[False, False, False],
                 ).iloc[0]
-                matching = conf_rows[conf_rows["team_norm"] == s_best["team_norm"]]
+                matching = conf_rows[conf_rows["team_id"] == s_best["team_id"]]
                 if not matching.empty:
                     return matching.sort_values("rank", ascending=True).iloc[0].copy()
 
         return conf_rows.sort_values("rank", ascending=True).iloc[0].copy()
 
     auto_rows = []
-    selected_team_norms = set()
+    selected_team_ids = set()
 
     for conf_label, aliases in p4_conf_aliases.items():
         champ = champion_for_aliases(aliases)
@@ -931,7 +1143,7 @@ def projected_twelve_team_field_with_mode(
         champ["bid_type"] = "auto_p4_champion"
         champ["auto_source"] = conf_label
         auto_rows.append(champ)
-        selected_team_norms.add(champ["team_norm"])
+        selected_team_ids.add(champ["team_id"])
 
     # Highest-ranked G6 champion from champion set.
     g6_champion_candidates = []
@@ -939,7 +1151,7 @@ def projected_twelve_team_field_with_mode(
         champ = champion_for_aliases({conf_name})
         if champ is None:
             continue
-        if champ["team_norm"] in selected_team_norms:
+        if champ["team_id"] in selected_team_ids:
             continue
         g6_champion_candidates.append(champ)
 
@@ -949,23 +1161,23 @@ def projected_twelve_team_field_with_mode(
         g6_champ["bid_type"] = "auto_g6_champion"
         g6_champ["auto_source"] = "g6"
         auto_rows.append(g6_champ)
-        selected_team_norms.add(g6_champ["team_norm"])
+        selected_team_ids.add(g6_champ["team_id"])
 
     nd_rows = ranking[
-        ranking["team_norm"].isin({"notredame", "notredamefightingirish"})
+        ranking["team_id"].isin({index.lookup("Notre Dame"), index.lookup("Notre Dame Fighting Irish")})
         & (ranking["rank"] <= 12)
-        & (~ranking["team_norm"].isin(selected_team_norms))
+        & (~ranking["team_id"].isin(selected_team_ids))
     ]
     if not nd_rows.empty:
         nd_team = nd_rows.sort_values("rank", ascending=True).iloc[0].copy()
         nd_team["bid_type"] = "auto_notre_dame"
         nd_team["auto_source"] = "notre_dame_top12"
         auto_rows.append(nd_team)
-        selected_team_norms.add(nd_team["team_norm"])
+        selected_team_ids.add(nd_team["team_id"])
 
     auto_df = pd.DataFrame(auto_rows)
 
-    remaining = ranking[~ranking["team_norm"].isin(selected_team_norms)].copy()
+    remaining = ranking[~ranking["team_id"].isin(selected_team_ids)].copy()
     at_large_slots = max(0, 12 - len(auto_df))
     at_large_df = remaining.sort_values("rank", ascending=True).head(at_large_slots).copy()
     if not at_large_df.empty:
@@ -983,12 +1195,12 @@ def projected_twelve_team_field_with_mode(
 
     conference_champ_mask = field["bid_type"].isin({"auto_p4_champion", "auto_g6_champion"})
     champs_only = field[conference_champ_mask].sort_values("rank", ascending=True)
-    top_bye_team_norms = set(champs_only.head(4)["team_norm"].tolist())
+    top_bye_team_ids = set(champs_only.head(4)["team_id"].tolist())
 
     seed_records = []
-    used_team_norms = set()
+    used_team_ids = set()
 
-    bye_order = champs_only[champs_only["team_norm"].isin(top_bye_team_norms)].sort_values(
+    bye_order = champs_only[champs_only["team_id"].isin(top_bye_team_ids)].sort_values(
         "rank", ascending=True
     )
     for seed, (_, row) in enumerate(bye_order.iterrows(), start=1):
@@ -996,9 +1208,9 @@ def projected_twelve_team_field_with_mode(
         out["seed"] = seed
         out["has_bye"] = True
         seed_records.append(out)
-        used_team_norms.add(out["team_norm"])
+        used_team_ids.add(out["team_id"])
 
-    remaining_field = field[~field["team_norm"].isin(used_team_norms)].sort_values(
+    remaining_field = field[~field["team_id"].isin(used_team_ids)].sort_values(
         "rank", ascending=True
     )
     next_seed = 5
@@ -1043,29 +1255,12 @@ def _cfbd_games_api():
     api_key = os.environ.get("CFBD_API_KEY")
     if not api_key:
         return None
-    conf = cfbd.Configuration()
+    conf = cfbd.Configuration(host=cfbd_host())
     conf.api_key["Authorization"] = api_key
     conf.api_key_prefix["Authorization"] = "Bearer"
     return cfbd.GamesApi(cfbd.ApiClient(conf))
 
 
-def _ensure_dashboard_cache_dir() -> None:
-    os.makedirs(DASHBOARD_CACHE_DIR, exist_ok=True)
-
-
-def _playoff_cache_file(year: int) -> str:
-    return os.path.join(DASHBOARD_CACHE_DIR, f"postseason_games_{int(year)}.json")
-
-
-def _cache_is_fresh(cached_at: Optional[dt.datetime], max_age_seconds: int) -> bool:
-    if cached_at is None:
-        return False
-    if max_age_seconds <= 0:
-        return True
-    now = dt.datetime.now(dt.timezone.utc)
-    return (now - cached_at).total_seconds() <= max_age_seconds
-
-
 def _playoff_cache_max_age_seconds(year: int) -> int:
     # Current season: refresh more often in case games are in progress.
     # Past seasons: keep API calls very low.
@@ -1075,81 +1270,27 @@ def _playoff_cache_max_age_seconds(year: int) -> int:
     return 7 * 24 * 60 * 60
 
 
-def _read_playoff_cache_file(year: int) -> Tuple[List[Dict], Optional[dt.datetime]]:
-    path = _playoff_cache_file(year)
-    if not os.path.exists(path):
-        return [], None
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-    except Exception:
-        return [], None
-
-    rows = payload.get("rows") if isinstance(payload, dict) else None
-    cached_at_raw = payload.get("cached_at") if isinstance(payload, dict) else None
-    if not isinstance(rows, list):
-        return [], None
-
-    cached_at = None
-    if isinstance(cached_at_raw, str) and cached_at_raw:
-        try:
-            txt = cached_at_raw.replace("Z", "+00:00")
-            cached_at = dt.datetime.fromisoformat(txt)
-            if cached_at.tzinfo is None:
-                cached_at = cached_at.replace(tzinfo=dt.timezone.utc)
-        except Exception:
-            cached_at = None
-
-    normalized_rows = []
-    for row in rows:
-        if not isinstance(row, dict):
-            continue
-
-        pair_raw = row.get("pair_key")
-        if isinstance(pair_raw, (list, tuple)) and len(pair_raw) == 2:
-            pair_key = (normalize_text(pair_raw[0]), normalize_text(pair_raw[1]))
-        else:
-            home_key = normalize_text(row.get("home_key"))
-            away_key = normalize_text(row.get("away_key"))
-            pair_key = tuple(sorted([home_key, away_key]))
-
-        normalized = dict(row)
-        normalized["home_team"] = normalize_text(row.get("home_team"))
-        normalized["away_team"] = normalize_text(row.get("away_team"))
-        normalized["home_key"] = normalize_text(row.get("home_key"))
-        normalized["away_key"] = normalize_text(row.get("away_key"))
-        normalized["pair_key"] = pair_key
-        normalized["winner"] = normalize_text(row.get("winner"))
-        normalized["notes"] = normalize_text(row.get("notes"))
-        normalized["completed"] = bool(row.get("completed", False))
-        normalized_rows.append(normalized)
-
-    return normalized_rows, cached_at
-
-
-def _write_playoff_cache_file(year: int, rows: List[Dict]) -> None:
-    _ensure_dashboard_cache_dir()
-    path = _playoff_cache_file(year)
-    payload = {
-        "year": int(year),
-        "cached_at": dt.datetime.now(dt.timezone.utc).isoformat(),
-        "rows": rows,
-    }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f)
-
-
-def _load_postseason_games_from_api(year: int) -> List[Dict]:
-    api = _cfbd_games_api()
-    if api is None:
-        return []
+def _stored_games(
+    year: int,
+    season_type: str,
+    ttl_seconds: Optional[int],
+    use_api: bool = True,
+) -> Optional[List]:
+    # Without an API client (or with use_api off) the store is read as-is, however old.
+    api = _cfbd_games_api() if use_api else None
+    records = default_store().fetch(
+        "games",
+        {"year": int(year), "season_type": season_type},
+        api.get_games if api is not None else None,
+        ttl_seconds,
+    )
+    if records is None:
+        return None
+    return [record_to_object(record) for record in records]
 
-    try:
-        games = api.get_games(year=year, season_type="postseason")
-    except Exception:
-        return []
 
+def _postseason_rows(games: List) -> List[Dict]:
+    index = default_team_index()
     rows = []
     for g in games:
         home_team = normalize_text(getattr(g, "home_team", None))
@@ -1174,6 +1315,8 @@ def _load_postseason_games_from_api(year: int) -> List[Dict]:
             away_points = None
 
         completed = getattr(g, "completed", None) is True
+        home_id = index.team_id(home_team)
+        away_id = index.team_id(away_team)
         winner = ""
         if completed and home_points is not None and away_points is not None:
             if home_points > away_points:
@@ -1185,9 +1328,9 @@ def _load_postseason_games_from_api(year: int) -> List[Dict]:
             {
                 "home_team": home_team,
                 "away_team": away_team,
-                "home_key": _team_key(home_team),
-                "away_key": _team_key(away_team),
-                "pair_key": tuple(sorted([_team_key(home_team), _team_key(away_team)])),
+                "home_key": home_id,
+                "away_key": away_id,
+                "pair_key": tuple(sorted([home_id, away_id])),
                 "week": getattr(g, "week", None),
                 "notes": normalize_text(getattr(g, "notes", "")),
                 "completed": completed,
@@ -1201,37 +1344,160 @@ def _load_postseason_games_from_api(year: int) -> List[Dict]:
 
 
 def cached_postseason_games(year: int) -> List[Dict]:
-    year = int(year)
-    max_age_seconds = _playoff_cache_max_age_seconds(year)
-    now = dt.datetime.now(dt.timezone.utc)
+    """Latest published postseason rows for ``year``; never calls CFBD.
 
+    Before the refresher has run for ``year`` this falls back to whatever the
+    response store already holds.
+    """
+    year = int(year)
+    refresher.track(year)
     mem = _PLAYOFF_RESULTS_CACHE_MEM.get(year)
     if mem:
-        cached_at, rows = mem
-        if _cache_is_fresh(cached_at, max_age_seconds):
-            return rows
-
-    file_rows, file_cached_at = _read_playoff_cache_file(year)
-    if file_rows and _cache_is_fresh(file_cached_at, max_age_seconds):
-        _PLAYOFF_RESULTS_CACHE_MEM[year] = (file_cached_at or now, file_rows)
-        return file_rows
-
-    fresh_rows = _load_postseason_games_from_api(year)
-    if fresh_rows:
-        _PLAYOFF_RESULTS_CACHE_MEM[year] = (now, fresh_rows)
-        try:
-            _write_playoff_cache_file(year, fresh_rows)
-        except Exception:
-            pass
-        return fresh_rows
+        return mem[1]
+
+    try:
+        games = _stored_games(year, "postseason", None, use_api=False)
+    except Exception:
+        games = None
+    if games is None:
+        return []
+
+    rows = _postseason_rows(games)
+    _PLAYOFF_RESULTS_CACHE_MEM.setdefault(year, (dt.datetime.now(dt.timezone.utc), rows))
+    return _PLAYOFF_RESULTS_CACHE_MEM[year][1]
 
-    # API unavailable or failed: return stale cache if we have it.
-    if file_rows:
-        _PLAYOFF_RESULTS_CACHE_MEM[year] = (file_cached_at or now, file_rows)
-        return file_rows
+
+def published_season_games(year: int) -> Optional[List]:
+    """Latest published regular + postseason games for ``year``; never calls CFBD."""
+    year = int(year)
+    refresher.track(year)
+    mem = _SEASON_GAMES_CACHE_MEM.get(year)
     if mem:
         return mem[1]
-    return []
+
+    try:
+        reg_games = _stored_games(year, "regular", None, use_api=False)
+        post_games = _stored_games(year, "postseason", None, use_api=False)
+    except Exception:
+        return None
+    if reg_games is None:
+        return None
+
+    games = reg_games + (post_games or [])
+    _SEASON_GAMES_CACHE_MEM.setdefault(year, (dt.datetime.now(dt.timezone.utc), games))
+    return _SEASON_GAMES_CACHE_MEM[year][1]
+
+
+def refresh_season_snapshots(year: int) -> None:
+    """Pull ``year``'s games through the response store (CFBD when stale) and publish them."""
+    max_age_seconds = _playoff_cache_max_age_seconds(year)
+    ttl_seconds = season_ttl_seconds(year, max_age_seconds)
+    reg_games = _stored_games(year, "regular", ttl_seconds)
+    post_games = _stored_games(year, "postseason", ttl_seconds)
+
+    now = dt.datetime.now(dt.timezone.utc)
+    if post_games is not None:
+        _PLAYOFF_RESULTS_CACHE_MEM[year] = (now, _postseason_rows(post_games))
+    if reg_games is not None:
+        _SEASON_GAMES_CACHE_MEM[year] = (now, reg_games + (post_games or []))
+
+
+class BackgroundRefresher:
+    """Daemon thread that keeps CFBD-backed dashboard data fresh off the request path.
+
+    Each tracked season is refreshed on the cadence of
+    ``_playoff_cache_max_age_seconds`` (20 minutes in season, 7 days for past
+    years). The season of the current rankings is always tracked. Request
+    handlers register any other season they read, and it is picked up on the
+    next wake-up.
+
+    The first ``track`` call in a process starts the thread, so the refresher
+    runs under any WSGI host and again in every forked worker. Turn
+    ``autostart`` off to keep a process (e.g. a pre-fork parent) from
+    starting one.
+    """
+
+    def __init__(self, tick_seconds: float = REFRESH_TICK_SECONDS, autostart: bool = True):
+        self.tick_seconds = tick_seconds
+        self.autostart = autostart
+        self._next_due: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self) -> None:
+        # The parent's thread did not come along, and may have held these at fork time.
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def is_running(self) -> bool:
+        thread = self._thread
+        return thread is not None and self._pid == os.getpid() and thread.is_alive()
+
+    def track(self, year: int) -> None:
+        with self._lock:
+            added = year not in self._next_due
+            if added:
+                self._next_due[year] = 0.0
+        if self.autostart:
+            self.start()
+        if added:
+            self._wake.set()
+
+    def start(self) -> None:
+        """Start this process's refresher thread unless it is already running."""
+        if self.is_running():
+            return
+        with self._start_lock:
+            if self.is_running():
+                return
+            self._stop.clear()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="dashboard-refresher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self.autostart = False
+        self._stop.set()
+        self._wake.set()
+
+    def refresh_due(self) -> None:
+        ranking_file = current_rankings_file()
+        if ranking_file is not None:
+            self.track(_infer_snapshot_context(ranking_file)[0])
+
+        now = time.monotonic()
+        with self._lock:
+            due = [year for year, at in self._next_due.items() if at <= now]
+        for year in sorted(due):
+            try:
+                refresh_season_snapshots(year)
+                next_due = time.monotonic() + _playoff_cache_max_age_seconds(year)
+            except Exception as exc:
+                print(f"Warning: background refresh of {year} games failed ({exc}); retrying shortly.")
+                next_due = time.monotonic() + self.tick_seconds
+            with self._lock:
+                self._next_due[year] = next_due
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh_due()
+            except Exception as exc:
+                print(f"Warning: background refresh failed ({exc}).")
+            self._wake.wait(self.tick_seconds)
+            self._wake.clear()
+
+
+refresher = BackgroundRefresher()
 
 
 def _infer_snapshot_context(file_path: str) -> Tuple[int, str, Optional[int]]:
@@ -1375,17 +1641,10 @@ def upcoming_matchups_next_week(rank_df: pd.DataFrame, rankings_file: str) -> Tu
     if saved_rows:
         return saved_rows, saved_source
 
-    api = _cfbd_games_api()
-    if api is None:
-        return [], "none"
-
     year, season_type, week = _infer_snapshot_context(rankings_file)
 
-    try:
-        reg_games = api.get_games(year=year, season_type="regular")
-        post_games = api.get_games(year=year, season_type="postseason")
-        all_games = list(reg_games) + list(post_games)
-    except Exception:
+    all_games = published_season_games(year)
+    if all_games is None:
         return [], "none"
 
     now_utc = dt.datetime.now(dt.timezone.utc)
@@ -1427,8 +1686,12 @@ def upcoming_matchups_next_week(rank_df: pd.DataFrame, rankings_file: str) -> Tu
             if getattr(g, "week", None) is not None and int(getattr(g, "week")) == target_week
         ]
 
-    spi_map = {normalize_text(r.team): float(r.spi) for r in rank_df.itertuples() if pd.notna(r.spi)}
-    rank_map = {normalize_text(r.team): int(r.rank) for r in rank_df.itertuples()}
+    index = default_team_index()
+    team_ids = index.team_ids(rank_df["team"]).tolist()
+    spi_map = {
+        team_id: float(r.spi) for team_id, r in zip(team_ids, rank_df.itertuples()) if pd.notna(r.spi)
+    }
+    rank_map = {team_id: int(r.rank) for team_id, r in zip(team_ids, rank_df.itertuples())}
 
     rows = []
     for g, start in pending:
@@ -1440,8 +1703,10 @@ def upcoming_matchups_next_week(rank_df: pd.DataFrame, rankings_file: str) -> Tu
         if not home_name or not away_name:
             continue
 
-        home_spi = spi_map.get(home)
-        away_spi = spi_map.get(away)
+        home_id = index.team_id(home)
+        away_id = index.team_id(away)
+        home_spi = spi_map.get(home_id)
+        away_spi = spi_map.get(away_id)
 
         home_class = normalize_text(getattr(g, "home_classification", None)).lower()
         away_class = normalize_text(getattr(g, "away_classification", None)).lower()
@@ -1489,8 +1754,8 @@ def upcoming_matchups_next_week(rank_df: pd.DataFrame, rankings_file: str) -> Tu
                 "week": getattr(g, "week", None),
                 "home_team": home_name,
                 "away_team": away_name,
-                "home_rank": rank_map.get(home),
-                "away_rank": rank_map.get(away),
+                "home_rank": rank_map.get(home_id),
+                "away_rank": rank_map.get(away_id),
                 "home_spi": home_spi,
                 "away_spi": away_spi,
                 "home_win_prob_pct": round(100.0 * p_home, 1),
@@ -1525,15 +1790,6 @@ def future_matchups_all_pending(rankings_file: str) -> Tuple[List[Dict], str]:
     return rows, source
 
 
-def _team_key(name: str) -> str:
-    txt = normalize_text(name).lower()
-    chars = []
-    for ch in txt:
-        if ch.isalnum():
-            chars.append(ch)
-    return "".join(chars)
-
-
 def load_postseason_game_results(year: int) -> List[Dict]:
     return cached_postseason_games(year)
 
@@ -1583,17 +1839,17 @@ def build_playoff_bracket_payload(
             continue
         by_seed[seed] = r
 
+    index = default_team_index()
+    team_ids = index.team_ids(rank_df["team"]).tolist()
     spi_map = {
-        _team_key(r.team): float(r.spi)
-        for r in rank_df.itertuples()
+        team_id: float(r.spi)
+        for team_id, r in zip(team_ids, rank_df.itertuples())
         if pd.notna(r.spi)
     }
 
     def predict_winner(team_a: str, team_b: str) -> str:
-        a_key = _team_key(team_a)
-        b_key = _team_key(team_b)
-        a_spi = spi_map.get(a_key)
-        b_spi = spi_map.get(b_key)
+        a_spi = spi_map.get(index.team_id(team_a))
+        b_spi = spi_map.get(index.team_id(team_b))
         if a_spi is None and b_spi is None:
             return team_a
         if a_spi is None:
@@ -1635,7 +1891,7 @@ def build_playoff_bracket_payload(
                 "notes": "",
             }
 
-        pair_key = tuple(sorted([_team_key(t1), _team_key(t2)]))
+        pair_key = tuple(sorted([index.team_id(t1), index.team_id(t2)]))
         actual_row = completed_by_pair.get(pair_key)
         predicted = predict_winner(t1, t2)
 
@@ -1762,36 +2018,26 @@ def build_playoff_bracket_payload(
     }
 
 
-def current_snapshot_payload() -> Dict:
-    ranking_file = latest_spi_rankings_file(preferred_year=dt.date.today().year)
-    if ranking_file is None:
-        return {
-            "has_rankings": False,
-            "message": "No SPI ranking files found under data_exports.",
-        }
+def _file_fingerprint(path: Optional[str]) -> Optional[Tuple[str, int, int]]:
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_mtime_ns, stat.st_size)
 
-    season_year, snapshot_stage, _ = _infer_snapshot_context(ranking_file)
-    rank_df = load_spi_table(ranking_file, season_year=season_year)
-    if rank_df.empty:
-        return {
-            "has_rankings": False,
-            "message": f"Ranking file {ranking_file} exists but has no rows.",
-        }
 
-    ranking_method = "spi"
-    rank_df, ranking_method_info = apply_current_ranking_method(
-        rank_df,
-        season_year=season_year,
-        ranking_file=ranking_file,
-        requested_method=ranking_method,
-    )
+def current_rankings_file() -> Optional[str]:
+    # The pick depends only on which ranking files exist, so rescan only when the directory changes.
+    listing_key = (_file_fingerprint(DATA_EXPORTS_DIR), dt.date.today().year)
+    if listing_key not in _LATEST_RANKINGS_FILE_MEM:
+        _LATEST_RANKINGS_FILE_MEM.clear()
+        _LATEST_RANKINGS_FILE_MEM[listing_key] = latest_spi_rankings_file(preferred_year=listing_key[1])
+    return _LATEST_RANKINGS_FILE_MEM[listing_key]
 
-    preseason_override = snapshot_stage == "preseason"
-    if preseason_override:
-        rank_df = rank_df.copy()
-        rank_df["wins"] = 0
-        rank_df["losses"] = 0
 
+def current_snapshot_options() -> Tuple[str, str, bool]:
     champ_mode = normalize_text(request.args.get("champ_mode", "spi")).lower()
     if champ_mode not in {"spi", "standings"}:
         champ_mode = "spi"
@@ -1804,14 +2050,242 @@ def current_snapshot_payload() -> Dict:
         "yes",
         "on",
     }
+    return champ_mode, playoff_mode, simulate_remaining
+
+
+def current_future_options() -> Tuple[Optional[int], str, int, int]:
+    """``week``, ``team``, ``page`` and ``page_size`` filters for ``/api/current/future``.
+
+    A ``page_size`` of 0 asks for every matching row. Raises ``ValueError``
+    for a ``week`` that is not a number.
+    """
+    week = normalize_text(request.args.get("week", ""))
+    try:
+        week = int(week) if week else None
+    except ValueError:
+        raise ValueError(f"Invalid week: {week}") from None
+    team = normalize_text(request.args.get("team", ""))
+    try:
+        page = max(1, int(request.args.get("page", 1) or 1))
+    except ValueError:
+        page = 1
+    try:
+        page_size = int(request.args.get("page_size", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        page_size = DEFAULT_PAGE_SIZE
+    if page_size < 0:
+        page_size = DEFAULT_PAGE_SIZE
+    page_size = min(MAX_PAGE_SIZE, page_size)
+    return week, team, page, page_size
+
+
+def _standings_file(ranking_file: str) -> Optional[str]:
+    label = _snapshot_label_from_rankings_file(ranking_file)
+    return os.path.join(DATA_EXPORTS_DIR, f"team_standings_{label}.csv") if label else None
+
+
+def _upcoming_files_fingerprint() -> tuple:
+    upcoming_files = glob.glob(os.path.join(DATA_EXPORTS_DIR, "predictions", "upcoming_spi_predictions_*.csv"))
+    return tuple(sorted(filter(None, (_file_fingerprint(f) for f in upcoming_files))))
+
+
+def _postseason_version(year: int) -> Optional[dt.datetime]:
+    cached_postseason_games(year)
+    mem = _PLAYOFF_RESULTS_CACHE_MEM.get(year)
+    return mem[0] if mem else None
+
+
+def _season_games_version(year: int) -> Optional[dt.datetime]:
+    season_games = _SEASON_GAMES_CACHE_MEM.get(year)
+    return season_games[0] if season_games else None
+
+
+def current_snapshot_key(
+    ranking_file: Optional[str],
+    champ_mode: str,
+    playoff_mode: str,
+    simulate_remaining: bool,
+) -> tuple:
+    """Everything a current snapshot payload is built from, as a hashable key."""
+    if ranking_file is None:
+        return (None,)
+
+    year, _, _ = _infer_snapshot_context(ranking_file)
+    return (
+        _file_fingerprint(ranking_file),
+        _file_fingerprint(_standings_file(ranking_file)),
+        _upcoming_files_fingerprint(),
+        _postseason_version(year) if playoff_mode == "live" else None,
+        _season_games_version(year),
+        champ_mode,
+        playoff_mode,
+        simulate_remaining,
+    )
+
+
+@dataclass
+class CurrentRankTable:
+    """The latest rankings as every ``/api/current`` resource sees them. Shared; do not modify."""
+
+    ranking_file: str
+    rank_df: pd.DataFrame
+    ranking_method: Dict[str, str]
+
+
+@dataclass
+class FutureMatchups:
+    """All pending matchups in display order, with per-row week and team ids for filtering."""
+
+    rows: List[Dict]
+    source: str
+    weeks: np.ndarray
+    home_ids: np.ndarray
+    away_ids: np.ndarray
+    winner_ids: np.ndarray
+    teams: List[str]
+
+
+def current_rank_table(ranking_file: str) -> CurrentRankTable:
+    """Ranked (and, for preseason files, zero-record) SPI table, rebuilt only when the file changes."""
+    key = _file_fingerprint(ranking_file)
+    if key not in _CURRENT_RANK_TABLE_MEM:
+        season_year, snapshot_stage, _ = _infer_snapshot_context(ranking_file)
+        rank_df = load_spi_table(ranking_file, season_year=season_year)
+        rank_df, ranking_method_info = apply_current_ranking_method(
+            rank_df,
+            season_year=season_year,
+            ranking_file=ranking_file,
+            requested_method="spi",
+        )
+        if snapshot_stage == "preseason" and not rank_df.empty:
+            rank_df = rank_df.copy()
+            rank_df["wins"] = 0
+            rank_df["losses"] = 0
+        _CURRENT_RANK_TABLE_MEM.clear()
+        _CURRENT_RANK_TABLE_MEM[key] = CurrentRankTable(ranking_file, rank_df, ranking_method_info)
+    return _CURRENT_RANK_TABLE_MEM[key]
+
+
+def current_future_matchups(ranking_file: str) -> FutureMatchups:
+    """The saved all-pending matchups, re-read only when an upcoming predictions file changes."""
+    key = (_file_fingerprint(ranking_file), _upcoming_files_fingerprint())
+    if key not in _FUTURE_MATCHUPS_MEM:
+        rows, source = future_matchups_all_pending(ranking_file)
+        rows = json_safe(rows)
+        index = default_team_index()
+
+        def week_value(row: Dict) -> int:
+            try:
+                return int(row.get("week"))
+            except Exception:
+                return -1
+
+        teams = sorted(
+            {normalize_text(row.get(side)) for row in rows for side in ("home_team", "away_team")} - {""}
+        )
+        _FUTURE_MATCHUPS_MEM.clear()
+        _FUTURE_MATCHUPS_MEM[key] = FutureMatchups(
+            rows=rows,
+            source=source,
+            weeks=np.fromiter((week_value(row) for row in rows), dtype=np.int64, count=len(rows)),
+            home_ids=index.team_ids(normalize_text(row.get("home_team")) for row in rows),
+            away_ids=index.team_ids(normalize_text(row.get("away_team")) for row in rows),
+            winner_ids=index.team_ids(normalize_text(row.get("predicted_winner")) for row in rows),
+            teams=teams,
+        )
+    return _FUTURE_MATCHUPS_MEM[key]
+
+
+def _current_entry(
+    key: tuple,
+    build,
+    cache: "OrderedDict[tuple, Tuple[Optional[float], Dict, EncodedJson]]" = _CURRENT_PAYLOAD_CACHE_MEM,
+    cache_size: int = CURRENT_PAYLOAD_CACHE_SIZE,
+) -> Tuple[Dict, EncodedJson]:
+    """Memoize one ``/api/current`` resource in an LRU (the shared one by default).
+
+    ``build`` returns the payload and how long it may be reused for, or
+    ``None`` when it only changes with the inputs already in ``key``.
+    """
+    with _CURRENT_PAYLOAD_CACHE_LOCK:
+        cached = cache.get(key)
+        if cached is not None and (cached[0] is None or cached[0] > time.monotonic()):
+            cache.move_to_end(key)
+            return cached[1], cached[2]
+
+    payload, max_age = build()
+    payload = json_safe(payload)
+    encoded = EncodedJson({"ok": True, "current": payload})
+    expires_at = None if max_age is None else time.monotonic() + max_age
+
+    with _CURRENT_PAYLOAD_CACHE_LOCK:
+        cache[key] = (expires_at, payload, encoded)
+        cache.move_to_end(key)
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
+    return payload, encoded
+
+
+def _rankings_unavailable(ranking_file: Optional[str]) -> Optional[Dict]:
+    if ranking_file is None:
+        return {
+            "has_rankings": False,
+            "message": "No SPI ranking files found under data_exports.",
+        }
+    if current_rank_table(ranking_file).rank_df.empty:
+        return {
+            "has_rankings": False,
+            "message": f"Ranking file {ranking_file} exists but has no rows.",
+        }
+    return None
+
+
+def _upcoming_max_age(ranking_file: str, upcoming_source: str) -> Optional[int]:
+    # Next-week games not read from a saved file depend on the clock and the CFBD store.
+    if str(upcoming_source).startswith("file:"):
+        return None
+    season_year, _, _ = _infer_snapshot_context(ranking_file)
+    return _playoff_cache_max_age_seconds(season_year)
+
+
+def build_current_rankings_payload(ranking_file: Optional[str]) -> Dict:
+    unavailable = _rankings_unavailable(ranking_file)
+    if unavailable:
+        return unavailable
+
+    table = current_rank_table(ranking_file)
+    rank_df = table.rank_df
+    return {
+        "has_rankings": True,
+        "ranking_file": os.path.basename(ranking_file),
+        "ranking_method": table.ranking_method,
+        "rankings": rank_df.to_dict(orient="records"),
+        "components": {
+            "n_rankings": rank_df.sort_values("n_adj", ascending=False).head(50).to_dict(orient="records"),
+            "sor_rankings": rank_df.sort_values("sor_adj", ascending=False).head(50).to_dict(orient="records"),
+        },
+    }
+
 
+def build_current_bracket_payload(
+    ranking_file: Optional[str],
+    champ_mode: str,
+    playoff_mode: str,
+    simulate_remaining: bool,
+) -> Dict:
+    unavailable = _rankings_unavailable(ranking_file)
+    if unavailable:
+        return unavailable
+
+    _, snapshot_stage, _ = _infer_snapshot_context(ranking_file)
+    rank_df = current_rank_table(ranking_file).rank_df
     standings_df = load_team_standings_for_snapshot(ranking_file)
     field_df, champ_info = projected_twelve_team_field_with_mode(
         rank_df,
         standings_df,
         champ_mode=champ_mode,
     )
-    if preseason_override and not field_df.empty:
+    if snapshot_stage == "preseason" and not field_df.empty:
         field_df = field_df.copy()
         field_df["wins"] = 0
         field_df["losses"] = 0
@@ -1822,28 +2296,312 @@ def current_snapshot_payload() -> Dict:
         playoff_mode=playoff_mode,
         simulate_remaining=simulate_remaining,
     )
-    upcoming, upcoming_source = upcoming_matchups_next_week(rank_df, ranking_file)
-    future, future_source = future_matchups_all_pending(ranking_file)
-
     return {
         "has_rankings": True,
         "ranking_file": os.path.basename(ranking_file),
-        "ranking_method": ranking_method_info,
-        "rankings": rank_df.to_dict(orient="records"),
         "projected_field": field_df.to_dict(orient="records"),
         "champ_projection": champ_info,
         "playoff_bracket": playoff_bracket,
-        "components": {
-            "n_rankings": rank_df.sort_values("n_adj", ascending=False).head(50).to_dict(orient="records"),
-            "sor_rankings": rank_df.sort_values("sor_adj", ascending=False).head(50).to_dict(orient="records"),
-        },
+    }
+
+
+def build_current_upcoming_payload(ranking_file: Optional[str]) -> Dict:
+    unavailable = _rankings_unavailable(ranking_file)
+    if unavailable:
+        return unavailable
+
+    upcoming, upcoming_source = upcoming_matchups_next_week(current_rank_table(ranking_file).rank_df, ranking_file)
+    return {
+        "has_rankings": True,
+        "ranking_file": os.path.basename(ranking_file),
         "upcoming_matchups_source": upcoming_source,
         "upcoming_matchups": upcoming,
-        "future_matchups_source": future_source,
-        "future_matchups": future,
     }
 
 
+def build_current_future_payload(
+    ranking_file: Optional[str],
+    week: Optional[int],
+    team: str,
+    page: int,
+    page_size: int,
+) -> Dict:
+    """One page of pending matchups for a week and/or team, plus the selected team's projected record.
+
+    Raises ``ValueError`` for a team the index has never seen.
+    """
+    unavailable = _rankings_unavailable(ranking_file)
+    if unavailable:
+        return unavailable
+
+    future = current_future_matchups(ranking_file)
+    mask = np.ones(len(future.rows), dtype=bool)
+    if week is not None:
+        mask &= future.weeks == week
+    team_summary = None
+    if team:
+        team_id = default_team_index().lookup(team)
+        if team_id == UNKNOWN_TEAM_ID:
+            raise ValueError(f"Unknown team: {team}")
+        team_mask = (future.home_ids == team_id) | (future.away_ids == team_id)
+        mask &= team_mask
+        # The record covers every remaining game, whichever week or page is shown.
+        team_rows = np.flatnonzero(team_mask)
+        expected_wins = 0.0
+        for i in team_rows.tolist():
+            row = future.rows[i]
+            side = "home" if future.home_ids[i] == team_id else "away"
+            prob = row.get(f"{side}_win_prob_pct")
+            if prob is not None:
+                expected_wins += float(prob) / 100.0
+        team_summary = {
+            "team": team,
+            "games": int(len(team_rows)),
+            "projected_wins": int(np.count_nonzero(future.winner_ids[team_rows] == team_id)),
+            "expected_wins": expected_wins,
+        }
+
+    selected = np.flatnonzero(mask)
+    total_rows = int(len(selected))
+    if page_size:
+        selected = selected[(page - 1) * page_size : page * page_size]
+    return {
+        "has_rankings": True,
+        "ranking_file": os.path.basename(ranking_file),
+        "future_matchups_source": future.source,
+        "future_matchups": [future.rows[i] for i in selected.tolist()],
+        "teams": future.teams,
+        "weeks": sorted({int(w) for w in future.weeks.tolist() if w >= 0}),
+        "team_summary": team_summary,
+        "summary": {
+            "total_rows_filtered": total_rows,
+            "total_rows_baseline": len(future.rows),
+            "page": page,
+            "page_size": page_size,
+            "total_pages": max(1, (total_rows + page_size - 1) // page_size) if page_size else 1,
+        },
+    }
+
+
+def current_rankings_entry(ranking_file: Optional[str]) -> Tuple[Dict, EncodedJson]:
+    return _current_entry(
+        ("rankings", _file_fingerprint(ranking_file)),
+        lambda: (build_current_rankings_payload(ranking_file), None),
+    )
+
+
+def current_bracket_entry(
+    ranking_file: Optional[str],
+    champ_mode: str,
+    playoff_mode: str,
+    simulate_remaining: bool,
+) -> Tuple[Dict, EncodedJson]:
+    key = ("bracket", None)
+    if ranking_file is not None:
+        year, _, _ = _infer_snapshot_context(ranking_file)
+        key = (
+            "bracket",
+            _file_fingerprint(ranking_file),
+            _file_fingerprint(_standings_file(ranking_file)),
+            _postseason_version(year) if playoff_mode == "live" else None,
+            champ_mode,
+            playoff_mode,
+            simulate_remaining,
+        )
+    return _current_entry(
+        key,
+        lambda: (build_current_bracket_payload(ranking_file, champ_mode, playoff_mode, simulate_remaining), None),
+    )
+
+
+def current_upcoming_entry(ranking_file: Optional[str]) -> Tuple[Dict, EncodedJson]:
+    key = ("upcoming", None)
+    if ranking_file is not None:
+        year, _, _ = _infer_snapshot_context(ranking_file)
+        key = (
+            "upcoming",
+            _file_fingerprint(ranking_file),
+            _upcoming_files_fingerprint(),
+            _season_games_version(year),
+        )
+
+    def build():
+        payload = build_current_upcoming_payload(ranking_file)
+        if not payload.get("has_rankings"):
+            return payload, None
+        return payload, _upcoming_max_age(ranking_file, payload["upcoming_matchups_source"])
+
+    return _current_entry(key, build)
+
+
+def current_future_entry(
+    ranking_file: Optional[str],
+    week: Optional[int],
+    team: str,
+    page: int,
+    page_size: int,
+) -> Tuple[Dict, EncodedJson]:
+    key = ("future", None)
+    if ranking_file is not None:
+        key = (
+            "future",
+            _file_fingerprint(ranking_file),
+            _upcoming_files_fingerprint(),
+            week,
+            team,
+            page,
+            page_size,
+        )
+    return _current_entry(
+        key,
+        lambda: (build_current_future_payload(ranking_file, week, team, page, page_size), None),
+        _FUTURE_PAGE_CACHE_MEM,
+        FUTURE_PAGE_CACHE_SIZE,
+    )
+
+
+def current_snapshot_payload() -> Dict:
+    """The JSON-safe ``/api/current`` payload for this request, memoized on its inputs."""
+    return current_snapshot_entry(current_rankings_file(), *current_snapshot_options())[0]
+
+
+def current_snapshot_json() -> EncodedJson:
+    """The encoded ``/api/current`` response body for this request, memoized with its payload."""
+    return current_snapshot_entry(current_rankings_file(), *current_snapshot_options())[1]
+
+
+def current_snapshot_entry(
+    ranking_file: Optional[str],
+    champ_mode: str,
+    playoff_mode: str,
+    simulate_remaining: bool,
+) -> Tuple[Dict, EncodedJson]:
+    """The whole snapshot, keyed by ``current_snapshot_key`` and assembled from the memoized resources.
+
+    Like the upcoming resource, snapshots whose next-week matchups did not
+    come from a saved predictions file expire after the season's playoff
+    cache age.
+    """
+    options = (champ_mode, playoff_mode, simulate_remaining)
+
+    def build():
+        payload = build_current_snapshot_payload(ranking_file, *options)
+        if not payload.get("has_rankings"):
+            return payload, None
+        return payload, _upcoming_max_age(ranking_file, payload["upcoming_matchups_source"])
+
+    return _current_entry(("current",) + current_snapshot_key(ranking_file, *options), build)
+
+
+def build_current_snapshot_payload(
+    ranking_file: Optional[str],
+    champ_mode: str,
+    playoff_mode: str,
+    simulate_remaining: bool,
+) -> Dict:
+    unavailable = _rankings_unavailable(ranking_file)
+    if unavailable:
+        return unavailable
+
+    rankings = current_rankings_entry(ranking_file)[0]
+    bracket = current_bracket_entry(ranking_file, champ_mode, playoff_mode, simulate_remaining)[0]
+    upcoming = current_upcoming_entry(ranking_file)[0]
+    future = current_future_matchups(ranking_file)
+
+    return {
+        "has_rankings": True,
+        "ranking_file": rankings["ranking_file"],
+        "ranking_method": rankings["ranking_method"],
+        "rankings": rankings["rankings"],
+        "projected_field": bracket["projected_field"],
+        "champ_projection": bracket["champ_projection"],
+        "playoff_bracket": bracket["playoff_bracket"],
+        "components": rankings["components"],
+        "upcoming_matchups_source": upcoming["upcoming_matchups_source"],
+        "upcoming_matchups": upcoming["upcoming_matchups"],
+        "future_matchups_source": future.source,
+        "future_matchups": future.rows,
+    }
+
+
+def historical_metadata_json(dataset: PredictionDataset, dataset_info: Dict[str, str]) -> EncodedJson:
+    """The encoded ``/api/historical/metadata`` body, built once per prepared dataset."""
+    if dataset.metadata_json is None:
+        dataset.metadata_json = EncodedJson(
+            {
+                "ok": True,
+                "metadata": predictions_metadata(dataset.rows),
+                "dataset": dataset_info,
+            }
+        )
+    return dataset.metadata_json
+
+
+def warm_up() -> Dict:
+    """Load the prediction dataset and latest rankings, and build the resources a first page view asks for.
+
+    Run once per serving process, or in a pre-fork parent so every worker
+    starts with them. Otherwise the first request starts it (see
+    ``start_warm_up``). ``/api/ready`` reports the outcome.
+    """
+    with _WARM_UP_LOCK:
+        _WARM_UP_STATE.update(
+            state="warming",
+            started_at=dt.datetime.now(dt.timezone.utc).isoformat(),
+            finished_at=None,
+            seconds=None,
+            error=None,
+        )
+    started = time.monotonic()
+    try:
+        dataset, dataset_info = load_predictions_dataset("current")
+        if dataset is not None:
+            historical_metadata_json(dataset, dataset_info)
+
+        ranking_file = current_rankings_file()
+        # The options the dashboard sends on first load.
+        options = ("spi", "live", False)
+        current_rankings_entry(ranking_file)
+        current_bracket_entry(ranking_file, *options)
+        current_upcoming_entry(ranking_file)
+        current_future_entry(ranking_file, None, "", 1, DEFAULT_PAGE_SIZE)
+        current_future_entry(ranking_file, None, "", 1, 0)
+        current_snapshot_entry(ranking_file, *options)
+    except Exception as exc:
+        print(f"Warning: dashboard warm-up failed ({exc}).")
+        outcome = {"state": "failed", "error": str(exc)}
+    else:
+        outcome = {"state": "ready"}
+
+    with _WARM_UP_LOCK:
+        _WARM_UP_STATE.update(
+            outcome,
+            finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
+            seconds=round(time.monotonic() - started, 3),
+        )
+        return dict(_WARM_UP_STATE)
+
+
+def start_warm_up() -> None:
+    """Run ``warm_up`` in a background thread unless this process has already started it."""
+    with _WARM_UP_LOCK:
+        if _WARM_UP_STATE["state"] != "pending":
+            return
+        _WARM_UP_STATE["state"] = "warming"
+    threading.Thread(target=warm_up, name="dashboard-warm-up", daemon=True).start()
+
+
+def warm_up_status() -> Dict:
+    with _WARM_UP_LOCK:
+        return dict(_WARM_UP_STATE)
+
+
+@app.before_request
+def _warm_up_on_first_request() -> None:
+    # Covers `flask run` and plain WSGI servers, which never call warm_up() themselves.
+    start_warm_up()
+
+
 @app.route("/")
 def home():
     return render_template("spi_dashboard.html")
@@ -1851,45 +2609,75 @@ def home():
 
 @app.route("/api/current")
 def api_current():
-    payload = {"ok": True, "current": current_snapshot_payload()}
-    return jsonify(json_safe(payload))
+    return json_response(current_snapshot_json())
+
+
+@app.route("/api/current/rankings")
+def api_current_rankings():
+    return json_response(current_rankings_entry(current_rankings_file())[1])
+
+
+@app.route("/api/current/bracket")
+def api_current_bracket():
+    return json_response(current_bracket_entry(current_rankings_file(), *current_snapshot_options())[1])
+
+
+@app.route("/api/current/upcoming")
+def api_current_upcoming():
+    return json_response(current_upcoming_entry(current_rankings_file())[1])
+
+
+@app.route("/api/current/future")
+def api_current_future():
+    try:
+        return json_response(current_future_entry(current_rankings_file(), *current_future_options())[1])
+    except ValueError as exc:
+        return jsonify({"ok": False, "error": str(exc)}), 400
+
+
+@app.route("/api/ready")
+def api_ready():
+    status = warm_up_status()
+    ready = status["state"] == "ready"
+    response = jsonify({"ok": True, "ready": ready, "pid": os.getpid(), "warm_up": status})
+    response.headers["Cache-Control"] = "no-store"
+    return response, 200 if ready else 503
 
 
 @app.route("/api/historical/metadata")
 def api_historical_metadata():
     method = "current"
-    df, dataset_info = load_predictions_df(method)
-    if df.empty:
+    dataset, dataset_info = load_predictions_dataset(method)
+    if dataset is None:
         return jsonify({"ok": False, "error": "No prediction files found in data_exports/predictions."}), 404
-    return jsonify(
-        {
-            "ok": True,
-            "metadata": predictions_metadata(df),
-            "dataset": dataset_info,
-        }
-    )
+    return json_response(historical_metadata_json(dataset, dataset_info))
 
 
 @app.route("/api/historical/query", methods=["POST"])
 def api_historical_query():
     payload = request.get_json(silent=True) or {}
     method = "current"
-    df, dataset_info = load_predictions_df(method)
-    if df.empty:
+    dataset, dataset_info = load_predictions_dataset(method)
+    if dataset is None:
         return jsonify({"ok": False, "error": "No prediction files found in data_exports/predictions."}), 404
+    df = dataset.rows
+    cube = dataset.cube
 
     page = max(1, int(payload.get("page", 1) or 1))
     page_size = max(1, min(MAX_PAGE_SIZE, int(payload.get("page_size", DEFAULT_PAGE_SIZE) or DEFAULT_PAGE_SIZE)))
 
-    baseline = df.copy()
-    filtered = apply_filters(df, payload)
-
-    base_metrics = metrics_bundle(baseline)
-    filt_metrics = metrics_bundle(filtered)
+    filtered = apply_filters(df, payload, dataset.row_filters)
+    # Team filters are not cube dimensions; the few rows they leave are cheap to aggregate directly.
+    if payload.get("teams"):
+        filtered_cube = accuracy_cube(filtered)
+    else:
+        filtered_cube = apply_filters(cube, payload, dataset.cube_filters)
 
-    slices = slice_pack(filtered)
-    home_away_slices = home_away_slice_pack(filtered)
+    base_metrics = metrics_bundle(cube)
+    filt_metrics = metrics_bundle(filtered_cube)
 
+    slices = slice_pack(filtered_cube)
+    home_away_slices = home_away_slice_pack(filtered_cube)
 
     sort_cols = [c for c in ["year", "season_type", "week", "start_date", "home_team"] if c in filtered.columns]
     display = filtered.sort_values(sort_cols)
@@ -1921,25 +2709,30 @@ def api_historical_query():
     ]
     table_columns = [c for c in table_columns if c in page_df.columns]
 
-    return jsonify(
-        {
-            "ok": True,
-            "summary": {
-                "total_rows_filtered": total_rows,
-                "total_rows_baseline": int(len(baseline)),
-                "page": page,
-                "page_size": page_size,
-                "total_pages": (total_rows + page_size - 1) // page_size,
-            },
-            "dataset": dataset_info,
-            "metrics": {"baseline": base_metrics, "filtered": filt_metrics},
-            "slices": slices,
-            "home_away_slices": home_away_slices,
-            "table": {
-                "columns": table_columns,
-                "rows": page_df[table_columns].to_dict(orient="records"),
-            },
-        }
+    # POST results are never reused by browsers, but large pages still go out compressed.
+    return json_response(
+        EncodedJson(
+            {
+                "ok": True,
+                "summary": {
+                    "total_rows_filtered": total_rows,
+                    "total_rows_baseline": int(len(df)),
+                    "page": page,
+                    "page_size": page_size,
+                    "total_pages": (total_rows + page_size - 1) // page_size,
+                },
+                "dataset": dataset_info,
+                "metrics": {"baseline": base_metrics, "filtered": filt_metrics},
+                "slices": slices,
+                "home_away_slices": home_away_slices,
+                "table": {
+                    "columns": table_columns,
+                    "rows": page_df[table_columns].to_dict(orient="records"),
+                },
+            }
+        ),
+        cache_control="no-store",
+        conditional=False,
     )
 
 
@@ -1958,5 +2751,10 @@ if __name__ == "__main__":
         "on",
     }
 
+    # With the reloader on, only the serving child process warms up and refreshes CFBD data.
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_warm_up()
+        refresher.start()
+
     print(f"Starting SPI Dashboard on http://{host}:{port}")
     app.run(host=host, port=port, debug=debug)
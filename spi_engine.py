@@ -0,0 +1,209 @@
+"""Columnar NumPy engine for the Nature, SOR and SPI ranking components.
+
+The engine works on two tables:
+
+- a team table with one row per ranked team (``team``, ``conference``,
+  ``conf_champ``, ``games``, ``wins``, ``losses``, ``conf_wins``,
+  ``conf_losses``, ``points``, ``points_allowed``, ``TD``, ``TM``)
+- a game table with one row per team side of a completed game (``team_idx``,
+  ``opp_idx``, ``win``), where indexes are team-table positions and
+  ``opp_idx`` is -1 for opponents outside the table.
+
+Every stage reproduces the scalar formulas in ``rankings.py`` (``Nature``,
+``SOR_calc``, ``SPI_calc`` and the ``multisort`` conference standings)
+including their sort stability, so rankings match the object pipeline.
+"""
+
+from typing import Dict, Mapping
+
+import numpy as np
+import pandas as pd
+
+N_WEIGHT = 0.35
+SOR_WEIGHT = 0.65
+
+TEAM_TABLE_COLUMNS = [
+    "team",
+    "conference",
+    "conf_champ",
+    "games",
+    "wins",
+    "losses",
+    "conf_wins",
+    "conf_losses",
+    "points",
+    "points_allowed",
+    "TD",
+    "TM",
+]
+GAME_TABLE_COLUMNS = ["team_idx", "opp_idx", "win"]
+
+
+def ranking_order(values) -> np.ndarray:
+    """Positions sorted high to low, keeping input order for ties."""
+    return np.argsort(-np.asarray(values, dtype=float), kind="stable")
+
+
+def build_game_table(team_records: Mapping) -> pd.DataFrame:
+    """Flatten ``TeamRecord`` opponent lists into a game table.
+
+    ``team_records`` must be ordered like the team table.
+    """
+    position = {team: i for i, team in enumerate(team_records)}
+    team_idx = []
+    opp_idx = []
+    win = []
+    for i, record in enumerate(team_records.values()):
+        for opponent in record.win_opponents:
+            team_idx.append(i)
+            opp_idx.append(position.get(opponent, -1))
+            win.append(True)
+        for opponent in record.loss_opponents:
+            team_idx.append(i)
+            opp_idx.append(position.get(opponent, -1))
+            win.append(False)
+
+    return pd.DataFrame(
+        {
+            "team_idx": np.asarray(team_idx, dtype=np.int64),
+            "opp_idx": np.asarray(opp_idx, dtype=np.int64),
+            "win": np.asarray(win, dtype=bool),
+        },
+        columns=GAME_TABLE_COLUMNS,
+    )
+
+
+def _scaled_by_max(values: np.ndarray) -> np.ndarray:
+    if values.size == 0:
+        return values.copy()
+    return values / np.amax(values)
+
+
+def nature_components(team_table: pd.DataFrame) -> pd.DataFrame:
+    """Add ``ave_margin``, ``N_raw`` and ``N_adj`` columns."""
+    out = team_table.copy()
+    G = out["games"].to_numpy(dtype=float)
+    P = out["points"].to_numpy(dtype=float)
+    PA = out["points_allowed"].to_numpy(dtype=float)
+    TD = out["TD"].to_numpy(dtype=float)
+    TM = out["TM"].to_numpy(dtype=float)
+    TDA = PA / 7.0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        A = np.where(G > 0, (P - PA) / G, 0.0)
+        td_rate = (TD * 7.0) / P
+        tda_rate = (TDA * 7.0) / PA
+        tm_rate = TM / G
+        N_raw = np.select(
+            [G == 0.0, (P == 0.0) & (PA != 0.0), P == 0.0, PA == 0.0],
+            [
+                A,
+                A + (50.0 * (0.0 - tda_rate) + tm_rate),
+                A + tm_rate,
+                A + (50.0 * td_rate + tm_rate),
+            ],
+            default=A + (50.0 * (td_rate - tda_rate) + tm_rate),
+        )
+
+    out["ave_margin"] = A
+    out["N_raw"] = N_raw
+    out["N_adj"] = _scaled_by_max(N_raw)
+    return out
+
+
+def standing_components(
+    team_table: pd.DataFrame,
+    conference_index: Mapping[str, float],
+) -> pd.DataFrame:
+    """Add in-conference ``standing_index``, ``conf_position``, ``conf_index`` and ``overall_index``.
+
+    Teams are ordered within their conference by champion flag, conference
+    wins, conference losses, average margin and points, ties keeping table
+    order.
+    """
+    out = team_table.copy()
+    n = len(out)
+    if n == 0:
+        for col in ("standing_index", "conf_position", "conf_index", "overall_index"):
+            out[col] = pd.Series(dtype=float)
+        return out
+
+    conf_codes, _ = pd.factorize(out["conference"], sort=False)
+    order = np.lexsort(
+        (
+            -out["points"].to_numpy(dtype=float),
+            -out["ave_margin"].to_numpy(dtype=float),
+            out["conf_losses"].to_numpy(dtype=float),
+            -out["conf_wins"].to_numpy(dtype=float),
+            -out["conf_champ"].astype(bool).to_numpy().astype(np.int64),
+            conf_codes,
+        )
+    )
+
+    conf_sizes = np.bincount(conf_codes)
+    sorted_codes = conf_codes[order]
+    group_starts = np.concatenate(([0], np.cumsum(conf_sizes)[:-1]))
+    position = np.empty(n, dtype=np.int64)
+    position[order] = np.arange(n) - group_starts[sorted_codes]
+
+    standing_index = 1.0 - (position.astype(float) / conf_sizes[conf_codes].astype(float))
+    # Membership, not the mapped value: string columns map a missing key to NaN, not None.
+    has_conf = out["conference"].isin(list(conference_index)).to_numpy(dtype=bool)
+    conf_index = out["conference"].map(conference_index).where(has_conf, 0.0).to_numpy(dtype=float)
+
+    out["standing_index"] = standing_index
+    out["conf_position"] = position
+    out["conf_index"] = conf_index
+    out["overall_index"] = np.where(has_conf, conf_index * standing_index, 0.0)
+    return out
+
+
+def sor_components(team_table: pd.DataFrame, game_table: pd.DataFrame) -> pd.DataFrame:
+    """Add ``SOR_raw`` and ``SOR_adj`` with a scatter-add over opponent ``overall_index``."""
+    out = team_table.copy()
+    n = len(out)
+    overall_index = out["overall_index"].to_numpy(dtype=float)
+    team_idx = game_table["team_idx"].to_numpy(dtype=np.int64)
+    opp_idx = game_table["opp_idx"].to_numpy(dtype=np.int64)
+    win = game_table["win"].to_numpy(dtype=bool)
+
+    opp_cc = np.zeros(len(opp_idx))
+    known = opp_idx >= 0
+    opp_cc[known] = overall_index[opp_idx[known]]
+
+    # ufunc.at accumulates in row order, so each team's sums match SOR_calc exactly.
+    win_sum = np.zeros(n)
+    np.add.at(win_sum, team_idx[win], opp_cc[win])
+    loss_sum = np.zeros(n)
+    np.add.at(loss_sum, team_idx[~win], opp_cc[~win] - 1.0)
+
+    SOR_raw = win_sum + loss_sum
+    out["SOR_raw"] = SOR_raw
+    out["SOR_adj"] = _scaled_by_max(SOR_raw)
+    return out
+
+
+def spi_components(team_table: pd.DataFrame) -> pd.DataFrame:
+    """Add the ``SPI`` column."""
+    out = team_table.copy()
+    SOR_adj = out["SOR_adj"].to_numpy(dtype=float)
+    N_adj = out["N_adj"].to_numpy(dtype=float)
+    out["SPI"] = 100.0 * (SOR_WEIGHT * SOR_adj + N_WEIGHT * N_adj)
+    return out
+
+
+def compute_spi_rankings(
+    team_table: pd.DataFrame,
+    game_table: pd.DataFrame,
+    conference_index: Dict[str, float],
+) -> pd.DataFrame:
+    """Run every stage and return the team table sorted by SPI with a ``rank`` column."""
+    table = team_table.reset_index(drop=True)
+    table = nature_components(table)
+    table = standing_components(table, conference_index)
+    table = sor_components(table, game_table)
+    table = spi_components(table)
+
+    ranked = table.iloc[ranking_order(table["SPI"])].reset_index(drop=True)
+    ranked.insert(0, "rank", np.arange(1, len(ranked) + 1))
+    return ranked
@@ -0,0 +1,204 @@
+"""One team identity for every pipeline.
+
+``team_key`` is the single normalization rule for team names: accents
+folded to ASCII, lower case, ``&`` read as ``and``, and only letters and
+digits kept. So "Texas A&M" and "Texas A and M" share a key, as do
+"San José State" and "San Jose State".
+
+``TeamIndex`` gives every key a stable integer id and caches each raw
+spelling it has seen. Joins between SPI files and CFBD games then compare
+ints. The index is persisted to ``data_exports/cache/team_index.json``
+(rebuild it with ``python team_identity.py``), so ids stay the same
+across runs and processes.
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from cfbd_store import BASE_DIR, STORE_DIR
+
+TEAM_INDEX_FILE = os.path.join(BASE_DIR, "data_exports", "cache", "team_index.json")
+TEAM_INDEX_VERSION = 1
+UNKNOWN_TEAM_ID = -1
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def team_key(name) -> str:
+    """Canonical spelling key for a team name; ``""`` for blanks and missing values."""
+    if name is None or (isinstance(name, float) and math.isnan(name)):
+        return ""
+    text = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode("ascii")
+    text = text.lower().replace("&", " and ")
+    return _NON_ALNUM.sub("", text)
+
+
+class TeamIndex:
+    """Stable integer ids for team keys, with a per-spelling lookup cache."""
+
+    def __init__(self, keys: Optional[List[str]] = None, spellings: Optional[Dict[str, int]] = None):
+        self._keys: List[str] = list(keys or [])
+        self._ids: Dict[str, int] = {key: i for i, key in enumerate(self._keys)}
+        self._spellings: Dict[str, int] = dict(spellings or {})
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getstate__(self):
+        return {"keys": self._keys, "spellings": self._spellings}
+
+    def __setstate__(self, state):
+        self.__init__(state["keys"], state["spellings"])
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def team_id(self, name) -> int:
+        """Id for a raw spelling, adding the team if it has not been seen before."""
+        if isinstance(name, str):
+            cached = self._spellings.get(name)
+            if cached is not None:
+                return cached
+        key = team_key(name)
+        if not key:
+            return UNKNOWN_TEAM_ID
+        with self._lock:
+            team_id = self._ids.get(key)
+            if team_id is None:
+                team_id = len(self._keys)
+                self._keys.append(key)
+                self._ids[key] = team_id
+            if isinstance(name, str):
+                self._spellings[name] = team_id
+        return team_id
+
+    def lookup(self, name) -> int:
+        """Id for a raw spelling without adding it; ``UNKNOWN_TEAM_ID`` if unseen."""
+        if isinstance(name, str) and name in self._spellings:
+            return self._spellings[name]
+        return self._ids.get(team_key(name), UNKNOWN_TEAM_ID)
+
+    def team_ids(self, names: Iterable) -> np.ndarray:
+        """Ids for a column of names, normalizing each distinct spelling once."""
+        names = list(names)
+        distinct = {}
+        for name in names:
+            if name not in distinct:
+                distinct[name] = self.team_id(name)
+        return np.fromiter((distinct[name] for name in names), dtype=np.int64, count=len(names))
+
+    def key(self, team_id: int) -> str:
+        return self._keys[team_id] if 0 <= team_id < len(self._keys) else ""
+
+    def save(self, path: str = TEAM_INDEX_FILE) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            payload = {
+                "version": TEAM_INDEX_VERSION,
+                "teams": list(self._keys),
+                "spellings": dict(sorted(self._spellings.items())),
+            }
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=1)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str = TEAM_INDEX_FILE) -> "TeamIndex":
+        """The saved index, or an empty one if the file is missing or unreadable."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") != TEAM_INDEX_VERSION:
+                return cls()
+            return cls(payload["teams"], {k: int(v) for k, v in payload["spellings"].items()})
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return cls()
+
+
+_DEFAULT_INDEX: Optional[TeamIndex] = None
+_DEFAULT_INDEX_LOCK = threading.Lock()
+
+
+def default_team_index() -> TeamIndex:
+    global _DEFAULT_INDEX
+    with _DEFAULT_INDEX_LOCK:
+        if _DEFAULT_INDEX is None:
+            _DEFAULT_INDEX = TeamIndex.load()
+        return _DEFAULT_INDEX
+
+
+def set_default_team_index(index: TeamIndex) -> None:
+    """Share one index across processes, e.g. from a worker pool initializer."""
+    global _DEFAULT_INDEX
+    with _DEFAULT_INDEX_LOCK:
+        _DEFAULT_INDEX = index
+
+
+def _ranking_file_names(path: str) -> List[str]:
+    import pandas as pd
+
+    try:
+        df = pd.read_csv(path)
+    except (OSError, ValueError):
+        return []
+    columns = {str(c).strip().lower(): c for c in df.columns}
+    column = columns.get("team") or columns.get("team name") or columns.get("school")
+    return df[column].dropna().astype(str).tolist() if column is not None else []
+
+
+def _stored_names(store_dir: str) -> List[str]:
+    names = []
+    for folder, fields in (("teams_fbs", ("school",)), ("games", ("homeTeam", "awayTeam"))):
+        for path in sorted(glob.glob(os.path.join(store_dir, folder, "*.json"))):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    records = json.load(f).get("records") or []
+            except (OSError, ValueError, AttributeError):
+                continue
+            for record in records:
+                names.extend(str(record[field]) for field in fields if record.get(field))
+    return names
+
+
+def build_team_index(data_exports_dir: str, store_dir: str = STORE_DIR) -> TeamIndex:
+    """Index every team spelling in the SPI files and stored CFBD teams/games, keeping existing ids."""
+    index = TeamIndex.load()
+    for path in sorted(glob.glob(os.path.join(data_exports_dir, "**", "spi_rankings*.csv"), recursive=True)):
+        for name in _ranking_file_names(path):
+            index.team_id(name)
+    for name in _stored_names(store_dir):
+        index.team_id(name)
+    return index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the shared team identity index.")
+    parser.add_argument("--data-exports-dir", default=os.path.join(BASE_DIR, "data_exports"))
+    parser.add_argument("--store-dir", default=STORE_DIR)
+    args = parser.parse_args()
+
+    index = build_team_index(args.data_exports_dir, args.store_dir)
+    index.save()
+    print(f"Saved {len(index)} teams to {TEAM_INDEX_FILE}")
+
+
+if __name__ == "__main__":
+    main()
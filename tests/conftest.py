@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import team_identity  # noqa: E402
+
+
+@pytest.fixture
+def team_index():
+    """A fresh, empty default team index, restored after the test."""
+    previous = team_identity._DEFAULT_INDEX
+    index = team_identity.TeamIndex()
+    team_identity.set_default_team_index(index)
+    yield index
+    team_identity.set_default_team_index(previous)
@@ -0,0 +1,48 @@
+import predict_winners_from_spi_history as backtest
+
+
+class StaticGames:
+    def __init__(self, games):
+        self.games = games
+
+    def week_games(self, year, week, season_type):
+        return self.games
+
+
+def fbs_game(game_id, home, away, home_points=21, away_points=14):
+    return {
+        "id": game_id,
+        "week": 1,
+        "start_date": "2023-09-02T16:00:00.000Z",
+        "home_team": home,
+        "away_team": away,
+        "home_conference": "SEC",
+        "away_conference": "SEC",
+        "home_classification": "fbs",
+        "away_classification": "fbs",
+        "home_points": home_points,
+        "away_points": away_points,
+        "neutral_site": False,
+        "conference_game": True,
+        "notes": None,
+    }
+
+
+def test_game_without_spi_is_not_scored(team_index):
+    ranking_map = {team_index.team_id("Alpha"): 0.6, team_index.team_id("Beta"): 0.4}
+    ranking = backtest.WeekRanking(
+        backtest.RankingSource("spi_rankings_2023_preseason.csv", "preseason"),
+        "spi_rankings_2023_preseason.csv",
+        len(ranking_map),
+        ranking_map,
+    )
+    games = StaticGames([fbs_game(1, "Alpha", "Beta"), fbs_game(2, "Gamma", "Delta")])
+
+    columns = backtest.evaluate_week(games, ranking, 2023, "regular", 1, home_field_x=0.0)
+
+    assert columns["prediction_reason"] == ["higher_spi_home_field_adjusted", "no_spi_available"]
+    assert columns["predicted_winner"] == ["Alpha", None]
+    assert columns["predicted_winner_pure"] == ["Alpha", None]
+    assert columns["correct"] == [1, None]
+    assert columns["correct_pure"] == [1, None]
+    assert columns["correct_home_adj"] == [1, None]
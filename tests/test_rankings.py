@@ -0,0 +1,173 @@
+import glob
+import importlib
+import os
+import random
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+CONFERENCES = ["SEC", "Big Ten", "ACC", "Big 12", "Mountain West", "Sun Belt", "FBS Independents"]
+STAT_NAMES = [
+    "passingTDs",
+    "rushingTDs",
+    "interceptions",
+    "fumblesRecovered",
+    "passesIntercepted",
+    "fumblesLost",
+    "firstDowns",
+    "interceptionTDs",
+    "puntReturnTDs",
+    "kickReturnTDs",
+]
+
+
+class FakeCfbd:
+    """Seeded two-season CFBD world serving the calls rankings.py makes."""
+
+    def __init__(self, years=(2024, 2025), team_count=28, seed=7):
+        rnd = random.Random(seed)
+        self.teams = {}
+        self.games = {}
+        self.stats = {}
+        for year in years:
+            teams = [
+                SimpleNamespace(id=i, school=f"Team {i}", conference=CONFERENCES[i % len(CONFERENCES)])
+                for i in range(team_count)
+            ]
+            games = []
+            game_id = year * 10000
+            for week in range(1, 14):
+                order = list(range(team_count))
+                rnd.shuffle(order)
+                for a, b in zip(order[::2], order[1::2]):
+                    game_id += 1
+                    home, away = teams[a], teams[b]
+                    games.append(
+                        SimpleNamespace(
+                            id=game_id,
+                            week=week,
+                            season_type="regular",
+                            home_team=home.school,
+                            away_team=away.school,
+                            home_conference=home.conference,
+                            away_conference=away.conference,
+                            home_points=rnd.randint(0, 50),
+                            away_points=rnd.randint(0, 50),
+                            completed=True,
+                            notes=None,
+                            neutral_site=False,
+                            home_classification="fbs",
+                            away_classification="fbs",
+                            conference_game=home.conference == away.conference,
+                            start_date=f"{year}-09-{week:02d}T18:00:00",
+                        )
+                    )
+            game_id += 1
+            games.append(
+                SimpleNamespace(
+                    id=game_id,
+                    week=14,
+                    season_type="regular",
+                    home_team="Team 0",
+                    away_team="Team 7",
+                    home_conference="SEC",
+                    away_conference="SEC",
+                    home_points=24,
+                    away_points=21,
+                    completed=True,
+                    notes="SEC Championship",
+                    neutral_site=True,
+                    home_classification="fbs",
+                    away_classification="fbs",
+                    conference_game=True,
+                    start_date=f"{year}-12-05T18:00:00",
+                )
+            )
+            self.teams[year] = teams
+            self.games[year] = games
+            self.stats[year] = {
+                team.school: {name: float(rnd.randint(0, 30)) for name in STAT_NAMES} for team in teams
+            }
+
+    def get_games(self, year=None, week=None, season_type=None, team=None, classification=None):
+        season_type = getattr(season_type, "value", season_type) or "regular"
+        return [
+            g
+            for g in self.games.get(year, [])
+            if season_type in ("both", g.season_type)
+            and (week is None or g.week == week)
+            and (team is None or team in (g.home_team, g.away_team))
+        ]
+
+    def get_fbs_teams(self, year=None):
+        return list(self.teams[year])
+
+    def get_team_stats(self, year=None, team=None, conference=None, start_week=None, end_week=None, classification=None):
+        return [
+            SimpleNamespace(team=school, conference=None, stat_name=name, stat_value=value)
+            for school, stats in self.stats[year].items()
+            if team is None or school == team
+            for name, value in stats.items()
+        ]
+
+    def get_conferences(self):
+        return [SimpleNamespace(name=name, classification="fbs") for name in CONFERENCES]
+
+
+def run_rankings(workdir, monkeypatch, *argv, api=None):
+    """One ``rankings.py`` run in ``workdir`` with fresh module state."""
+    monkeypatch.chdir(workdir)
+    import cfbd_store
+    import rankings
+
+    monkeypatch.setattr(
+        cfbd_store, "_DEFAULT_STORE", cfbd_store.ResponseStore(str(workdir / "data_exports" / "cache" / "cfbd"))
+    )
+
+    rankings = importlib.reload(rankings)
+    if api is not None:
+        rankings.set_api_clients(games=api, teams=api, stats=api, conferences=api)
+    monkeypatch.setattr("sys.argv", ["rankings.py", *argv])
+    rankings.main()
+
+
+def archived_responses(archive):
+    return sorted(
+        os.path.relpath(path, archive) for path in glob.glob(os.path.join(archive, "**", "*.json"), recursive=True)
+    )
+
+
+def test_response_store_is_shared_from_any_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    import cfbd_store
+    import rankings
+
+    monkeypatch.setattr(cfbd_store, "_DEFAULT_STORE", None)
+    rankings = importlib.reload(rankings)
+
+    assert rankings.response_store is cfbd_store.default_store()
+    assert rankings.response_store.root == cfbd_store.STORE_DIR
+
+
+@pytest.mark.parametrize("second_run", [[], ["--incremental"]])
+def test_second_recording_replays_in_an_empty_directory(tmp_path, monkeypatch, second_run):
+    args = ["--year", "2025", "--date", "2025-12-20", "--start_week", "1", "--end_week", "14"]
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    api = FakeCfbd()
+
+    run_rankings(workdir, monkeypatch, *args, "--record", str(tmp_path / "first"), api=api)
+    # The first run leaves saved conference tallies and incremental state behind.
+    assert glob.glob(str(workdir / "data_exports" / "cache" / "conference_tallies_*.json"))
+    assert glob.glob(str(workdir / "data_exports" / "cache" / "ranking_state_*.json"))
+
+    run_rankings(workdir, monkeypatch, *args, *second_run, "--record", str(tmp_path / "second"), api=api)
+    assert archived_responses(tmp_path / "second") == archived_responses(tmp_path / "first")
+
+    replay_dir = tmp_path / "replay"
+    replay_dir.mkdir()
+    run_rankings(replay_dir, monkeypatch, *args, "--replay", str(tmp_path / "second"))
+
+    spi_name = os.path.join("data_exports", "spi_rankings_2025_w1-14.csv")
+    pd.testing.assert_frame_equal(pd.read_csv(replay_dir / spi_name), pd.read_csv(workdir / spi_name))
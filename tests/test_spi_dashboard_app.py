@@ -0,0 +1,211 @@
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+import spi_dashboard_app
+
+
+@pytest.fixture
+def refresher(monkeypatch):
+    """A refresher whose refresh pass only records that it ran."""
+    ran = threading.Event()
+    instance = spi_dashboard_app.BackgroundRefresher(tick_seconds=3600)
+    monkeypatch.setattr(instance, "refresh_due", ran.set)
+    instance.ran = ran
+    yield instance
+    instance.stop()
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, team_index):
+    """Test client over two weeks of pending games for four teams, with empty current caches."""
+    ranking_file = tmp_path / "spi_rankings_2025_w1-10.csv"
+    ranking_file.write_text("team,spi\n")
+    teams = ["Alpha", "Bravo", "Charlie", "Delta"]
+    rows = [
+        {
+            "week": week,
+            "home_team": home,
+            "away_team": away,
+            "predicted_winner": home,
+            "home_win_prob_pct": 60.0,
+            "away_win_prob_pct": 40.0,
+        }
+        for week in (11, 12)
+        for home, away in zip(teams[::2], teams[1::2])
+    ]
+    monkeypatch.setattr(spi_dashboard_app, "current_rankings_file", lambda: str(ranking_file))
+    monkeypatch.setattr(spi_dashboard_app, "_rankings_unavailable", lambda ranking_file: None)
+    monkeypatch.setattr(spi_dashboard_app, "future_matchups_all_pending", lambda ranking_file: (rows, "file:test"))
+    # Keep the first request from warming up against the real data_exports.
+    monkeypatch.setitem(spi_dashboard_app._WARM_UP_STATE, "state", "ready")
+    caches = (
+        spi_dashboard_app._CURRENT_PAYLOAD_CACHE_MEM,
+        spi_dashboard_app._FUTURE_PAGE_CACHE_MEM,
+        spi_dashboard_app._FUTURE_MATCHUPS_MEM,
+    )
+    for cache in caches:
+        cache.clear()
+    yield spi_dashboard_app.app.test_client()
+    for cache in caches:
+        cache.clear()
+
+
+def test_track_starts_the_refresher(refresher):
+    assert not refresher.is_running()
+
+    refresher.track(2025)
+
+    assert refresher.is_running()
+    assert refresher.ran.wait(5)
+
+
+def test_track_does_not_start_the_refresher_without_autostart(refresher):
+    refresher.autostart = False
+
+    refresher.track(2025)
+
+    assert not refresher.is_running()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_starts_its_own_refresher(refresher):
+    refresher.track(2025)
+    assert refresher.is_running()
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        status = b"inherited" if refresher.is_running() else b""
+        refresher.ran.clear()
+        refresher.track(2026)
+        if refresher.is_running() and refresher.ran.wait(5):
+            status += b"started"
+        os.write(write_fd, status)
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as f:
+        status = f.read()
+    os.waitpid(pid, 0)
+    assert status == b"started"
+
+
+def test_first_request_starts_warm_up(monkeypatch):
+    warmed = threading.Event()
+
+    def warm_up():
+        spi_dashboard_app._WARM_UP_STATE["state"] = "ready"
+        warmed.set()
+
+    monkeypatch.setattr(spi_dashboard_app, "warm_up", warm_up)
+    monkeypatch.setitem(spi_dashboard_app._WARM_UP_STATE, "state", "pending")
+    client = spi_dashboard_app.app.test_client()
+
+    client.get("/api/ready")
+
+    assert warmed.wait(5)
+    res = client.get("/api/ready")
+    assert res.status_code == 200
+    assert res.get_json()["ready"] is True
+
+
+def test_future_filters_by_team(client):
+    current = client.get("/api/current/future?team=Alpha").get_json()["current"]
+
+    assert [row["away_team"] for row in current["future_matchups"]] == ["Bravo", "Bravo"]
+    assert current["team_summary"]["games"] == 2
+    assert current["team_summary"]["projected_wins"] == 2
+
+
+@pytest.mark.parametrize("query", ["team=Nowhere", "week=eleven"])
+def test_future_rejects_unknown_filters(client, query):
+    res = client.get(f"/api/current/future?{query}")
+
+    assert res.status_code == 400
+    assert res.get_json()["ok"] is False
+
+
+def test_future_pages_do_not_evict_other_current_resources(client):
+    spi_dashboard_app._current_entry(("rankings",), lambda: ({"rankings": []}, None))
+
+    for page in range(1, 2 * spi_dashboard_app.CURRENT_PAYLOAD_CACHE_SIZE):
+        for team in ("", "Alpha", "Delta"):
+            assert client.get(f"/api/current/future?team={team}&page={page}").status_code == 200
+
+    assert ("rankings",) in spi_dashboard_app._CURRENT_PAYLOAD_CACHE_MEM
+    assert len(spi_dashboard_app._FUTURE_PAGE_CACHE_MEM) == spi_dashboard_app.FUTURE_PAGE_CACHE_SIZE
+
+
+def ranking_table(teams):
+    """Rank table for ``(team, conference)`` pairs in rank order."""
+    return pd.DataFrame(
+        [
+            {"team": team, "conference": conference, "wins": 10, "losses": 2, "rank": rank, "spi": 100.0 - rank}
+            for rank, (team, conference) in enumerate(teams, start=1)
+        ]
+    )
+
+
+@pytest.fixture
+def notre_dame_tenth():
+    # SEC teams hold most of the top 11, so the other champions take auto bids from
+    # below Notre Dame and the at-large spots run out before rank 10.
+    teams = [(f"SEC {i}", "SEC") for i in range(1, 10)]
+    teams += [("Notre Dame", ""), ("SEC 10", "SEC"), ("SEC 11", "SEC")]
+    teams += [("ACC 1", "ACC"), ("Big 12 1", "Big 12"), ("Big Ten 1", "Big Ten"), ("Sun Belt 1", "Sun Belt")]
+    return ranking_table(teams)
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        spi_dashboard_app.projected_twelve_team_field,
+        lambda rank_df: spi_dashboard_app.projected_twelve_team_field_with_mode(rank_df, pd.DataFrame())[0],
+    ],
+)
+def test_top_twelve_notre_dame_gets_an_auto_bid(team_index, notre_dame_tenth, build):
+    field = build(notre_dame_tenth)
+
+    assert len(field) == 12
+    notre_dame = field[field["team"] == "Notre Dame"]
+    assert notre_dame["bid_type"].tolist() == ["auto_notre_dame"]
+
+
+def test_standings_champion_matches_team_spelling_variants(team_index):
+    rank_df = ranking_table([("Georgia", "SEC"), ("Texas A&M", "SEC"), ("Clemson", "ACC")])
+    standings = pd.DataFrame(
+        [
+            {"team": "Georgia", "conference": "SEC", "conf_wins": 6, "conf_losses": 2, "overall_index": 0.0},
+            {"team": "Texas A and M", "conference": "SEC", "conf_wins": 8, "conf_losses": 0, "overall_index": 0.0},
+        ]
+    )
+    standings["conf_win_pct"] = standings["conf_wins"] / (standings["conf_wins"] + standings["conf_losses"])
+
+    field, info = spi_dashboard_app.projected_twelve_team_field_with_mode(rank_df, standings, "standings")
+
+    assert info["champ_mode_used"] == "standings"
+    sec_champion = field[field["auto_source"] == "sec"]
+    assert sec_champion["team"].tolist() == ["Texas A&M"]
+
+
+def test_compressed_responses_carry_their_own_etag():
+    encoded = spi_dashboard_app.EncodedJson({"rows": list(range(1000))})
+
+    def respond(**headers):
+        with spi_dashboard_app.app.test_request_context(headers=headers):
+            return spi_dashboard_app.json_response(encoded)
+
+    plain = respond()
+    gzipped = respond(**{"Accept-Encoding": "gzip"})
+
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.get_etag() == (f"{encoded.etag}-gzip", False)
+    assert plain.get_etag() == (encoded.etag, False)
+    # The body is the same under either coding, so either validator is current.
+    assert respond(**{"Accept-Encoding": "gzip", "If-None-Match": f'"{encoded.etag}"'}).status_code == 304
+    assert respond(**{"If-None-Match": f'"{encoded.etag}-gzip"'}).status_code == 304
+    assert respond(**{"If-None-Match": '"stale"'}).status_code == 200
@@ -0,0 +1,158 @@
+from operator import attrgetter
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+import rankings
+import spi_engine
+
+CONFERENCE_INDEX = {"sec": 1.0, "acc": 0.5}
+
+# (team, conference, conf_champ, conf_wins, conf_losses, points, points_allowed, TD, TM)
+TEAMS = [
+    ("Georgia", "sec", True, 3, 0, 140, 60, 18, 4),
+    ("Alabama", "sec", False, 2, 1, 120, 70, 15, 2),
+    ("Auburn", "sec", False, 0, 3, 60, 115, 7, -3),
+    ("Clemson", "acc", True, 2, 0, 110, 50, 14, 1),
+    ("Miami", "acc", False, 1, 1, 90, 90, 11, 0),
+    ("Duke", "acc", False, 0, 2, 0, 80, 0, -2),
+    # Same stats and schedule outside the indexed conferences: an exact SPI tie.
+    ("Tie B", "independent", False, 0, 0, 70, 40, 9, 1),
+    ("Tie A", "independent", False, 0, 0, 70, 40, 9, 1),
+]
+
+# (winner, loser); opponents outside the table count as a zero overall index.
+GAMES = [
+    ("Georgia", "Alabama"),
+    ("Georgia", "Auburn"),
+    ("Alabama", "Auburn"),
+    ("Georgia", "Clemson"),
+    ("Clemson", "Miami"),
+    ("Clemson", "Duke"),
+    ("Miami", "Duke"),
+    ("Alabama", "Miami"),
+    ("Tie B", "Auburn"),
+    ("Tie A", "Auburn"),
+    ("Miami", "Tie B"),
+    ("Miami", "Tie A"),
+    ("Duke", "Idaho"),
+]
+
+
+def team_records():
+    records = {
+        name: SimpleNamespace(win_opponents=[], loss_opponents=[]) for name, *_ in TEAMS
+    }
+    for winner, loser in GAMES:
+        if winner in records:
+            records[winner].win_opponents.append(loser)
+        if loser in records:
+            records[loser].loss_opponents.append(winner)
+    return records
+
+
+def engine_rankings():
+    records = team_records()
+    team_table = pd.DataFrame(
+        [
+            {
+                "team": name,
+                "conference": conference,
+                "conf_champ": conf_champ,
+                "games": float(len(records[name].win_opponents) + len(records[name].loss_opponents)),
+                "wins": float(len(records[name].win_opponents)),
+                "losses": float(len(records[name].loss_opponents)),
+                "conf_wins": float(conf_wins),
+                "conf_losses": float(conf_losses),
+                "points": float(points),
+                "points_allowed": float(points_allowed),
+                "TD": float(td),
+                "TM": float(tm),
+            }
+            for name, conference, conf_champ, conf_wins, conf_losses, points, points_allowed, td, tm in TEAMS
+        ],
+        columns=spi_engine.TEAM_TABLE_COLUMNS,
+    )
+    game_table = spi_engine.build_game_table(records)
+    return spi_engine.compute_spi_rankings(team_table, game_table, CONFERENCE_INDEX)
+
+
+def legacy_rankings():
+    """The per-team ``My_Team`` pipeline rankings.py ran before the engine."""
+    records = team_records()
+    team_objects = {}
+    team_object_list = []
+    for name, conference, conf_champ, conf_wins, conf_losses, points, points_allowed, td, tm in TEAMS:
+        G = float(len(records[name].win_opponents) + len(records[name].loss_opponents))
+        P = float(points)
+        PA = float(points_allowed)
+        A = rankings.ave_margin(G, P, PA)
+        team_obj = rankings.My_Team(
+            name=name,
+            wins=float(len(records[name].win_opponents)),
+            losses=float(len(records[name].loss_opponents)),
+            conf_wins=float(conf_wins),
+            conf_losses=float(conf_losses),
+            conf_name=conference,
+            conf_champ=conf_champ,
+            N_raw=rankings.Nature(A, float(td), P, PA / 7.0, PA, float(tm), G, 0.0, 0.0),
+            ave_margin=A,
+            points=P,
+        )
+        team_objects.setdefault(conference, []).append(team_obj)
+        team_object_list.append(team_obj)
+    by_name = {obj.name: obj for obj in team_object_list}
+
+    N_raw_max = np.amax([obj.N_raw for obj in team_object_list])
+    for obj in team_object_list:
+        obj.N_adj = obj.N_raw / N_raw_max
+
+    for conference, conf_team_list in team_objects.items():
+        conf_sorted_teams = rankings.multisort(
+            conf_team_list,
+            (
+                ("conf_champ", True),
+                ("conf_wins", True),
+                ("conf_losses", False),
+                ("ave_margin", True),
+                ("points", True),
+            ),
+        )
+        for index, obj in enumerate(conf_sorted_teams):
+            obj.standing_index = 1.0 - (float(index) / float(len(conf_sorted_teams)))
+            if conference in CONFERENCE_INDEX:
+                obj.overall_index = CONFERENCE_INDEX[conference] * obj.standing_index
+            else:
+                obj.overall_index = 0.0
+
+    for obj in team_object_list:
+        record = records[obj.name]
+        WCC = [by_name[opp].overall_index if opp in by_name else 0.0 for opp in record.win_opponents]
+        LCC = [by_name[opp].overall_index if opp in by_name else 0.0 for opp in record.loss_opponents]
+        obj.SOR_raw = rankings.SOR_calc(WCC, LCC)
+    SOR_raw_max = np.amax([obj.SOR_raw for obj in team_object_list])
+    for obj in team_object_list:
+        obj.SOR_adj = obj.SOR_raw / SOR_raw_max
+        obj.SPI = rankings.SPI_calc(obj.SOR_adj, obj.N_adj)
+
+    return sorted(team_object_list, key=attrgetter("SPI"), reverse=True)
+
+
+def test_engine_matches_legacy_pipeline():
+    ranked = engine_rankings()
+    legacy = legacy_rankings()
+
+    assert ranked["team"].tolist() == [obj.name for obj in legacy]
+    assert ranked["rank"].tolist() == list(range(1, len(TEAMS) + 1))
+    for column in ("N_raw", "N_adj", "standing_index", "overall_index", "SOR_raw", "SOR_adj", "SPI"):
+        # Exact equality: the engine must reproduce the scalar arithmetic bit for bit.
+        assert ranked[column].tolist() == [getattr(obj, column) for obj in legacy], column
+
+
+def test_tied_teams_keep_table_order():
+    ranked = engine_rankings().set_index("team")
+
+    assert ranked.loc["Tie B", "SPI"] == ranked.loc["Tie A", "SPI"]
+    assert ranked.loc["Tie B", "rank"] + 1 == ranked.loc["Tie A", "rank"]
+